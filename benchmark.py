@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import build
+
+FIRST_NAMES = ["Alexander", "Jonas", "Maksym", "Ana", "Li", "Jean-Luc", "Zoë", "Ravi"]
+LAST_NAMES = ["Panfilov", "Geiping", "Andriushchenko", "van der Berg", "Müller", "Smith, Jr.", "de la Cruz"]
+VENUES = ["ICML 2025", "ICLR 2026", "NeurIPS 2024", "Preprint", "TMLR", "ACL 2025 Workshop"]
+WORDS = [
+    "adversarial", "robustness", "jailbreak", "language", "models", "safety", "scaling",
+    "monitoring", "100%", "R&D", "red_teaming", "~approximate", '"quoted"', "{LLM}", "attacks",
+]
+BUILD_SIZES = (100, 1000, 10000, 50000)
+
+
+def synthetic_author(rng: random.Random) -> str:
+    last = rng.choice(LAST_NAMES)
+    first = rng.choice(FIRST_NAMES)
+    if ", " in last:
+        last, lineage = last.split(", ")
+        return f"{last}, {lineage}, {first}"
+    return f"{first} {last}"
+
+
+def synthetic_bib(count: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    entries = []
+    for index in range(count):
+        authors = " and ".join(synthetic_author(rng) for _ in range(rng.randint(1, 8)))
+        title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 12)))
+        abstract = " ".join(rng.choice(WORDS) for _ in range(rng.randint(40, 120)))
+        fields = [
+            f"title = {{{title.capitalize()}}}",
+            f"author = {{{authors}}}",
+            f"booktitle = {{{rng.choice(VENUES)}}}",
+            f"year = {{{rng.randint(2015, 2026)}}}",
+            f"url = {{https://arxiv.org/abs/{2400 + index % 100}.{index:05d}}}",
+        ]
+        if rng.random() < 0.5:
+            fields.append(f"code = {{https://github.com/example/repo{index}}}")
+        if rng.random() < 0.3:
+            fields.append("presentation = {Oral}")
+        fields.append(f"img = {{assets/img/publications/synthetic{index}.png}}")
+        if rng.random() < 0.8:
+            fields.append(f"abstract = {{{abstract}}}")
+        body = ",\n  ".join(fields)
+        entries.append(f"@inproceedings{{synthetic{index},\n  {body}\n}}\n")
+    return "\n".join(entries)
+
+
+def synthetic_news(count: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    items = []
+    for index in range(count):
+        words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(10, 40))).replace("&", "&amp;")
+        venue = rng.choice(VENUES)
+        items.append({
+            "date": f"{rng.randint(2015, 2026)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "text": f'{words.capitalize()} at <span class="highlight highlight-event">{venue}</span>, '
+                    f'see <a href="https://example.org/news/{index}" target="_blank">here</a>.',
+        })
+    return json.dumps(items, indent=4, ensure_ascii=False)
+
+
+def legacy_bibtex(entry_key: str, entry) -> str:
+    from pybtex.database import BibliographyData
+
+    bibliograpy = BibliographyData(entries={entry_key: entry})
+    bibtex_raw = bibliograpy.to_string("bibtex").strip()
+    cleaned_lines = []
+    for line in bibtex_raw.splitlines():
+        stripped = line.strip()
+        if any(stripped.startswith(f"{field} =") for field in build.BIBTEX_EXCLUDED_FIELDS):
+            continue
+        cleaned_lines.append(line)
+    return "\n".join(cleaned_lines).strip()
+
+
+def bench_bibtex(count: int) -> None:
+    from pybtex.database.input import bibtex
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "publication_list.bib"
+        path.write_text(synthetic_bib(count), encoding="utf-8")
+        entries = bibtex.Parser().parse_file(str(path)).entries
+
+    start = time.perf_counter()
+    legacy = {key: legacy_bibtex(key, entry) for key, entry in entries.items()}
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    native = build.serialize_bibtex(entries)
+    native_time = time.perf_counter() - start
+
+    mismatches = [key for key in entries if legacy[key] != native[key]]
+    print(f"BibTeX export, {count} entries")
+    print(f"  BibliographyData round-trip: {legacy_time:.3f}s ({legacy_time / count * 1e6:.1f} us/entry)")
+    print(f"  serialize_bibtex:            {native_time:.3f}s ({native_time / count * 1e6:.1f} us/entry)")
+    print(f"  speedup: {legacy_time / native_time:.1f}x, mismatching entries: {len(mismatches)}")
+    if mismatches:
+        raise SystemExit(f"Output differs for {mismatches[:5]}")
+
+
+def output_size(root: Path) -> int:
+    files = [root / "index.html", *(root / "news").rglob("*")]
+    return sum(path.stat().st_size for path in files if path.is_file())
+
+
+def timed_build(root: Path, *args: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, str(root / "build.py"), *args],
+        cwd=root,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def bench_build_size(count: int) -> Dict[str, object]:
+    """Cold, warm and one-news-item builds of a synthetic site in a scratch copy of build.py."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        shutil.copy(Path(build.__file__), root / "build.py")
+        shutil.copy(build.ROOT / build.PROFILE_FILE, root / build.PROFILE_FILE)
+        (root / "publication_list.bib").write_text(synthetic_bib(count), encoding="utf-8")
+        news = root / "news.json"
+        news.write_text(synthetic_news(count), encoding="utf-8")
+        cold = timed_build(root)
+        warm = timed_build(root)
+        items = json.loads(news.read_text(encoding="utf-8"))
+        items.append({"date": "2026-12-31", "text": "One more synthetic item."})
+        news.write_text(json.dumps(items, indent=4, ensure_ascii=False), encoding="utf-8")
+        incremental = timed_build(root)
+        # Not profile.json: that is the site config the build reads.
+        timed_build(root, "--profile", "profile-report.json")
+        profile = json.loads((root / "profile-report.json").read_text(encoding="utf-8"))
+        return {
+            "entries": count,
+            "cold_seconds": cold,
+            "warm_seconds": warm,
+            "incremental_seconds": incremental,
+            "output_bytes": output_size(root),
+            "page_bytes": (root / "index.html").stat().st_size,
+            "peak_bytes": profile["peak_bytes"],
+            "stages": {stage["stage"]: stage["seconds"] for stage in profile["stages"]},
+        }
+
+
+def compare_results(results: List[Dict[str, object]], baseline: Path, tolerance: float) -> List[str]:
+    previous = {row["entries"]: row for row in json.loads(baseline.read_text(encoding="utf-8"))}
+    regressions = []
+    for row in results:
+        before = previous.get(row["entries"])
+        if before is None:
+            continue
+        for metric in ("cold_seconds", "warm_seconds", "incremental_seconds", "output_bytes"):
+            if row[metric] > before[metric] * (1 + tolerance):
+                regressions.append(f"{row['entries']} entries: {metric} {before[metric]:.3f} -> {row[metric]:.3f}")
+    return regressions
+
+
+def bench_build(sizes: List[int], save: Optional[Path], baseline: Optional[Path], tolerance: float) -> None:
+    results = []
+    print(f"{'entries':>8} {'cold':>9} {'warm':>9} {'incr.':>9} {'page':>10} {'output':>10} {'peak':>9}")
+    for count in sizes:
+        row = bench_build_size(count)
+        results.append(row)
+        print(
+            f"{count:>8} {row['cold_seconds']:>8.2f}s {row['warm_seconds']:>8.2f}s "
+            f"{row['incremental_seconds']:>8.2f}s {row['page_bytes'] / 2**20:>7.2f} MB "
+            f"{row['output_bytes'] / 2**20:>7.2f} MB {row['peak_bytes'] / 2**20:>6.1f} MB"
+        )
+    regressions = compare_results(results, baseline, tolerance) if baseline and baseline.exists() else []
+    if save:
+        save.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    if regressions:
+        raise SystemExit("Regressions against " + str(baseline) + ":\n  " + "\n  ".join(regressions))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmarks for build.py.")
+    parser.add_argument("suite", choices=["bibtex", "build"], help="Benchmark to run.")
+    parser.add_argument("--entries", type=int, default=5000, help="Number of synthetic bib entries.")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(BUILD_SIZES),
+        help="Entry counts for the build suite (bib entries and news items each).",
+    )
+    parser.add_argument("--save", type=Path, help="Write build suite results to this JSON file.")
+    parser.add_argument("--baseline", type=Path, help="Fail if the build suite regresses against this JSON file.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression (default 0.25).")
+    args = parser.parse_args(argv)
+    if args.suite == "bibtex":
+        bench_bibtex(args.entries)
+    elif args.suite == "build":
+        bench_build(args.sizes, args.save, args.baseline, args.tolerance)
+
+
+if __name__ == "__main__":
+    main()
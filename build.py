@@ -1,102 +1,174 @@
 from __future__ import annotations
 
+import argparse
+import asyncio
+import hashlib
+import heapq
+import gzip
+import importlib.util
+import io
 import json
+import os
+import pickle
+import queue
 import re
-from datetime import datetime
-from html import escape
+import shutil
+import ssl
+import string
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from datetime import datetime, timezone
+from html import escape, unescape
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from functools import lru_cache, wraps
 from textwrap import dedent
-from typing import Dict, List, Optional
-
-from pybtex.database import BibliographyData
-from pybtex.database.input import bibtex
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import unquote, urljoin, urlsplit
 
 ROOT = Path(__file__).parent.resolve()
-GOOGLE_ANALYTICS_ID = "G-4SLC5348B5"
-
-PERSON = {
-    "first_name": "Alexander",
-    "last_name": "Panfilov",
-    "tagline": "AI safety, Adversarial ML, & LLM Red-Teaming",
-    "location": "ELLIS Institute / MPI-IS, Tübingen",
-    "email": "kotekjedi@gmail.com",
-    "cv": "assets/pdf/cv.pdf",
-    "photo": "assets/img/profile_mine_new.jpg",
-    "highlight_name": "Alexander Panfilov",
-    "bio": [
-        "Yo! My name is Sasha and I am a third-year ELLIS / IMPRS-IS PhD student in Tuebingen advised by Jonas Geiping and Maksym Andriushchenko.",
-        "I work on AI Safety, particularly on red-teaming LLMs and stuff around them. Roughly four days a week I am an AI doomer.",
-        "I love LLM jailbreaks and red-teaming for misuse, but lately I’m spending more time on red-teaming for AI Control and Automated RnD.",
-        "I will start as intern at Meta Superinteligence Labs in 2026. I am open to collaboration and consider interesting roles in safety or security teams.",
-    ],
-}
+CACHE_DIR = ROOT / ".build_cache"
+FRAGMENT_CACHE_VERSION = 1
+PUBLICATION_SNAPSHOT_VERSION = 1
+IMAGE_CACHE_VERSION = 1
+SLIDE_CACHE_VERSION = 1
+PANEL_DIR = ROOT / "assets" / "panels"
+STRUCTURED_DATA_DIR = ROOT / "assets" / "jsonld"
+STRUCTURED_DATA_MAX_BYTES = 64 * 1024
+FINGERPRINT_DIR = ROOT / "assets" / "dist"
+MANIFEST_PATH = ROOT / "build-manifest.json"
+MANIFEST_VERSION = 1
+SERVICE_WORKER_FILE = "sw.js"
+PRECACHE_MANIFEST_FILE = "precache-manifest.json"
+PRECACHE_MAX_BYTES = 1 << 20
+PRECACHE_HASH_LENGTH = 16
+# Files whose content decides the page; the newest of them is the "Last updated" date.
+BUILD_INPUTS = (
+    "build.py",
+    "profile.json",
+    "publication_list.bib",
+    "talk_list.bib",
+    "news.json",
+    "news.jsonl",
+    "assets/styles.css",
+)
 
-SOCIAL_LINKS = [
-    {
-        "label": "Scholar",
-        "url": "https://scholar.google.com/citations?user=M65_TPEAAAAJ&hl=en",
-        "icon_img": "assets/icons8-google-scholar.svg",
-    },
-    {
-        "label": "Twitter",
-        "url": "https://x.com/kotekjedi_ml",
-        "icon": "fa-brands fa-x-twitter",
-    },
-    {
-        "label": "LinkedIn",
-        "url": "https://www.linkedin.com/in/kotekjedi",
-        "icon": "fab fa-linkedin",
-    },
-    {
-        "label": "GitHub",
-        "url": "https://github.com/kotekjedi",
-        "icon": "fab fa-github",
-    },
-    {
-        "label": "Email",
-        "url": "mailto:kotekjedi@gmail.com",
-        "icon": "fa-solid fa-envelope",
-    },
-]
+# news.jsonl (one item per line) takes precedence, which suits long, append-only histories.
+NEWS_SOURCES = (ROOT / "news.jsonl", ROOT / "news.json")
+NEWS_HOMEPAGE_ITEMS = 10
+NEWS_ARCHIVE_DIR = ROOT / "news"
+FEED_PATH = ROOT / "feed.xml"
+FEED_ITEMS = 20
+FEED_TITLE_LENGTH = 90
+DEPLOY_DIRS = (ROOT / "assets", NEWS_ARCHIVE_DIR)
 
-FOCUS_AREAS = [
-    {
-        "title": "Research Interests",
-        "body": "I am interested in introspection and its implications for AI Control, automated R&amp;D, and white-box alignment methods.",
-    },
-    {
-        "title": "Whereabouts",
-        "body": "Mostly in Tuebingen, occasionaly in London, late 2026 in Bay Area.",
-    },
-    {
-        "title": "Plans",
-        "body": "Planning to attend ICLR 2026 in Brazil. Happy to catch up there!",
-    },
-]
+# --watch: inputs, the loaded data they invalidate and the sections that depend on them. Images,
+# slides and vendor/ are mapped in DevSession.update; anything else under assets/ only reloads.
+WATCH_FILES = ("build.py", "profile.json", "publication_list.bib", "news.json", "news.jsonl", "talk_list.bib")
+WATCH_SECTIONS = {
+    "publication_list.bib": ("head", "publications", "scripts"),
+    "news.json": ("news", "scripts"),
+    "news.jsonl": ("news", "scripts"),
+    "talk_list.bib": ("talks",),
+}
+WATCH_INPUTS = {
+    "publication_list.bib": "publications",
+    "news.json": "news",
+    "news.jsonl": "news",
+    "talk_list.bib": "talks",
+}
+WATCH_INTERVAL = 0.02
 
-ACKNOWLEDGEMENT = dedent(
-    """
-    I am grateful to the many friends and colleagues, from whom I learned so much, for their invaluable guidance
-    and for shaping my research vision. I would like to especially acknowledge
-    <a href="https://www.linkedin.com/in/svyatoslav-oreshin/" target="_blank">Svyatoslav Oreshin</a>,
-    <a href="https://scholar.google.com/citations?user=wcdrgdYAAAAJ&hl=en" target="_blank">Arip Asadualev</a>,
-    <a href="https://scholar.google.de/citations?user=4jdISHwAAAAJ&hl=en" target="_blank">Roland Zimmermann</a>,
-    <a href="https://scholar.google.com/citations?user=aeCiRSYAAAAJ&hl=en" target="_blank">Thaddaeus Wiedemer</a>,
-    <a href="https://scholar.google.com/citations?hl=en&user=jgPzOmgAAAAJ" target="_blank">Jack Brady</a>,
-    <a href="https://scholar.google.com/citations?user=v-JL-hsAAAAJ&hl=en" target="_blank">Wieland Brendel</a>,
-    <a href="https://scholar.google.com/citations?hl=en&user=gzRuY4cAAAAJ" target="_blank">Valentyn Boreiko</a>,
-    <a href="https://scholar.google.com/citations?user=0ZAb3tsAAAAJ&hl=en" target="_blank">Matthias Hein</a>,
-    <a href="https://scholar.google.com/citations?hl=en&user=exaNV-0AAAAJ" target="_blank">Shashwat Goel</a>,
-    <a href="https://scholar.google.com/citations?hl=en&user=e-YbZyEAAAAJ" target="_blank">Illia Shumailov</a>,
-    <a href="https://scholar.google.com/citations?user=ZNtuJYoAAAAJ" target="_blank">Maksym Andriushchenko</a>, and
-    <a href="https://scholar.google.de/citations?user=206vNCEAAAAJ&hl=en" target="_blank">Jonas Geiping</a>.
-    """
-).strip()
+# --profile: module functions whose calls are counted and timed (per entry where the first argument
+# is a publication or news item).
+PROFILED_FUNCTIONS = (
+    "parse_publications",
+    "load_publications",
+    "serialize_bibtex",
+    "format_publication",
+    "format_talk",
+    "render_news_item",
+    "highlight_text",
+    "build_structured_data",
+    "build_structured_data_graph",
+    "build_search_index",
+    "minify_html",
+    "write_atomic",
+)
+PROFILE_SLOWEST_ENTRIES = 20
+LIVE_RELOAD_PATH = "/__livereload"
 
-NAV_LINKS = [
-    {"label": "News", "href": "#news"},
-    {"label": "Research", "href": "#research"},
-]
+# --check-links: results are cached in .build_cache/links.json; failures are retried sooner.
+LINK_CACHE_TTL = 7 * 24 * 3600
+LINK_FAILURE_TTL = 3600
+LINK_CONCURRENCY = 16
+LINK_HOST_CONNECTIONS = 4
+LINK_TIMEOUT = 15.0
+LINK_MAX_REDIRECTS = 5
+LINK_MAX_BODY = 1 << 16
+LINK_USER_AGENT = "Mozilla/5.0 (compatible; build.py link checker)"
+# Sites that refuse automated requests; reported, but they do not fail the check.
+LINK_UNVERIFIABLE_STATUSES = {401, 403, 429, 999}
+LINK_SKIP_RE = re.compile(r"^(?:mailto|tel|javascript|data):", re.IGNORECASE)
+LINK_HINT_RE = re.compile(r"^<link\b[^>]*\brel=\"(?:preconnect|dns-prefetch)\"", re.IGNORECASE)
+BASE_HREF_RE = re.compile(r'<base href="([^"]*)"')
+PAGE_WEIGHT_CATEGORIES = ("html", "css", "js", "images", "fonts", "pdfs", "other")
+PAGE_WEIGHT_SUFFIXES = {
+    ".css": "css",
+    ".js": "js",
+    ".mjs": "js",
+    ".png": "images",
+    ".jpg": "images",
+    ".jpeg": "images",
+    ".gif": "images",
+    ".svg": "images",
+    ".webp": "images",
+    ".avif": "images",
+    ".ico": "images",
+    ".woff": "fonts",
+    ".woff2": "fonts",
+    ".ttf": "fonts",
+    ".otf": "fonts",
+    ".pdf": "pdfs",
+}
+PRELOAD_CATEGORIES = {"style": "css", "script": "js", "font": "fonts", "image": "images"}
+# Defaults for the ``budgets`` of profile.json; ``<category>_kb`` keys are transfer sizes.
+PAGE_WEIGHT_BUDGETS = {
+    "html_kb": 60,
+    "css_kb": 100,
+    "js_kb": 200,
+    "images_kb": 2500,
+    "fonts_kb": 300,
+    "total_kb": 3000,
+    "critical_requests": 6,
+    "duplicate_scripts": 0,
+}
+SCRIPT_RE = re.compile(r"<script\b([^>]*)>(.*?)</script>", re.DOTALL | re.IGNORECASE)
+STYLE_RE = re.compile(r"<style\b[^>]*>(.*?)</style>", re.DOTALL | re.IGNORECASE)
+NOSCRIPT_RE = re.compile(r"<noscript\b.*?</noscript>", re.DOTALL | re.IGNORECASE)
+TAG_ATTR_RE = re.compile(r'([\w-]+)(?:="([^"]*)")?')
+CSS_URL_RE = re.compile(r"url\(\s*['\"]?([^'\")]+?)['\"]?\s*\)")
+BIB_MACRO_RE = re.compile(r"@\s*(?:string|preamble)\s*[{(]", re.IGNORECASE)
+BIB_ENTRY_KEY_RE = re.compile(r"@\s*\w+\s*[{(]\s*([^,\s]+)\s*,")
+# Everything specific to one person lives in profile.json; --batch builds one site per profile.
+PROFILE_FILE = "profile.json"
+PROFILE = json.loads((ROOT / PROFILE_FILE).read_text(encoding="utf-8"))
+SITE_URL = PROFILE["site_url"]
+GOOGLE_ANALYTICS_ID = PROFILE.get("google_analytics_id")
+GOATCOUNTER_URL = PROFILE.get("goatcounter")
+SITE_BRAND = PROFILE["brand"]
+PERSON = PROFILE["person"]
+SOCIAL_LINKS = PROFILE["social_links"]
+FOCUS_AREAS = PROFILE["focus_areas"]
+NAV_LINKS = PROFILE["nav_links"]
+ACKNOWLEDGEMENT = "\n".join(PROFILE["acknowledgement"])
 
 CONFERENCES = [
     "ICML",
@@ -117,412 +189,4259 @@ CONFERENCES = [
 
 CONFERENCE_HIGHLIGHT_CLASS = "highlight highlight-conference"
 
+# Applied to news and venue text in a single scan. Among terms with the same suffix the longest
+# wins when two match at the same position, and the earlier rule set for the same term; add
+# events, workshops or award keywords as further entries.
+HIGHLIGHT_RULES = [
+    {
+        "name": "conference",
+        "terms": CONFERENCES,
+        "suffix": r"(?:\s+\d{4})?",
+        "tag": "span",
+        "class": CONFERENCE_HIGHLIGHT_CLASS,
+    },
+    {
+        "name": "oral",
+        "terms": ["oral"],
+        "tag": "strong",
+    },
+]
+
+HTML_TAG_RE = re.compile(r"<!--.*?-->|<(/?)([a-zA-Z][\w-]*)[^>]*>", re.DOTALL)
+VOID_ELEMENTS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+)
+
 ARTEFACT_LABELS = {
     "url": "Paper",
     "html": "Website",
     "code": "Code",
     "poster": "Poster",
+    "slides": "Slides",
+    "video": "Video",
 }
 
+RESPONSIVE_IMAGE_DIR = ROOT / "assets" / "img" / "responsive"
+IMAGE_FORMATS = ("avif", "webp")
+IMAGE_PLACEHOLDER_WIDTH = 16
+TALKS_FILE = "talk_list.bib"
+SLIDE_THUMBNAIL_DIR = ROOT / "assets" / "img" / "slides"
+SLIDE_THUMBNAIL_WIDTH = 480
+SLIDE_THUMBNAIL_QUALITY = 75
+IMAGE_PROFILES = {
+    "publication": {"widths": (200, 400, 800, 1200), "sizes": "(max-width: 960px) 100vw, 200px"},
+    "photo": {"widths": (320, 640, 960), "sizes": "(max-width: 960px) 100vw, 320px"},
+}
 
-def slugify(value: str) -> str:
-    clean = re.sub(r"[^a-zA-Z0-9]+", "-", value).strip("-").lower()
-    return clean or "entry"
+STYLESHEET = "assets/styles.css"
+GOOGLE_FONTS_CSS = "https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;600&display=swap"
+FONT_AWESOME_CSS = "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.2/css/all.min.css"
 
+# Sources for --offline-assets; see the README for the expected layout.
+VENDOR_DIR = ROOT / "vendor"
+FONT_AWESOME_SVG_DIR = VENDOR_DIR / "fontawesome" / "svgs"
+FONT_FAMILY = "Space Grotesk"
+FONT_SOURCE = VENDOR_DIR / "fonts" / "SpaceGrotesk[wght].ttf"
+FONT_DIR = ROOT / "assets" / "fonts"
+FONT_AWESOME_STYLES = {
+    "fa-brands": "brands",
+    "fab": "brands",
+    "fa-solid": "solid",
+    "fas": "solid",
+    "fa-regular": "regular",
+    "far": "regular",
+}
+SVG_ROOT_RE = re.compile(r"<svg\b([^>]*)>(.*)</svg>", re.DOTALL)
+VIEWBOX_RE = re.compile(r'viewBox="([^"]+)"')
+CSS_PSEUDO_RE = re.compile(r"::?[\w-]+(?:\([^)]*\))?")
+CSS_TAG_RE = re.compile(r"(?:^|[\s>+~])([a-zA-Z][\w-]*)")
 
-def highlight_oral(text: str) -> str:
-    return re.sub(r"\b(oral)\b", r"<strong>\1</strong>", text, flags=re.IGNORECASE)
+SEARCH_SPLIT_RE = re.compile(r"[\W_]+")
+SEARCH_STOPWORDS = {
+    "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of", "on", "or",
+    "our", "that", "the", "their", "this", "to", "we", "with",
+}
 
+# Output stage of --optimize.
+FINGERPRINT_SUFFIXES = {".css", ".js", ".ico", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".avif"}
+COMPRESSIBLE_SUFFIXES = {".html", ".css", ".js", ".json", ".jsonld", ".svg", ".xml", ".ico", ".txt"}
+CONTENT_ADDRESSED_DIRS = (
+    FINGERPRINT_DIR, RESPONSIVE_IMAGE_DIR, FONT_DIR, PANEL_DIR, SLIDE_THUMBNAIL_DIR, STRUCTURED_DATA_DIR
+)
+HTML_COMMENT_RE = re.compile(r"<!--(?!\[).*?-->", re.DOTALL)
+URL_ATTR_RE = re.compile(r'\b(href|src|srcset)="([^"]*)"')
+RAW_HTML_BLOCK_RE = re.compile(
+    r"(<(?:pre|script|style|textarea)\b[^>]*>.*?</(?:pre|script|style|textarea)>)", re.DOTALL | re.IGNORECASE
+)
+HTML_GAP_RE = re.compile(r"(</?(!?[a-zA-Z][\w-]*)[^>]*>)\s+(?=</?([a-zA-Z][\w-]*))")
+BLOCK_ELEMENTS = {
+    "!doctype", "html", "head", "body", "meta", "link", "title", "script", "style", "noscript", "div", "section",
+    "header", "footer", "nav", "main", "article", "aside", "p", "ul", "ol", "li", "h1", "h2", "h3", "h4",
+    "h5", "h6", "figure", "figcaption", "picture", "source", "pre", "br", "hr", "svg", "symbol",
+}
 
-def highlight_conferences(text: str) -> str:
-    def repl(match: re.Match) -> str:
-        return f'<span class="{CONFERENCE_HIGHLIGHT_CLASS}">{match.group(1)}</span>'
+STRUCTURED_DATA_PLACEHOLDER = "@publications@"
+# Cached cards leave the author list out, so one card serves every profile that lists the paper.
+AUTHORS_PLACEHOLDER = "@authors@"
 
-    result = text
-    for conf in CONFERENCES:
-        pattern = r"\b(" + re.escape(conf) + r"(?:\s+\d{4})?)\b"
-        result = re.sub(pattern, repl, result, flags=re.IGNORECASE)
-    return result
+BIBTEX_EXCLUDED_FIELDS = ("img", "code", "html", "poster", "presentation", "abstract")
 
+# Mirrors pybtex's "ulatex+UTF-8" output encoding: only these ASCII characters are escaped.
+LATEX_SPECIAL_CHARS = {"#": r"\#", "%": r"\%", "&": r"\&", "_": r"\_", "~": r"\textasciitilde"}
+LATEX_SPECIAL_RE = re.compile("[" + re.escape("".join(LATEX_SPECIAL_CHARS)) + "]")
 
-def load_news(path: Path = ROOT / "news.json") -> List[Dict[str, object]]:
-    with path.open("r", encoding="utf-8") as fh:
-        news_items = json.load(fh)
-    for item in news_items:
-        item["date_obj"] = datetime.strptime(item["date"], "%Y-%m-%d")
-    return sorted(news_items, key=lambda itm: itm["date_obj"], reverse=True)
 
+def content_hash(*parts: object) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        if not isinstance(part, (bytes, str)):
+            part = json.dumps(part, ensure_ascii=False, sort_keys=True, default=str)
+        if isinstance(part, str):
+            part = part.encode("utf-8")
+        digest.update(part)
+        digest.update(b"\0")
+    return digest.hexdigest()
 
-def render_news_items(news_items: List[Dict[str, object]]) -> str:
-    rendered = []
-    for item in news_items:
-        date_label = item["date_obj"].strftime("%b %d, %Y")
-        text = highlight_oral(highlight_conferences(item["text"]))
-        rendered.append(
-            dedent(
-                f"""
-                <li class="news-item">
-                    <span class="news-date">{date_label}</span>
-                    <div class="news-body">{text}</div>
-                </li>
-                """
-            ).strip()
-        )
-    return "\n".join(rendered)
 
+@lru_cache(maxsize=None)
+def source_fingerprint() -> str:
+    return content_hash(Path(__file__).read_bytes())
 
-def format_authors(persons) -> str:
-    names = []
-    for person in persons:
-        first = " ".join(person.get_part("first"))
-        last = " ".join(person.get_part("last"))
-        full = " ".join(p for p in [first, last] if p).strip()
-        if PERSON["highlight_name"] in full:
-            full = f'<span class="author-self">{full}</span>'
-        names.append(full or "Anonymous")
-    return ", ".join(names)
 
+def config_fingerprint() -> str:
+    # build.py itself is hashed so that edits to the renderers invalidate the cache.
+    return content_hash(
+        FRAGMENT_CACHE_VERSION,
+        source_fingerprint(),
+        HIGHLIGHT_RULES,
+        ARTEFACT_LABELS,
+    )
 
-def format_badge(label: Optional[str]) -> str:
-    if not label:
-        return ""
-    variant = label.strip().lower()
-    extra_class = " badge-oral" if variant == "oral" else ""
-    return f'<span class="badge-pill{extra_class}">{label}</span>'
 
+class FragmentCache:
+    """On-disk map from content hashes to rendered HTML fragments."""
 
-def format_artefact_links(entry) -> str:
-    links = []
-    for field, label in ARTEFACT_LABELS.items():
-        url = entry.fields.get(field)
-        if url:
-            links.append(
-                f'<a class="pill-button" href="{url}" target="_blank" rel="noopener">{label}</a>'
-            )
-    return "\n".join(links)
+    def __init__(self, path: Optional[Path] = None, fragments: Optional[Dict[str, str]] = None) -> None:
+        # *fragments* seeds the cache from a store shared by several sites instead of *path*.
+        self.path = path or CACHE_DIR / "fragments.json"
+        self.fingerprint = config_fingerprint()
+        self.fragments: Dict[str, str] = {}
+        self.used: Dict[str, str] = {}
+        self.memo: Dict[Tuple[str, int], Tuple[object, object, str, str]] = {}
+        self.hits = 0
+        self.misses = 0
+        if fragments is not None:
+            self.fragments = fragments
+        elif self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if data.get("fingerprint") == self.fingerprint:
+                self.fragments = data.get("fragments", {})
 
+    def render(
+        self,
+        kind: str,
+        payload: object,
+        render: Callable[[], str],
+        source: object = None,
+        stamp: object = None,
+    ) -> str:
+        # *source* is the object the payload was derived from; a long-running --watch session hands
+        # the same objects back for unchanged entries, so they skip hashing the payload again.
+        # *stamp* covers the parts of the payload that can change while *source* stays the same.
+        if source is not None and (html := self.recall(kind, source, stamp)) is not None:
+            return html
+        key = content_hash(kind, payload)
+        html = self.fragments.get(key)
+        if html is None:
+            self.misses += 1
+            html = render()
+        else:
+            self.hits += 1
+        self.used[key] = html
+        if source is not None:
+            self.memo[(kind, id(source))] = (source, stamp, key, html)
+        return html
 
-def format_publication(entry_key: str, entry) -> str:
-    slug = slugify(entry_key)
-    title = entry.fields.get("title", "Untitled")
-    booktitle_raw = entry.fields.get("booktitle", "Preprint")
-    display_text = entry.fields.get("display", booktitle_raw)
-    is_preprint = booktitle_raw.strip().lower() == "preprint"
-    year = entry.fields.get("year")
-    badge = format_badge(entry.fields.get("presentation"))
-    authors = format_authors(entry.persons.get("author", []))
-    artefacts = format_artefact_links(entry)
-    abstract_text = entry.fields.get("abstract")
-
-    bibliograpy = BibliographyData(entries={entry_key: entry})
-    bibtex_raw = bibliograpy.to_string("bibtex").strip()
-    drop_fields = ("img", "code", "html", "poster", "presentation", "abstract")
-    cleaned_lines = []
-    for line in bibtex_raw.splitlines():
-        stripped = line.strip()
-        if any(stripped.startswith(f"{field} =") for field in drop_fields):
-            continue
-        cleaned_lines.append(line)
-    bibtex_clean = "\n".join(cleaned_lines).strip()
-    bibtex_html = escape(bibtex_clean)
+    def recall(self, kind: str, source: object, stamp: object = None) -> Optional[str]:
+        """The fragment last rendered from *source* with the same *stamp*, without building its payload."""
+        entry = self.memo.get((kind, id(source)))
+        if entry is None or entry[1] != stamp:
+            return None
+        _, _, key, html = entry
+        self.hits += 1
+        self.used[key] = html
+        return html
 
-    thumb_button = ""
-    if abstract_text:
-        thumb_button = f'<button class="pill-button thumb-button" data-toggle-target="abstract-{slug}">Abstract</button>'
+    def save(self) -> None:
+        # Only fragments touched by this build are kept, so removed entries do not accumulate.
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"fingerprint": self.fingerprint, "fragments": self.used}
+        self.path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
 
-    venue_html = highlight_oral(
-        highlight_conferences(f'<span class="venue">{display_text}</span>')
-    )
-    year_fragment = f" | {year}" if (year and is_preprint) else ""
+    def summary(self) -> str:
+        return f"Fragment cache: {self.hits} hits, {self.misses} misses"
 
-    parts = [
-        '<article class="publication-card">',
-        '  <div class="pub-thumb">',
-        f'    <img src="{entry.fields.get("img", "assets/img/publications/placeholder.png")}" alt="{title} cover" loading="lazy">',
-    ]
-    if thumb_button:
-        parts.append(f'    {thumb_button}')
-    parts.append("  </div>")
-    parts.extend([
-        '  <div class="pub-body">',
-        f'    <div class="pub-meta">{venue_html}{year_fragment}{badge}</div>',
-        f'    <h4 class="pub-title"><a href="{entry.fields.get("url", "#")}" target="_blank" rel="noopener">{title}</a></h4>',
-        f'    <p class="pub-authors">{authors}</p>',
-        f'    <div class="pub-actions">{artefacts}',
-    ])
-
-    toggle_buttons = []
-    toggle_buttons.append(
-        f'<button class="pill-button ghost" data-toggle-target="bibtex-{slug}">BibTeX</button>'
-    )
-
-    parts.append("      " + " ".join(toggle_buttons))
-    parts.append("    </div>")
-
-    if abstract_text:
-        parts.append(
-            dedent(
-                f"""
-                <div class="toggle-panel" id="abstract-{slug}">
-                    <p>{abstract_text}</p>
-                </div>
-                """
-            ).strip()
-        )
 
-    parts.append(
-        dedent(
-            f"""
-            <div class="toggle-panel toggle-panel-bib" id="bibtex-{slug}">
-                <pre class="pub-bibtex"><code>{bibtex_html}</code></pre>
-            </div>
-            """
-        ).strip()
+class Author:
+    __slots__ = ("first", "last")
+
+    def __init__(self, first: str, last: str) -> None:
+        self.first = first
+        self.last = last
+
+    @property
+    def name(self) -> str:
+        return " ".join(p for p in [self.first, self.last] if p).strip()
+
+
+class Publication:
+    """Normalized view of one bib entry, shared by every output."""
+
+    __slots__ = (
+        "key",
+        "entry_type",
+        "title",
+        "booktitle",
+        "display",
+        "year",
+        "presentation",
+        "abstract",
+        "img",
+        "artefacts",
+        "authors",
+        "bibtex",
     )
 
-    parts.append("  </div>")
-    parts.append("</article>")
-    return "\n".join(parts)
+    def __init__(
+        self,
+        key: str,
+        entry_type: str,
+        title: Optional[str],
+        booktitle: Optional[str],
+        display: Optional[str],
+        year: Optional[str],
+        presentation: Optional[str],
+        abstract: Optional[str],
+        img: Optional[str],
+        artefacts: Dict[str, str],
+        authors: List[Author],
+        bibtex: str,
+    ) -> None:
+        self.key = key
+        self.entry_type = entry_type
+        self.title = title
+        self.booktitle = booktitle
+        self.display = display
+        self.year = year
+        self.presentation = presentation
+        self.abstract = abstract
+        self.img = img
+        self.artefacts = artefacts
+        self.authors = authors
+        self.bibtex = bibtex
 
+    @property
+    def url(self) -> Optional[str]:
+        return self.artefacts.get("url")
 
-def build_publications_html():
-    parser = bibtex.Parser()
-    bib_data = parser.parse_file(str(ROOT / "publication_list.bib"))
-    cards = [
-        format_publication(entry_key, entry)
-        for entry_key, entry in bib_data.entries.items()
-    ]
-    return "\n".join(cards), bib_data
+    def to_state(self) -> Tuple[object, ...]:
+        # Plain builtins only, so snapshots load regardless of the importing module name.
+        state = [getattr(self, name) for name in self.__slots__]
+        state[self.__slots__.index("authors")] = [(a.first, a.last) for a in self.authors]
+        return tuple(state)
 
+    @classmethod
+    def from_state(cls, state: Tuple[object, ...]) -> "Publication":
+        values = list(state)
+        index = cls.__slots__.index("authors")
+        values[index] = [Author(first, last) for first, last in values[index]]
+        return cls(*values)
 
-def build_social_html() -> str:
-    items = []
-    for link in SOCIAL_LINKS:
-        if icon_src := link.get("icon_img"):
-            icon_html = f'<img src="{icon_src}" alt="{link["label"]} icon" loading="lazy">'
-        else:
-            icon_html = f'<i class="{link["icon"]}"></i>'
-        items.append(
-            f'<a class="social-link" href="{link["url"]}" target="_blank" rel="noopener">{icon_html}<span>{link["label"]}</span></a>'
-        )
-    return "\n".join(items)
 
+def slugify(value: str) -> str:
+    clean = re.sub(r"[^a-zA-Z0-9]+", "-", value).strip("-").lower()
+    return clean or "entry"
 
-def build_focus_html() -> str:
-    return "\n".join(
-        [
-            dedent(
-                f"""
-                <div class="focus-card">
-                    <h4>{item["title"]}</h4>
-                    <p>{item["body"]}</p>
-                </div>
-                """
-            ).strip()
-            for item in FOCUS_AREAS
-        ]
-    )
 
+def trie_pattern(terms: List[str]) -> str:
+    # A prefix trie keeps the alternation cost flat as the number of terms grows.
+    trie: Dict[str, dict] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
 
-def build_structured_data(bib_data) -> str:
-    publications = []
-    for entry_key, entry in bib_data.entries.items():
-        authors = []
-        for person in entry.persons.get("author", []):
-            first = " ".join(person.get_part("first"))
-            last = " ".join(person.get_part("last"))
-            authors.append({"@type": "Person", "name": " ".join([first, last]).strip()})
-        publication = {
-            "@type": "ScholarlyArticle",
-            "headline": entry.fields.get("title", ""),
-            "author": authors,
-            "publisher": {"@type": "Organization", "name": entry.fields.get("booktitle", "")},
-        }
-        if year := entry.fields.get("year"):
-            publication["datePublished"] = year
-        if url := entry.fields.get("url"):
-            publication["url"] = url
-        publications.append(publication)
-
-    data = {
-        "@context": "https://schema.org",
-        "@type": "Person",
-        "name": f'{PERSON["first_name"]} {PERSON["last_name"]}',
-        "jobTitle": "PhD Student",
-        "description": PERSON["tagline"],
-        "affiliation": {
-            "@type": "Organization",
-        "name": "ELLIS Institute Tuebingen",
-            "alternateName": "IMPRS-IS",
-        },
-        "url": "https://kotekjedi.github.io",
-        "image": f'https://kotekjedi.github.io/{PERSON["photo"]}',
-        "sameAs": [link["url"] for link in SOCIAL_LINKS if link["url"].startswith("http")],
-        "email": PERSON["email"],
-        "workLocation": {"@type": "Place", "name": "Tuebingen, Germany"},
-        "publication": publications,
-    }
-    return json.dumps(data, ensure_ascii=False, indent=2)
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        body = "(?:" + "|".join(branches) + ")"
+        return body + "?" if "" in node else body
 
+    return emit(trie)
 
-def build_nav_html() -> str:
-    links = "".join(
-        [f'<a href="{item["href"]}">{item["label"]}</a>' for item in NAV_LINKS]
-    )
-    return f'<nav class="site-nav"><div class="brand">Sasha&apos;s Website</div><div class="nav-links">{links}</div></nav>'
 
+class Highlighter:
+    """Wraps rule terms in markup in one pass, skipping tags and already highlighted spans.
 
-def get_index_html() -> str:
-    publications_html, bib_data = build_publications_html()
-    news_html = render_news_items(load_news())
-    social_html = build_social_html()
-    focus_html = build_focus_html()
-    structured_data = build_structured_data(bib_data)
-    nav_html = build_nav_html()
+    The terms of every rule share one trie per suffix, so a match costs the same for two rules or
+    hundreds; the rule is looked up from the matched term afterwards. Within a suffix the longest
+    term wins; terms with different suffixes are tried in the order their suffix first appears.
+    """
 
-    bio_html = "\n".join([f"<p>{paragraph}</p>" for paragraph in PERSON["bio"]])
-    analytics_snippet = ""
-    if GOOGLE_ANALYTICS_ID:
-        analytics_snippet = dedent(
-            f"""
-            <!-- Google tag (gtag.js) -->
-            <script async src="https://www.googletagmanager.com/gtag/js?id={GOOGLE_ANALYTICS_ID}"></script>
-            <script>
-              window.dataLayer = window.dataLayer || [];
-              function gtag(){{dataLayer.push(arguments);}}
-              gtag('js', new Date());
-              gtag('config', '{GOOGLE_ANALYTICS_ID}');
-            </script>
-            <script data-goatcounter="https://kotekjedi.goatcounter.com/count" async src="//gc.zgo.at/count.js"></script>
-            """
-        ).strip()
-    return dedent(
-        f"""
+    def __init__(self, rules: List[Dict[str, object]]) -> None:
+        self.wrappers: List[Tuple[str, str]] = []
+        self.open_tags: Dict[str, int] = {}
+        # Lowercased term -> (rule index, exact spelling for case-sensitive rules, suffix), in rule order.
+        self.rules: Dict[str, List[Tuple[int, Optional[str], str]]] = {}
+        suffixes: Dict[str, set] = {}
+        for index, rule in enumerate(rules):
+            tag = rule["tag"]
+            css_class = rule.get("class")
+            open_tag = f'<{tag} class="{css_class}">' if css_class else f"<{tag}>"
+            self.wrappers.append((open_tag, f"</{tag}>"))
+            self.open_tags.setdefault(open_tag, index)
+            exact = not rule.get("ignore_case", True)
+            suffix = rule.get("suffix", "")
+            for term in rule["terms"]:
+                self.rules.setdefault(term.lower(), []).append((index, term if exact else None, suffix))
+                suffixes.setdefault(suffix, set()).add(term.lower())
+        # One capturing trie per distinct suffix (usually one or two), whatever the number of rules.
+        self.suffixes = list(suffixes)
+        alternatives = [f"({trie_pattern(sorted(terms))}){suffix}" for suffix, terms in suffixes.items()]
+        self.pattern = re.compile(r"\b(?:" + "|".join(alternatives) + r")\b", re.IGNORECASE) if alternatives else None
+
+    def rule_for(self, match: re.Match) -> Optional[int]:
+        group = next(index for index, term in enumerate(match.groups()) if term is not None)
+        term = match.group(group + 1)
+        for rule, exact, suffix in self.rules[term.lower()]:
+            if suffix == self.suffixes[group] and (exact is None or exact == term):
+                return rule
+        return None
+
+    def _highlight_segment(self, text: str, suppressed: frozenset) -> str:
+        def wrap(match: re.Match) -> str:
+            rule = self.rule_for(match)
+            if rule is None or rule in suppressed:
+                return match.group(0)
+            open_tag, close_tag = self.wrappers[rule]
+            return f"{open_tag}{match.group(0)}{close_tag}"
+
+        return self.pattern.sub(wrap, text)
+
+    def highlight(self, text: str) -> str:
+        if self.pattern is None or not self.pattern.search(text):
+            return text
+        if "<" not in text:
+            return self._highlight_segment(text, frozenset())
+        out = []
+        stack: List[Tuple[str, Optional[int]]] = []
+        suppressed: frozenset = frozenset()
+        position = 0
+        for tag in HTML_TAG_RE.finditer(text):
+            out.append(self._highlight_segment(text[position : tag.start()], suppressed))
+            out.append(tag.group(0))
+            position = tag.end()
+            name = (tag.group(2) or "").lower()
+            if not name or name in VOID_ELEMENTS or tag.group(0).endswith("/>"):
+                continue
+            if tag.group(1):
+                # Pop up to the matching element; stray closing tags are ignored.
+                for depth in range(len(stack) - 1, -1, -1):
+                    if stack[depth][0] == name:
+                        del stack[depth:]
+                        break
+            else:
+                stack.append((name, self.open_tags.get(tag.group(0))))
+            suppressed = frozenset(rule for _, rule in stack if rule is not None)
+        out.append(self._highlight_segment(text[position:], suppressed))
+        return "".join(out)
+
+
+@lru_cache(maxsize=None)
+def default_highlighter() -> Highlighter:
+    return Highlighter(HIGHLIGHT_RULES)
+
+
+def highlight_text(text: str) -> str:
+    return default_highlighter().highlight(text)
+
+
+TEMPLATES = {
+    "page": """
         <!doctype html>
         <html lang="en">
+        {{head}}
+        <body>
+            <div class="page-shell">
+            {{nav}}
+            {{hero}}
+            <main>
+                {{focus}}
+                {{news}}
+                {{publications}}
+                {{talks}}
+                {{acknowledgements}}
+            </main>
+            {{footer}}
+            </div>
+            {{scripts}}
+        </body>
+        </html>
+    """,
+    "head": """
         <head>
             <meta charset="utf-8">
             <meta name="viewport" content="width=device-width, initial-scale=1">
-            <title>{PERSON["first_name"]} {PERSON["last_name"]}</title>
-            <meta name="description" content="{PERSON["tagline"]}">
-            <link rel="preconnect" href="https://fonts.googleapis.com">
-            <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-            <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;600&display=swap" rel="stylesheet">
-            <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.2/css/all.min.css" integrity="sha512-SnH5WK+bZxgPHs44uWIX+LLJAJ9/2PkPKZ5QiAj6Ta86w+fsb2TkcmfRyVX3pBnMFcV7oQPJkl9QevSCWr3W6A==" crossorigin="anonymous" referrerpolicy="no-referrer" />
-            <link rel="stylesheet" href="assets/styles.css">
+            <title>{{full_name}}</title>
+            <meta name="description" content="{{tagline}}">
+            {{stylesheets}}
             <link rel="icon" type="image/x-icon" href="assets/favicon_mine.ico">
-            {analytics_snippet}
+            <link rel="alternate" type="application/atom+xml" title="News" href="{{feed}}">
+            {{structured_data_link}}
+            {{analytics}}
             <script type="application/ld+json">
-{structured_data}
+            {{structured_data}}
             </script>
         </head>
-        <body>
-            <div class="page-shell">
-            {nav_html}
-            <header class="hero" id="top">
-                <div class="hero-grid">
-                    <div class="hero-content">
-                        <p class="eyebrow">{PERSON["location"]}</p>
-                        <h1>{PERSON["first_name"]} <span>{PERSON["last_name"]}</span></h1>
-                        <p class="tagline">{PERSON["tagline"]}</p>
-                        <div class="social-row">
-                            {social_html}
-                        </div>
-                        {bio_html}
-                        <div class="cta-row">
-                            <a class="pill-button primary" href="{PERSON["cv"]}" target="_blank" rel="noopener">Download CV</a>
-                            <a class="pill-button secondary" href="mailto:{PERSON["email"]}">Email me</a>
-                        </div>
+    """,
+    "stylesheets": """
+        <link rel="preconnect" href="https://fonts.googleapis.com">
+        <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+        <link href="{{google_fonts_css}}" rel="stylesheet">
+        <link rel="stylesheet" href="{{font_awesome_css}}" integrity="sha512-SnH5WK+bZxgPHs44uWIX+LLJAJ9/2PkPKZ5QiAj6Ta86w+fsb2TkcmfRyVX3pBnMFcV7oQPJkl9QevSCWr3W6A==" crossorigin="anonymous" referrerpolicy="no-referrer" />
+        <link rel="stylesheet" href="{{stylesheet}}">
+    """,
+    "offline_stylesheets": """
+        {{preload_font}}
+        {{third_party}}
+        <style>
+        {{critical_css}}
+        </style>
+        <link rel="preload" href="{{stylesheet}}" as="style" onload="this.onload=null;this.rel='stylesheet'">
+        <noscript><link rel="stylesheet" href="{{stylesheet}}"></noscript>
+    """,
+    "analytics": """
+        <!-- Google tag (gtag.js) -->
+        <script async src="https://www.googletagmanager.com/gtag/js?id={{analytics_id}}"></script>
+        <script>
+          window.dataLayer = window.dataLayer || [];
+          function gtag(){dataLayer.push(arguments);}
+          gtag('js', new Date());
+          gtag('config', '{{analytics_id}}');
+        </script>
+    """,
+    "goatcounter": """
+        <script data-goatcounter="{{url}}" async src="//gc.zgo.at/count.js"></script>
+    """,
+    "nav": """
+        {{nav}}
+    """,
+    "hero": """
+        {{icon_sprite}}
+        <header class="hero" id="top">
+            <div class="hero-grid">
+                <div class="hero-content">
+                    <p class="eyebrow">{{location}}</p>
+                    <h1>{{first_name}} <span>{{last_name}}</span></h1>
+                    <p class="tagline">{{tagline}}</p>
+                    <div class="social-row">
+                        {{social}}
                     </div>
-                    <div class="hero-photo">
-                        <img src="{PERSON["photo"]}" alt="{PERSON["first_name"]} {PERSON["last_name"]}" loading="lazy">
+                    {{bio}}
+                    <div class="cta-row">
+                        <a class="pill-button primary" href="{{cv}}" target="_blank" rel="noopener">Download CV</a>
+                        <a class="pill-button secondary" href="mailto:{{email}}">Email me</a>
                     </div>
                 </div>
-            </header>
-
-            <main>
-                <section class="panel focus-panel" aria-labelledby="focus-title">
-                    <div class="panel-heading">
-                        <h2 id="focus-title">My current...</h2>
-                    </div>
-                    <div class="focus-grid">
-                        {focus_html}
-                    </div>
-                </section>
-
-                <section class="panel news-panel" id="news" aria-labelledby="news-title">
+                <div class="hero-photo">
+                    {{photo}}
+                </div>
+            </div>
+        </header>
+    """,
+    "focus": """
+        <section class="panel focus-panel" aria-labelledby="focus-title">
+            <div class="panel-heading">
+                <h2 id="focus-title">My current...</h2>
+            </div>
+            <div class="focus-grid">
+                {{cards}}
+            </div>
+        </section>
+    """,
+    "focus_card": """
+        <div class="focus-card">
+            <h4>{{title}}</h4>
+            <p>{{body}}</p>
+        </div>
+    """,
+    "news": """
+        <section class="panel news-panel" id="news" aria-labelledby="news-title">
+            <div class="panel-heading">
+                <h2 id="news-title">News & updates</h2>
+            </div>
+            <ul class="news-timeline">
+                {{items}}
+            </ul>
+            {{archive}}
+        </section>
+    """,
+    "news_archive_link": """
+        <p class="news-archive-link"><a href="{{archive}}">Older news</a> · <a href="{{feed}}">Atom feed</a></p>
+    """,
+    "news_feed_link": """
+        <p class="news-archive-link"><a href="{{feed}}">Atom feed</a></p>
+    """,
+    "news_archive_page": """
+        <!doctype html>
+        <html lang="en">
+        <head>
+            <meta charset="utf-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1">
+            <base href="{{base}}">
+            <title>News {{year}} · {{full_name}}</title>
+            <link rel="stylesheet" href="{{stylesheet}}">
+            <link rel="alternate" type="application/atom+xml" title="News" href="{{feed}}">
+        </head>
+        <body>
+            <main class="page-shell">
+                <section class="panel news-panel" aria-labelledby="news-title">
                     <div class="panel-heading">
-                        <h2 id="news-title">News & updates</h2>
+                        <h2 id="news-title">News {{year}}</h2>
+                        <p class="panel-description">{{years}}</p>
                     </div>
                     <ul class="news-timeline">
-                        {news_html}
+                        {{items}}
                     </ul>
                 </section>
-
-                <section class="panel" id="research" aria-labelledby="research-title">
-                    <div class="panel-heading">
-                        <h2 id="research-title">Research</h2>
-                        <p class="panel-description">Some of my recent work :) </p>
-                    </div>
-                    <div class="publications">
-                        {publications_html}
-                    </div>
-                </section>
-
-                <section class="panel" id="contact">
-                    <div class="panel-heading">
-                        <h3 class="panel-title-sm">Acknowledgements</h3>
-                    </div>
-                    <p>{ACKNOWLEDGEMENT}</p>
-                </section>
+                <p><a class="pill-button secondary" href="index.html#news">Back to the homepage</a></p>
             </main>
-
-            <footer class="site-footer">
-                <p>Vibe-coded with CodeX. Last updated {datetime.now().strftime("%b %d, %Y")}.</p>
-            </footer>
+        </body>
+        </html>
+    """,
+    "news_feed": """
+        <?xml version="1.0" encoding="utf-8"?>
+        <feed xmlns="http://www.w3.org/2005/Atom" xml:base="{{site}}">
+          <title>{{title}}</title>
+          <link href="{{site}}"/>
+          <link rel="self" href="{{feed}}"/>
+          <id>{{site}}</id>
+          <updated>{{updated}}</updated>
+          <author><name>{{author}}</name></author>
+          {{entries}}
+        </feed>
+    """,
+    "news_feed_entry": """
+        <entry>
+          <title>{{title}}</title>
+          <link href="{{link}}"/>
+          <id>{{id}}</id>
+          <updated>{{updated}}</updated>
+          <content type="html">{{content}}</content>
+        </entry>
+    """,
+    "news_item": """
+        <li class="news-item">
+            <span class="news-date">{{date}}</span>
+            <div class="news-body">{{text}}</div>
+        </li>
+    """,
+    "publications": """
+        <section class="panel" id="research" aria-labelledby="research-title">
+            <div class="panel-heading">
+                <h2 id="research-title">Research</h2>
+                <p class="panel-description">Some of my recent work :) </p>
+                {{search}}
             </div>
+            <div class="publications">
+                {{cards}}
+            </div>
+        </section>
+    """,
+    "live_reload": """
+        <script>
+        (() => {
+            let generation = null;
+            const events = new EventSource('{{path}}');
+            events.onmessage = (event) => {
+                if (event.data.startsWith('hello ')) {
+                    if (generation && generation !== event.data) location.reload();
+                    generation = event.data;
+                } else if (event.data === 'css') {
+                    document.querySelectorAll('link[rel="stylesheet"]').forEach((link) => {
+                        const url = new URL(link.href);
+                        if (url.origin !== location.origin) return;
+                        url.searchParams.set('livereload', Date.now());
+                        link.href = url.href;
+                    });
+                } else {
+                    location.reload();
+                }
+            };
+        })();
+        </script>
+    """,
+    "search_box": """
+        <div class="search-box" role="search">
+          <input type="search" id="site-search" class="search-input" placeholder="Filter papers and news by title, author, venue, year or keyword" aria-label="Filter papers and news" autocomplete="off">
+          <p class="search-status" id="site-search-status" aria-live="polite"></p>
+        </div>
+    """,
+    "search_script": r"""
+        <script type="application/json" id="search-index">{{index}}</script>
+        <script>
+        (() => {
+            const input = document.getElementById('site-search');
+            const status = document.getElementById('site-search-status');
+            const index = JSON.parse(document.getElementById('search-index').textContent);
+            const papers = document.querySelectorAll('.publication-card');
+            const docs = [...papers, ...document.querySelectorAll('.news-item')];
+            const stopwords = new Set(index.stopwords);
 
-            <script>
-            document.querySelectorAll('[data-toggle-target]').forEach((button) => {{
-                button.addEventListener('click', () => {{
-                    const targetId = button.dataset.toggleTarget;
-                    const target = document.getElementById(targetId);
-                    if (!target) return;
-                    target.classList.toggle('is-visible');
-                    const expanded = target.classList.contains('is-visible');
-                    button.setAttribute('aria-expanded', expanded);
-
-                    const isBibtex = targetId.startsWith('bibtex-');
-                    const isAbstract = targetId.startsWith('abstract-');
-                    const siblingPrefix = isBibtex ? 'abstract-' : isAbstract ? 'bibtex-' : null;
-
-                    if (siblingPrefix) {{
-                        const siblingId = targetId.replace(isBibtex ? 'bibtex-' : 'abstract-', siblingPrefix);
-                        const siblingPanel = document.getElementById(siblingId);
-                        if (siblingPanel && siblingPanel.classList.contains('is-visible')) {{
-                            siblingPanel.classList.remove('is-visible');
-                            const siblingButton = document.querySelector(`[data-toggle-target="${{siblingId}}"]`);
-                            if (siblingButton) {{
-                                siblingButton.setAttribute('aria-expanded', 'false');
-                            }}
-                        }}
-                    }}
-                }});
-            }});
-            </script>
-            <script data-goatcounter="https://kotekjedi.goatcounter.com/count" async src="//gc.zgo.at/count.js"></script>
+            function lookup(prefix) {
+                let low = 0;
+                let high = index.terms.length;
+                while (low < high) {
+                    const mid = (low + high) >> 1;
+                    if (index.terms[mid] < prefix) low = mid + 1;
+                    else high = mid;
+                }
+                const hits = new Set();
+                for (let i = low; i < index.terms.length && index.terms[i].startsWith(prefix); i++) {
+                    index.docs[i].forEach((doc) => hits.add(doc));
+                }
+                return hits;
+            }
+
+            input.addEventListener('input', () => {
+                const terms = input.value.toLowerCase().normalize('NFKD').replace(/[\u0300-\u036f]/g, '')
+                    .split(/[^\p{L}\p{N}]+/u)
+                    .filter((term) => (term.length > 1 || /^\d+$/.test(term)) && !stopwords.has(term));
+                let matches = null;
+                for (const term of terms) {
+                    const hits = lookup(term);
+                    matches = matches ? new Set([...matches].filter((doc) => hits.has(doc))) : hits;
+                }
+                docs.forEach((element, doc) => {
+                    element.hidden = matches !== null && !matches.has(doc);
+                });
+                if (matches === null) {
+                    status.textContent = '';
+                } else {
+                    const paperHits = [...matches].filter((doc) => doc < papers.length).length;
+                    status.textContent = `${paperHits} papers, ${matches.size - paperHits} news items`;
+                }
+            });
+        })();
+        </script>
+    """,
+    "publication_card": """
+        <article class="publication-card">
+          <div class="pub-thumb">
+            {{thumbnail}}
+            {{thumb_button}}
+          </div>
+          <div class="pub-body">
+            <div class="pub-meta">{{venue}}{{year}}{{badge}}</div>
+            <h4 class="pub-title"><a href="{{url}}" target="_blank" rel="noopener">{{title}}</a></h4>
+            <p class="pub-authors">{{authors}}</p>
+            <div class="pub-actions">
+              {{artefacts}}
+              {{bibtex_button}}
+            </div>
+            {{abstract_panel}}
+            {{bibtex_panel}}
+          </div>
+        </article>
+    """,
+    "talks": """
+        {{panel}}
+    """,
+    "talks_panel": """
+        <section class="panel" id="talks" aria-labelledby="talks-title">
+            <div class="panel-heading">
+                <h2 id="talks-title">Talks</h2>
+                <p class="panel-description">Slides from talks I have given.</p>
+            </div>
+            <div class="talks">
+                {{cards}}
+            </div>
+        </section>
+    """,
+    "talk_card": """
+        <article class="talk-card">
+          {{thumbnail}}
+          <div class="talk-body">
+            <div class="pub-meta">{{venue}}{{year}}</div>
+            <h4 class="pub-title">{{title}}</h4>
+            <div class="pub-actions">
+              {{links}}
+            </div>
+          </div>
+        </article>
+    """,
+    "toggle_panel": """
+        <div class="{{classes}}" id="{{panel_id}}">
+          {{body}}
+        </div>
+    """,
+    "panel_page": """
+        <!doctype html>
+        <html lang="en">
+        <head>
+            <meta charset="utf-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1">
+            <meta name="robots" content="noindex">
+            <title>{{title}}</title>
+            <link rel="stylesheet" href="{{stylesheet}}">
+        </head>
+        <body>
+            <main class="page-shell">
+                <h1 class="pub-title">{{title}}</h1>
+                {{panels}}
+                <p><a class="pill-button secondary" href="{{back}}">Back to the publication list</a></p>
+            </main>
         </body>
         </html>
-        """
-    ).strip()
+    """,
+    "acknowledgements": """
+        <section class="panel" id="contact">
+            <div class="panel-heading">
+                <h3 class="panel-title-sm">Acknowledgements</h3>
+            </div>
+            {{body}}
+        </section>
+    """,
+    "footer": """
+        <footer class="site-footer">
+            <p>Vibe-coded with CodeX. Last updated {{updated}}.</p>
+        </footer>
+    """,
+    "scripts": """
+        <script>
+        function togglePanel(button, target) {
+            const targetId = target.id;
+            target.classList.toggle('is-visible');
+            const expanded = target.classList.contains('is-visible');
+            button.setAttribute('aria-expanded', expanded);
+
+            const isBibtex = targetId.startsWith('bibtex-');
+            const isAbstract = targetId.startsWith('abstract-');
+            const siblingPrefix = isBibtex ? 'abstract-' : isAbstract ? 'bibtex-' : null;
+
+            if (siblingPrefix) {
+                const siblingId = targetId.replace(isBibtex ? 'bibtex-' : 'abstract-', siblingPrefix);
+                const siblingPanel = document.getElementById(siblingId);
+                if (siblingPanel && siblingPanel.classList.contains('is-visible')) {
+                    siblingPanel.classList.remove('is-visible');
+                    const siblingButton = document.querySelector(`[data-toggle-target="${siblingId}"]`);
+                    if (siblingButton) {
+                        siblingButton.setAttribute('aria-expanded', 'false');
+                    }
+                }
+            }
+        }
+
+        {{toggles}}
+        {{service_worker}}
+        </script>
+        {{search}}
+        {{goatcounter}}
+    """,
+    "toggle_script": """
+        document.querySelectorAll('[data-toggle-target]').forEach((button) => {
+            button.addEventListener('click', () => {
+                const target = document.getElementById(button.dataset.toggleTarget);
+                if (target) togglePanel(button, target);
+            });
+        });
+    """,
+    "lazy_toggle_script": """
+        const panelRequests = new Map();
+        function loadPanels(src) {
+            if (!panelRequests.has(src)) {
+                panelRequests.set(src, fetch(src).then((response) => {
+                    if (!response.ok) throw new Error(response.statusText);
+                    return response.json();
+                }));
+            }
+            return panelRequests.get(src);
+        }
+
+        document.querySelectorAll('[data-toggle-target]').forEach((button) => {
+            button.addEventListener('click', async (event) => {
+                event.preventDefault();
+                const targetId = button.dataset.toggleTarget;
+                const target = document.getElementById(targetId);
+                if (!target) return;
+                if (button.dataset.panelSrc && !target.dataset.loaded) {
+                    try {
+                        const panels = await loadPanels(button.dataset.panelSrc);
+                        target.innerHTML = panels[targetId.split('-')[0]];
+                        target.dataset.loaded = 'true';
+                    } catch (error) {
+                        panelRequests.delete(button.dataset.panelSrc);
+                        if (button.href) window.location.href = button.href;
+                        return;
+                    }
+                }
+                togglePanel(button, target);
+            });
+        });
+    """,
+    "service_worker_register": """
+        if ('serviceWorker' in navigator) {
+            window.addEventListener('load', () => {
+                navigator.serviceWorker.register('{{src}}').catch(() => {});
+            });
+        }
+    """,
+    "service_worker": """
+        // Generated by build.py. Precache version {{version}}; entries are listed in {{manifest}}.
+        const VERSION = '{{version}}';
+        const MANIFEST = '{{manifest}}';
+        const PREFIX = 'precache-';
+        const CACHE = PREFIX + VERSION;
+        const IMMUTABLE = {{immutable}};
+        const SCOPE = new URL('./', self.location).href;
+
+        function entryKey(url) {
+            const key = decodeURIComponent(url.href.slice(SCOPE.length).split(/[?#]/)[0]);
+            return key === '' || key.endsWith('/') ? key + 'index.html' : key;
+        }
+
+        async function previousEntries() {
+            for (const name of await caches.keys()) {
+                if (!name.startsWith(PREFIX) || name === CACHE) continue;
+                const cache = await caches.open(name);
+                const stored = await cache.match(MANIFEST);
+                if (stored) return {cache, entries: await stored.json()};
+            }
+            return {cache: null, entries: {}};
+        }
+
+        async function install() {
+            const response = await fetch(`${MANIFEST}?v=${VERSION}`, {cache: 'no-store'});
+            if (!response.ok) throw new Error(`${MANIFEST}: ${response.status}`);
+            const {entries} = await response.json();
+            const previous = await previousEntries();
+            const cache = await caches.open(CACHE);
+            // Unchanged entries are copied from the previous version; only changed ones hit the network.
+            await Promise.all(Object.entries(entries).map(async ([key, hash]) => {
+                if (previous.entries[key] === hash) {
+                    const cached = await previous.cache.match(key);
+                    if (cached) return cache.put(key, cached);
+                }
+                const fresh = await fetch(key, {cache: 'reload'});
+                if (!fresh.ok) throw new Error(`${key}: ${fresh.status}`);
+                return cache.put(key, fresh);
+            }));
+            await cache.put(MANIFEST, new Response(JSON.stringify(entries), {
+                headers: {'Content-Type': 'application/json'},
+            }));
+        }
+
+        async function activate() {
+            const names = await caches.keys();
+            await Promise.all(names.filter((name) => name.startsWith(PREFIX) && name !== CACHE).map((name) => caches.delete(name)));
+            await self.clients.claim();
+        }
+
+        let precached = null;
+
+        async function isPrecached(cache, key) {
+            if (precached === null) {
+                const stored = await cache.match(MANIFEST);
+                precached = stored ? await stored.json() : {};
+            }
+            return key in precached;
+        }
+
+        async function cacheFirst(event, key, request) {
+            const cache = await caches.open(CACHE);
+            const immutable = IMMUTABLE.some((prefix) => key.startsWith(prefix));
+            if (!immutable && !(await isPrecached(cache, key))) {
+                // Not versioned by the manifest, so cached at runtime and revalidated.
+                return staleWhileRevalidate(event, key, request);
+            }
+            const cached = await cache.match(key);
+            if (cached) return cached;
+            const response = await fetch(request);
+            if (response.ok && immutable) await cache.put(key, response.clone());
+            return response;
+        }
+
+        async function staleWhileRevalidate(event, key, request) {
+            const cache = await caches.open(CACHE);
+            const cached = await cache.match(key);
+            const network = fetch(request).then(async (response) => {
+                if (response.ok) await cache.put(key, response.clone());
+                return response;
+            });
+            if (!cached) return network;
+            event.waitUntil(network.catch(() => {}));
+            return cached;
+        }
+
+        self.addEventListener('install', (event) => event.waitUntil(install()));
+        self.addEventListener('activate', (event) => event.waitUntil(activate()));
+        self.addEventListener('fetch', (event) => {
+            const request = event.request;
+            const url = new URL(request.url);
+            if (request.method !== 'GET' || !url.href.startsWith(SCOPE)) return;
+            const key = entryKey(url);
+            if (key === MANIFEST || key === '{{worker}}') return;
+            if (request.mode === 'navigate' || key.endsWith('.html')) {
+                event.respondWith(staleWhileRevalidate(event, key, request));
+            } else {
+                event.respondWith(cacheFirst(event, key, request));
+            }
+        });
+    """,
+}
+
+SLOT_RE = re.compile(r"\{\{(\w+)\}\}")
+BLOCK_SLOT_RE = re.compile(r"([ \t]*)\{\{(\w+)\}\}")
+PRE_TAG_RE = re.compile(r"<(/?)pre[\s>]", re.IGNORECASE)
+LINE_BREAK_RE = re.compile(r"\n(?=[^\n])")
+
+
+@lru_cache(maxsize=1 << 16)
+def indent_fragment(fragment: str, prefix: str) -> str:
+    # Lines inside <pre> blocks are left alone so the displayed BibTeX keeps its layout.
+    if not prefix:
+        return fragment
+    segments = []
+    in_pre = False
+    start = 0
+    for tag in PRE_TAG_RE.finditer(fragment):
+        if in_pre == bool(tag.group(1)):
+            segments.append((in_pre, fragment[start : tag.start()]))
+            start = tag.start()
+            in_pre = not in_pre
+    segments.append((in_pre, fragment[start:]))
+    out = [prefix] if fragment[:1] not in ("", "\n") else []
+    for index, (inside, text) in enumerate(segments):
+        if inside:
+            out.append(text)
+            continue
+        out.append(LINE_BREAK_RE.sub("\n" + prefix, text))
+        # A segment ending in a newline is followed by the line that opens the next <pre>.
+        if text.endswith("\n") and index + 1 < len(segments):
+            out.append(prefix)
+    return "".join(out)
+
+
+class Template:
+    """Markup with ``{{slot}}`` placeholders, parsed once into static runs and slots.
+
+    A slot alone on its line is a block slot: strings, iterables of fragments and renderer
+    callables ``(prefix) -> chunks`` are indented to its column, and empty values drop the line.
+    Inline slots are substituted verbatim.
+    """
+
+    __slots__ = ("pieces", "block_indents", "_static")
+
+    def __init__(self, source: str) -> None:
+        self.pieces: List[Tuple[str, object]] = []
+        self.block_indents: Dict[str, str] = {}
+        self._static: Dict[Tuple[int, str], str] = {}
+        run: List[str] = []
+        for line in dedent(source).strip("\n").split("\n"):
+            block = BLOCK_SLOT_RE.fullmatch(line)
+            if block:
+                self._flush(run)
+                indent, name = block.groups()
+                self.block_indents[name] = indent
+                self.pieces.append(("block", (name, indent)))
+            elif SLOT_RE.search(line):
+                self._flush(run)
+                parts = SLOT_RE.split(line)
+                # split() alternates static text and slot names.
+                self.pieces.append(("line", tuple(parts)))
+            else:
+                run.append(line)
+        self._flush(run)
+
+    def _flush(self, run: List[str]) -> None:
+        if run:
+            self.pieces.append(("text", tuple(run)))
+            run.clear()
+
+    def _static_run(self, index: int, lines: Tuple[str, ...], prefix: str) -> str:
+        key = (index, prefix)
+        text = self._static.get(key)
+        if text is None:
+            text = "".join(f"{prefix}{line}\n" if line else "\n" for line in lines)
+            self._static[key] = text
+        return text
+
+    def iter_render(self, values: Dict[str, object], prefix: str = "") -> Iterator[str]:
+        for index, (kind, data) in enumerate(self.pieces):
+            if kind == "text":
+                yield self._static_run(index, data, prefix)
+            elif kind == "line":
+                line = "".join(
+                    str(values[part]) if position % 2 else part
+                    for position, part in enumerate(data)
+                )
+                yield prefix + line + "\n"
+            else:
+                name, indent = data
+                value = values[name]
+                if callable(value):
+                    yield from value(prefix + indent)
+                elif isinstance(value, str):
+                    if value:
+                        yield indent_fragment(value, prefix + indent) + "\n"
+                else:
+                    for fragment in value:
+                        yield indent_fragment(fragment, prefix + indent) + "\n"
+
+    def render(self, **values: object) -> str:
+        return "".join(self.iter_render(values))[:-1]
+
+
+@lru_cache(maxsize=None)
+def get_template(name: str) -> Template:
+    # Compiled once per process, so watch and batch builds reuse them across rebuilds.
+    return Template(TEMPLATES[name])
+
+
+def render_news_item(item: Dict[str, object]) -> str:
+    return get_template("news_item").render(
+        date=item["date_obj"].strftime("%b %d, %Y"),
+        text=highlight_text(item["text"]),
+    )
+
+
+def news_item_payload(item: Dict[str, object]) -> Dict[str, object]:
+    return {key: value for key, value in item.items() if key != "date_obj"}
+
+
+def iter_news_html(
+    news_items: List[Dict[str, object]], cache: Optional[FragmentCache] = None
+) -> Iterator[str]:
+    for item in news_items:
+        if cache is None:
+            yield render_news_item(item)
+        else:
+            yield cache.render("news", news_item_payload(item), lambda: render_news_item(item))
+
+
+def render_news_items(
+    news_items: List[Dict[str, object]], cache: Optional[FragmentCache] = None
+) -> str:
+    return "\n".join(iter_news_html(news_items, cache))
+
+
+def news_source(sources: Optional[Iterable[Path]] = None) -> Path:
+    sources = list(sources or NEWS_SOURCES)
+    return next((path for path in sources if path.exists()), sources[-1])
+
+
+def iter_news_records(path: Path) -> Iterator[Dict[str, object]]:
+    """Stream raw news items from a JSON array or, for ``.jsonl``, one object per line."""
+    with path.open("r", encoding="utf-8") as fh:
+        if path.suffix in (".jsonl", ".ndjson"):
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from json.load(fh)
+
+
+def with_news_dates(items: List[Dict[str, object]]) -> List[Dict[str, object]]:
+    for item in items:
+        item["date_obj"] = datetime.fromisoformat(item["date"])
+    return items
+
+
+def group_news_by_year(records: Iterable[Dict[str, object]]) -> Dict[str, List[Dict[str, object]]]:
+    years: Dict[str, List[Dict[str, object]]] = {}
+    for item in records:
+        years.setdefault(item["date"][:4], []).append(item)
+    return years
+
+
+class NewsHistory:
+    """Every news item, read in a single pass and bucketed by year in file order."""
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = path or news_source()
+        self.years = group_news_by_year(iter_news_records(self.path))
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self.years.values())
+
+    def latest(self, limit: Optional[int] = None) -> List[Dict[str, object]]:
+        records = (item for items in self.years.values() for item in items)
+        # ISO dates order as strings, so only the items that are returned get parsed.
+        if limit is None:
+            items = sorted(records, key=lambda item: item["date"], reverse=True)
+        else:
+            items = heapq.nlargest(limit, records, key=lambda item: item["date"])
+        return with_news_dates([dict(item) for item in items])
+
+    def year_items(self, year: str) -> List[Dict[str, object]]:
+        return with_news_dates(
+            [dict(item) for item in sorted(self.years[year], key=lambda item: item["date"], reverse=True)]
+        )
+
+
+def load_news(path: Optional[Path] = None, limit: Optional[int] = None) -> List[Dict[str, object]]:
+    return NewsHistory(path).latest(limit)
+
+
+def news_archive_href(year: str) -> str:
+    return f"{NEWS_ARCHIVE_DIR.relative_to(ROOT).as_posix()}/{year}.html"
+
+
+def render_news_archive_page(
+    year: str, items: List[Dict[str, object]], years: List[str], cache: Optional[FragmentCache]
+) -> str:
+    nav = " · ".join(
+        f"<strong>{other}</strong>" if other == year else f'<a href="{news_archive_href(other)}">{other}</a>'
+        for other in years
+    )
+    return get_template("news_archive_page").render(
+        base=Path(os.path.relpath(ROOT, NEWS_ARCHIVE_DIR)).as_posix() + "/",
+        year=year,
+        full_name=f'{PERSON["first_name"]} {PERSON["last_name"]}',
+        stylesheet=STYLESHEET,
+        feed=FEED_PATH.relative_to(ROOT).as_posix(),
+        years=nav,
+        items=iter_news_html(items, cache),
+    ) + "\n"
+
+
+def news_plain_text(item: Dict[str, object]) -> str:
+    return " ".join(unescape(HTML_TAG_RE.sub("", item["text"])).split())
 
 
-def write_index_html(filename: str = "index.html") -> None:
-    html = get_index_html()
-    with open(filename, "w", encoding="utf-8") as fh:
-        fh.write(html)
-    print(f"Wrote {filename}")
+def render_news_feed(items: List[Dict[str, object]]) -> str:
+    entries = []
+    for item in items:
+        title = news_plain_text(item)
+        if len(title) > FEED_TITLE_LENGTH:
+            title = title[: FEED_TITLE_LENGTH - 1].rsplit(" ", 1)[0] + "…"
+        entries.append(
+            get_template("news_feed_entry").render(
+                title=escape(title),
+                link=f"{SITE_URL}{news_archive_href(item['date'][:4])}",
+                id=f"tag:{SITE_URL.split('/')[2]},{item['date']}:{content_hash(item['text'])[:12]}",
+                updated=f"{item['date']}T00:00:00Z",
+                content=escape(item["text"]),
+            )
+        )
+    updated = items[0]["date"] if items else "1970-01-01"
+    return get_template("news_feed").render(
+        site=SITE_URL,
+        feed=f"{SITE_URL}{FEED_PATH.relative_to(ROOT).as_posix()}",
+        title=escape(f'{PERSON["first_name"]} {PERSON["last_name"]}: news'),
+        author=escape(f'{PERSON["first_name"]} {PERSON["last_name"]}'),
+        updated=f"{updated}T00:00:00Z",
+        entries=entries,
+    ) + "\n"
+
+
+def write_news_archive(
+    history: NewsHistory,
+    cache: Optional[FragmentCache] = None,
+    pending: Optional[Dict[Path, Optional[bytes]]] = None,
+    state_path: Optional[Path] = None,
+) -> str:
+    """Write one page per year plus the Atom feed, re-rendering only the years whose items changed."""
+    state_path = state_path or CACHE_DIR / "news_archive.json"
+    try:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        state = {}
+    fingerprint = config_fingerprint()
+    previous = state.get("pages", {}) if state.get("fingerprint") == fingerprint else {}
+    years = sorted(history.years, reverse=True)
+    pages = {}
+    rendered = 0
+    for year in years:
+        digest = content_hash(history.years[year], years, PERSON)
+        path = NEWS_ARCHIVE_DIR / f"{year}.html"
+        pages[year] = digest
+        if previous.get(year) == digest and path.exists():
+            continue
+        rendered += 1
+        write_if_changed(path, render_news_archive_page(year, history.year_items(year), years, cache), pending)
+    for path in NEWS_ARCHIVE_DIR.glob("*.html"):
+        if path.stem not in pages:
+            if pending is not None:
+                pending[path] = None
+            else:
+                path.unlink()
+    feed_items = history.latest(FEED_ITEMS)
+    feed_digest = content_hash([news_item_payload(item) for item in feed_items], PERSON, SITE_URL)
+    if state.get("feed") != feed_digest or previous == {} or not FEED_PATH.exists():
+        write_if_changed(FEED_PATH, render_news_feed(feed_items), pending)
+    if pending is None:
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"fingerprint": fingerprint, "pages": pages, "feed": feed_digest}
+        state_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    return f"News archive: {len(history)} items in {len(years)} years, {rendered} pages rendered"
+
+
+def format_authors(authors: List[Author]) -> str:
+    names = []
+    for author in authors:
+        full = author.name
+        if PERSON["highlight_name"] in full:
+            full = f'<span class="author-self">{full}</span>'
+        names.append(full or "Anonymous")
+    return ", ".join(names)
+
+
+def format_badge(label: Optional[str]) -> str:
+    if not label:
+        return ""
+    variant = label.strip().lower()
+    extra_class = " badge-oral" if variant == "oral" else ""
+    return f'<span class="badge-pill{extra_class}">{label}</span>'
+
+
+def format_artefact_links(pub: Publication) -> str:
+    links = []
+    for field, label in ARTEFACT_LABELS.items():
+        url = pub.artefacts.get(field)
+        if url:
+            links.append(
+                f'<a class="pill-button" href="{url}" target="_blank" rel="noopener">{label}</a>'
+            )
+    return "\n".join(links)
+
+
+def panel_bodies(pub: Publication) -> Dict[str, str]:
+    bodies = {"bibtex": f'<pre class="pub-bibtex"><code>{escape(pub.bibtex)}</code></pre>'}
+    if pub.abstract:
+        bodies["abstract"] = f"<p>{pub.abstract}</p>"
+    return bodies
+
+
+def panel_classes(kind: str) -> str:
+    return "toggle-panel toggle-panel-bib" if kind == "bibtex" else "toggle-panel"
+
+
+def format_toggle(kind: str, slug: str, label: str, classes: str, lazy_panels: bool) -> str:
+    target = f"{kind}-{slug}"
+    if not lazy_panels:
+        return f'<button class="{classes}" data-toggle-target="{target}">{label}</button>'
+    # A real link keeps the panel reachable without JavaScript; the script fetches the JSON instead.
+    shard = f"{PANEL_DIR.relative_to(ROOT).as_posix()}/{slug}"
+    return (
+        f'<a class="{classes}" href="{shard}.html#{target}" data-toggle-target="{target}" '
+        f'data-panel-src="{shard}.json">{label}</a>'
+    )
+
+
+def format_publication(
+    pub: Publication,
+    images: Optional["ResponsiveImages"] = None,
+    lazy_panels: bool = False,
+    authors: Optional[str] = None,
+) -> str:
+    slug = slugify(pub.key)
+    title = pub.title if pub.title is not None else "Untitled"
+    booktitle_raw = pub.booktitle if pub.booktitle is not None else "Preprint"
+    display_text = pub.display if pub.display is not None else booktitle_raw
+    is_preprint = booktitle_raw.strip().lower() == "preprint"
+    year = pub.year
+    badge = format_badge(pub.presentation)
+    if authors is None:
+        authors = format_authors(pub.authors)
+    artefacts = format_artefact_links(pub)
+    bodies = {} if lazy_panels else panel_bodies(pub)
+    panel = get_template("toggle_panel")
+
+    thumb_button = ""
+    abstract_panel = ""
+    if pub.abstract:
+        thumb_button = format_toggle(
+            "abstract", slug, "Abstract", "pill-button thumb-button", lazy_panels
+        )
+        abstract_panel = panel.render(
+            classes=panel_classes("abstract"), panel_id=f"abstract-{slug}", body=bodies.get("abstract", "")
+        )
+
+    img = pub.img if pub.img is not None else "assets/img/publications/placeholder.png"
+    thumbnail = images.picture(img, f"{title} cover", "publication") if images else None
+
+    return get_template("publication_card").render(
+        thumbnail=thumbnail or f'<img src="{img}" alt="{title} cover" loading="lazy">',
+        title=title,
+        thumb_button=thumb_button,
+        venue=highlight_text(f'<span class="venue">{display_text}</span>'),
+        year=f" | {year}" if (year and is_preprint) else "",
+        badge=badge,
+        url=pub.url or "#",
+        authors=authors,
+        artefacts=artefacts,
+        bibtex_button=format_toggle("bibtex", slug, "BibTeX", "pill-button ghost", lazy_panels),
+        abstract_panel=abstract_panel,
+        bibtex_panel=panel.render(
+            classes=panel_classes("bibtex"), panel_id=f"bibtex-{slug}", body=bodies.get("bibtex", "")
+        ),
+    )
+
+
+def write_if_changed(path: Path, text: str, pending: Optional[Dict[Path, Optional[bytes]]] = None) -> bool:
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return False
+    except OSError:
+        pass
+    if pending is not None:
+        pending[path] = text.encode("utf-8")
+    else:
+        write_atomic(path, [text])
+    return True
+
+
+def write_panel_shards(
+    publications: List[Publication],
+    out_dir: Optional[Path] = None,
+    page: Optional[Path] = None,
+    pending: Optional[Dict[Path, Optional[bytes]]] = None,
+) -> str:
+    """Write the abstract/BibTeX panels of every publication as a JSON payload and a no-JS page."""
+    out_dir = out_dir or PANEL_DIR
+    page = page or ROOT / "index.html"
+    stylesheet = Path(os.path.relpath(ROOT / "assets" / "styles.css", out_dir)).as_posix()
+    back = Path(os.path.relpath(page, out_dir)).as_posix() + "#research"
+    panel = get_template("toggle_panel")
+    expected = set()
+    written = 0
+    total_bytes = 0
+    for pub in publications:
+        slug = slugify(pub.key)
+        bodies = panel_bodies(pub)
+        payload = json.dumps(bodies, ensure_ascii=False, separators=(",", ":"))
+        panels = [
+            panel.render(classes=panel_classes(kind) + " is-visible", panel_id=f"{kind}-{slug}", body=body)
+            for kind, body in sorted(bodies.items())
+        ]
+        html = get_template("panel_page").render(
+            title=pub.title or "Untitled", stylesheet=stylesheet, panels=panels, back=back
+        )
+        for name, text in ((f"{slug}.json", payload), (f"{slug}.html", html + "\n")):
+            expected.add(name)
+            written += write_if_changed(out_dir / name, text, pending)
+            total_bytes += len(text.encode("utf-8"))
+    for path in out_dir.glob("*"):
+        # The .gz/.br siblings written by --optimize go with their shard.
+        original = path.with_suffix("") if path.suffix in (".gz", ".br") else path
+        if path.is_file() and original.name not in expected:
+            if pending is not None:
+                pending[path] = None
+            else:
+                path.unlink()
+    return f"Panel shards: {written} written, {len(expected) - written} unchanged, {total_bytes / 1024:.1f} KB"
+
+
+def encode_latex(text: str) -> str:
+    if not LATEX_SPECIAL_RE.search(text):
+        return text
+    out = []
+    eating_space = False
+    for char in text:
+        encoded = LATEX_SPECIAL_CHARS.get(char, char)
+        if eating_space:
+            # A control word swallows the following space, so keep it with "\ ".
+            if encoded.startswith(" "):
+                out.append("\\ ")
+                encoded = encoded[1:]
+            else:
+                out.append(" ")
+        out.append(encoded)
+        eating_space = char == "~"
+    return "".join(out)
+
+
+def quote_bibtex(value: str) -> str:
+    depth = 0
+    for char in value:
+        if char == "{":
+            depth += 1
+        elif char == "}" and depth:
+            depth -= 1
+    if depth:
+        raise ValueError(f"String has unmatched braces: {value}")
+    if '"' not in value:
+        return f'"{value}"'
+    return f"{{{value}}}"
+
+
+def format_bibtex_name(person) -> str:
+    def join(names):
+        return " ".join(name for name in names if name)
+
+    last = " ".join(person.last_names)
+    lineage = " ".join(person.lineage_names)
+    first = " ".join(person.first_names)
+    middle = " ".join(person.middle_names)
+    name = ""
+    if last:
+        name += join([" ".join(person.prelast_names), last])
+    if lineage:
+        name += f", {lineage}"
+    if first or middle:
+        name += ", " + join([first, middle])
+    return name
+
+
+def format_bibtex_entry(
+    entry_key: str, entry, exclude: Tuple[str, ...] = BIBTEX_EXCLUDED_FIELDS
+) -> str:
+    items = [
+        (role, " and ".join(format_bibtex_name(person) for person in persons))
+        for role, persons in entry.persons.items()
+        if persons
+    ]
+    items.extend(entry.fields.items())
+    excluded = {field.lower() for field in exclude}
+    lines = [f"@{entry.original_type}{{{entry_key},"]
+    last_index = len(items) - 1
+    for index, (name, value) in enumerate(items):
+        if name.lower() in excluded:
+            continue
+        # Separators follow the unfiltered field order, matching the historical output.
+        separator = "," if index < last_index else ""
+        lines.append(f"    {name} = {quote_bibtex(encode_latex(value))}{separator}")
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def serialize_bibtex(
+    entries, exclude: Tuple[str, ...] = BIBTEX_EXCLUDED_FIELDS
+) -> Dict[str, str]:
+    return {
+        entry_key: format_bibtex_entry(entry_key, entry, exclude)
+        for entry_key, entry in entries.items()
+    }
+
+
+def publication_from_entry(entry_key: str, entry, bibtex_text: str) -> Publication:
+    fields = entry.fields
+    authors = [
+        Author(" ".join(person.get_part("first")), " ".join(person.get_part("last")))
+        for person in entry.persons.get("author", [])
+    ]
+    return Publication(
+        key=entry_key,
+        entry_type=entry.type,
+        title=fields.get("title"),
+        booktitle=fields.get("booktitle"),
+        display=fields.get("display"),
+        year=fields.get("year"),
+        presentation=fields.get("presentation"),
+        abstract=fields.get("abstract"),
+        img=fields.get("img"),
+        artefacts={field: fields[field] for field in ARTEFACT_LABELS if fields.get(field)},
+        authors=authors,
+        bibtex=bibtex_text,
+    )
+
+
+def parse_publications(path: Path) -> List[Publication]:
+    # pybtex is only imported on a cold build; warm builds load the snapshot instead.
+    from pybtex.database.input import bibtex
+
+    parser = bibtex.Parser()
+    return publications_from_bib_data(parser.parse_file(str(path)))
+
+
+def publications_from_bib_data(bib_data) -> List[Publication]:
+    bibtex_texts = serialize_bibtex(bib_data.entries)
+    return [
+        publication_from_entry(entry_key, entry, bibtex_texts[entry_key])
+        for entry_key, entry in bib_data.entries.items()
+    ]
+
+
+def load_publications(path: Optional[Path] = None, snapshot: Optional[Path] = None) -> List[Publication]:
+    path = path or ROOT / "publication_list.bib"
+    key = content_hash(PUBLICATION_SNAPSHOT_VERSION, source_fingerprint(), path.read_bytes())
+    if snapshot is not None and snapshot.exists():
+        try:
+            with snapshot.open("rb") as fh:
+                data = pickle.load(fh)
+            if data["key"] == key:
+                return [Publication.from_state(state) for state in data["publications"]]
+        except (OSError, pickle.PickleError, EOFError, KeyError, TypeError, ValueError):
+            pass
+    publications = parse_publications(path)
+    if snapshot is not None:
+        snapshot.parent.mkdir(parents=True, exist_ok=True)
+        data = {"key": key, "publications": [pub.to_state() for pub in publications]}
+        with snapshot.open("wb") as fh:
+            pickle.dump(data, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    return publications
+
+
+def split_bib_entries(text: str) -> List[str]:
+    # Entries start at the beginning of a line; an indented one simply stays with its predecessor.
+    # Surrounding whitespace is dropped so the same entry matches across files.
+    head, *rest = text.split("\n@")
+    return [head.strip(), *("@" + chunk.strip() for chunk in rest)]
+
+
+class IncrementalBib:
+    """A bib file kept parsed in memory, re-parsing only the entries whose text changed."""
+
+    def __init__(
+        self, path: Optional[Path] = None, entries: Optional[Dict[str, List[Publication]]] = None
+    ) -> None:
+        self.path = path or ROOT / "publication_list.bib"
+        # Entry text -> its publications; --batch seeds this with the entries of every site.
+        self.entries: Dict[str, List[Publication]] = entries if entries is not None else {}
+        self.parsed = 0
+
+    def parse_chunk(self, chunk: str) -> List[Publication]:
+        from pybtex.database.input import bibtex
+
+        self.parsed += 1
+        return publications_from_bib_data(bibtex.Parser().parse_string(chunk))
+
+    def publications(self) -> List[Publication]:
+        text = self.path.read_text(encoding="utf-8")
+        chunks = split_bib_entries(text)
+        if BIB_MACRO_RE.search(text):
+            # Macros span entries, so files that define them are always parsed as a whole.
+            self.entries = {}
+            return parse_publications(self.path)
+        if not self.entries:
+            # Seed from the snapshot, matching entries to their text by citation key.
+            by_key = {pub.key: pub for pub in load_publications(self.path, CACHE_DIR / "publications.pickle")}
+            for chunk in chunks:
+                keys = BIB_ENTRY_KEY_RE.findall(chunk)
+                if keys and all(key in by_key for key in keys):
+                    self.entries[chunk] = [by_key[key] for key in keys]
+        entries = {}
+        for chunk in chunks:
+            if chunk not in entries:
+                entries[chunk] = self.entries[chunk] if chunk in self.entries else self.parse_chunk(chunk)
+        self.entries = entries
+        return [pub for chunk in chunks for pub in entries[chunk]]
+
+
+def iter_publication_cards(
+    publications: List[Publication],
+    cache: Optional[FragmentCache] = None,
+    images: Optional["ResponsiveImages"] = None,
+    lazy_panels: bool = False,
+) -> Iterator[str]:
+    for pub in publications:
+        if cache is None:
+            yield format_publication(pub, images, lazy_panels)
+            continue
+        # An edited thumbnail keeps its Publication but gets new variant files.
+        image_key = images.cache_key(pub.img) if images else None
+        html = cache.recall("publication", pub, image_key)
+        if html is None:
+            payload = (pub.to_state(), image_key, lazy_panels)
+            html = cache.render(
+                "publication",
+                payload,
+                lambda: format_publication(pub, images, lazy_panels, AUTHORS_PLACEHOLDER),
+                source=pub,
+                stamp=image_key,
+            )
+        yield html.replace(AUTHORS_PLACEHOLDER, format_authors(pub.authors), 1)
+
+
+def build_publications_html(
+    publications: List[Publication], cache: Optional[FragmentCache] = None
+) -> str:
+    return "\n".join(iter_publication_cards(publications, cache))
+
+
+def build_social_html(icons: Optional[Dict[str, str]] = None) -> str:
+    items = []
+    for link in SOCIAL_LINKS:
+        if icon_src := link.get("icon_img"):
+            icon_html = f'<img src="{icon_src}" alt="{link["label"]} icon" loading="lazy">'
+        elif icons and link["icon"] in icons:
+            icon_html = f'<svg class="icon" aria-hidden="true" focusable="false"><use href="#{icons[link["icon"]]}"></use></svg>'
+        else:
+            icon_html = f'<i class="{link["icon"]}"></i>'
+        items.append(
+            f'<a class="social-link" href="{link["url"]}" target="_blank" rel="noopener">{icon_html}<span>{link["label"]}</span></a>'
+        )
+    return "\n".join(items)
+
+
+def build_focus_html() -> str:
+    template = get_template("focus_card")
+    return "\n".join(template.render(title=item["title"], body=item["body"]) for item in FOCUS_AREAS)
+
+
+def structured_data_publication(pub: Publication, person_id: Optional[str] = None) -> Dict[str, object]:
+    # With a *person_id*, the site owner's authorship points at their Person node instead of repeating it.
+    authors = [
+        {"@id": person_id} if person_id and PERSON["highlight_name"] in author.name
+        else {"@type": "Person", "name": author.name}
+        for author in pub.authors
+    ]
+    publication = {
+        "@type": "ScholarlyArticle",
+        "headline": pub.title or "",
+        "author": authors,
+        "publisher": {"@type": "Organization", "name": pub.booktitle or ""},
+    }
+    if year := pub.year:
+        publication["datePublished"] = year
+    if url := pub.url:
+        publication["url"] = url
+    return publication
+
+
+def structured_data_entry(pub: Publication) -> str:
+    # Indented for its place in the "publication" list, as json.dumps(indent=2) would.
+    return indent_fragment(json.dumps(structured_data_publication(pub), ensure_ascii=False, indent=2), "    ")
+
+
+def structured_data_document_path(pub: Publication, person_id: str) -> Path:
+    digest = content_hash(structured_data_publication(pub, person_id))[:10]
+    return STRUCTURED_DATA_DIR / f"{slugify(pub.key)}.{digest}.jsonld"
+
+
+def structured_data_document(pub: Publication, person_id: str) -> str:
+    # Identified by its own URL, which is how the index document refers to it.
+    document_id = f"{SITE_URL}{manifest_key(structured_data_document_path(pub, person_id))}"
+    document = {"@context": "https://schema.org", "@id": document_id}
+    document.update(structured_data_publication(pub, person_id))
+    return json.dumps(document, ensure_ascii=False, separators=(",", ":"))
+
+
+def structured_data_person(person_id: Optional[str] = None) -> Dict[str, object]:
+    person = {"@context": "https://schema.org", "@type": "Person"}
+    if person_id:
+        person["@id"] = person_id
+    person.update({
+        "name": f'{PERSON["first_name"]} {PERSON["last_name"]}',
+        "jobTitle": PERSON["job_title"],
+        "description": PERSON["tagline"],
+        "affiliation": {"@type": "Organization", **PERSON["affiliation"]},
+        "url": SITE_URL.rstrip("/"),
+        "image": f'{SITE_URL}{PERSON["photo"]}',
+        "sameAs": [link["url"] for link in SOCIAL_LINKS if link["url"].startswith("http")],
+        "email": PERSON["email"],
+        "workLocation": {"@type": "Place", "name": PERSON["work_location"]},
+    })
+    return person
+
+
+def build_structured_data(pubs: List[Publication], cache: Optional[FragmentCache] = None) -> str:
+    publications = []
+    for pub in pubs:
+        if cache is None:
+            publications.append(structured_data_entry(pub))
+        else:
+            entry = cache.recall("structured_data", pub) or cache.render(
+                "structured_data", pub.to_state(), lambda: structured_data_entry(pub), source=pub
+            )
+            publications.append(entry)
+    data = {**structured_data_person(), "publication": STRUCTURED_DATA_PLACEHOLDER}
+    listing = "[\n" + ",\n".join(publications) + "\n  ]" if publications else "[]"
+    return json.dumps(data, ensure_ascii=False, indent=2).replace(f'"{STRUCTURED_DATA_PLACEHOLDER}"', listing)
+
+
+def build_structured_data_graph(pubs: List[Publication], cache: Optional[FragmentCache] = None) -> Dict[str, object]:
+    """A compact inline Person record and the publication graph as separate JSON-LD documents.
+
+    Every publication is its own content-addressed document, listed by a small index document
+    that the page links to. Documents past STRUCTURED_DATA_MAX_BYTES are left out.
+    """
+    person_id = f"{SITE_URL}#person"
+    documents: Dict[str, str] = {}
+    links = []
+    size = 0
+    omitted = 0
+    for pub in pubs:
+        if cache is None:
+            text = structured_data_document(pub, person_id)
+        else:
+            text = cache.recall("structured_data_document", pub) or cache.render(
+                "structured_data_document",
+                [pub.to_state(), SITE_URL, PERSON["highlight_name"]],
+                lambda: structured_data_document(pub, person_id),
+                source=pub,
+            )
+        if size + len(text.encode("utf-8")) > STRUCTURED_DATA_MAX_BYTES:
+            omitted += 1
+            continue
+        size += len(text.encode("utf-8"))
+        path = structured_data_document_path(pub, person_id)
+        documents[path.name] = text
+        links.append({"@id": f"{SITE_URL}{manifest_key(path)}"})
+    index = json.dumps(
+        {"@context": "https://schema.org", "@type": "Person", "@id": person_id, "publication": links},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    index_name = f"publications.{content_hash(index)[:10]}.jsonld"
+    documents[index_name] = index
+    return {
+        "inline": json.dumps(structured_data_person(person_id), ensure_ascii=False, separators=(",", ":")),
+        "href": manifest_key(STRUCTURED_DATA_DIR / index_name),
+        "documents": documents,
+        "omitted": omitted,
+    }
+
+
+def write_structured_data(
+    graph: Dict[str, object],
+    out_dir: Optional[Path] = None,
+    pending: Optional[Dict[Path, Optional[bytes]]] = None,
+) -> str:
+    """Write the documents of *graph*; unchanged ones keep their content-addressed files."""
+    out_dir = out_dir or STRUCTURED_DATA_DIR
+    documents = graph["documents"]
+    written = 0
+    for name, text in documents.items():
+        written += write_if_changed(out_dir / name, text + "\n", pending)
+    if out_dir.exists():
+        for path in out_dir.glob("*"):
+            # The .gz/.br siblings written by --optimize go with their document.
+            original = path.with_suffix("") if path.suffix in (".gz", ".br") else path
+            if path.is_file() and original.name not in documents:
+                if pending is not None:
+                    pending[path] = None
+                else:
+                    path.unlink()
+    size = sum(len(text.encode("utf-8")) + 1 for text in documents.values())
+    summary = (
+        f"Structured data: inline {len(graph['inline'].encode('utf-8')) / 1024:.1f} KB, "
+        f"{len(documents)} linked documents {size / 1024:.1f} KB (cap {STRUCTURED_DATA_MAX_BYTES / 1024:.0f} KB), "
+        f"{written} written, {len(documents) - written} unchanged"
+    )
+    if graph["omitted"]:
+        summary += f", {graph['omitted']} publications omitted over the cap"
+    return summary
+
+
+def build_nav_html() -> str:
+    links = "".join(
+        [f'<a href="{item["href"]}">{item["label"]}</a>' for item in NAV_LINKS]
+    )
+    return f'<nav class="site-nav"><div class="brand">{SITE_BRAND}</div><div class="nav-links">{links}</div></nav>'
+
+
+def image_variant_job(
+    source: str, digest: str, widths: Tuple[int, ...], formats: Tuple[str, ...], out_dir: str
+) -> Dict[str, object]:
+    # Runs in a worker process, so it only takes and returns plain data.
+    import base64
+    import io
+
+    from PIL import Image
+
+    with Image.open(source) as original:
+        image = original.convert("RGBA" if "A" in original.getbands() or original.mode == "P" else "RGB")
+    width, height = image.size
+    targets = sorted({w for w in widths if w < width} | {min(width, max(widths))})
+    stem = Path(source).stem
+    variants: Dict[str, List[Tuple[str, int]]] = {fmt: [] for fmt in formats}
+    for target in targets:
+        resized = image if target == width else image.resize(
+            (target, max(1, round(height * target / width))), Image.LANCZOS, reducing_gap=3.0
+        )
+        for fmt in formats:
+            name = f"{stem}-{digest[:10]}-{target}.{fmt}"
+            options = {"quality": 80, "method": 4} if fmt == "webp" else {"quality": 55}
+            resized.save(Path(out_dir) / name, fmt.upper(), **options)
+            variants[fmt].append((name, target))
+    tiny_size = (IMAGE_PLACEHOLDER_WIDTH, max(1, round(height * IMAGE_PLACEHOLDER_WIDTH / width)))
+    tiny = image.resize(tiny_size, Image.BILINEAR, reducing_gap=2.0)
+    buffer = io.BytesIO()
+    tiny.save(buffer, "WEBP", quality=30)
+    placeholder = "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+    return {"width": width, "height": height, "variants": variants, "placeholder": placeholder}
+
+
+class ResponsiveImages:
+    """Resized AVIF/WebP variants and blur placeholders, cached by source content hash."""
+
+    def __init__(
+        self,
+        out_dir: Optional[Path] = None,
+        manifest: Optional[Path] = None,
+        store: Optional["ResponsiveImages"] = None,
+    ) -> None:
+        self.out_dir = out_dir or RESPONSIVE_IMAGE_DIR
+        self.manifest = manifest or CACHE_DIR / "images.json"
+        # --batch: variants already generated into a shared store are linked instead of re-encoded.
+        self.store = store
+        self.entries: Dict[str, Dict[str, object]] = {}
+        self.sources: Dict[str, Dict[str, object]] = {}
+        self.resolved: Dict[str, Tuple[str, Dict[str, object]]] = {}
+        self.generated = 0
+        self.reused = 0
+        if self.manifest.exists():
+            try:
+                data = json.loads(self.manifest.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if data.get("version") == IMAGE_CACHE_VERSION:
+                self.entries = data.get("entries", {})
+                self.sources = data.get("sources", {})
+
+    @staticmethod
+    def formats() -> Tuple[str, ...]:
+        from PIL import features
+
+        return tuple(fmt for fmt in IMAGE_FORMATS if features.check(fmt))
+
+    def prepare(self, requests: Dict[str, str]) -> None:
+        """Make sure every ``src -> profile`` in *requests* has up-to-date variants."""
+        formats = self.formats()
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        jobs = {}
+        for src, profile in requests.items():
+            digest = cached_digest(self.sources, src)
+            if digest is None:
+                continue
+            widths = tuple(IMAGE_PROFILES[profile]["widths"])
+            key = content_hash(digest, widths, formats)
+            info = self.entries.get(key)
+            if info and all(
+                (self.out_dir / name).exists() for files in info["variants"].values() for name, _ in files
+            ):
+                self.reused += 1
+            elif self.store is not None and (info := self.store.link(key, self.out_dir)) is not None:
+                self.entries[key] = info
+                self.reused += 1
+            elif key not in jobs:
+                jobs[key] = (str(ROOT / src), digest, widths, formats, str(self.out_dir))
+            self.resolved[src] = (key, {})
+        if len(jobs) > 1:
+            with ProcessPoolExecutor() as pool:
+                futures = {key: pool.submit(image_variant_job, *job) for key, job in jobs.items()}
+                for key, future in futures.items():
+                    self.entries[key] = future.result()
+        else:
+            for key, job in jobs.items():
+                self.entries[key] = image_variant_job(*job)
+        self.generated += len(jobs)
+        for src, (key, _) in list(self.resolved.items()):
+            self.resolved[src] = (key, self.entries[key])
+
+    def link(self, key: str, out_dir: Path) -> Optional[Dict[str, object]]:
+        """Hard-link (or copy) the variants stored under *key* into *out_dir*."""
+        info = self.entries.get(key)
+        if info is None:
+            return None
+        names = [name for files in info["variants"].values() for name, _ in files]
+        if not all((self.out_dir / name).exists() for name in names):
+            return None
+        for name in names:
+            target = out_dir / name
+            if not target.exists():
+                try:
+                    os.link(self.out_dir / name, target)
+                except OSError:
+                    shutil.copyfile(self.out_dir / name, target)
+        return info
+
+    def cache_key(self, src: Optional[str]) -> Optional[str]:
+        resolved = self.resolved.get(src or "")
+        return resolved[0] if resolved else None
+
+    def picture(self, src: str, alt: str, profile: str, loading: str = "lazy") -> Optional[str]:
+        resolved = self.resolved.get(src)
+        if resolved is None:
+            return None
+        info = resolved[1]
+        sizes = IMAGE_PROFILES[profile]["sizes"]
+        prefix = self.out_dir.relative_to(ROOT).as_posix()
+        lines = ["<picture>"]
+        for fmt in IMAGE_FORMATS:
+            files = info["variants"].get(fmt)
+            if files:
+                srcset = ", ".join(f"{prefix}/{name} {width}w" for name, width in files)
+                lines.append(f'  <source type="image/{fmt}" srcset="{srcset}" sizes="{sizes}">')
+        lines.append(
+            f'  <img src="{src}" alt="{alt}" width="{info["width"]}" height="{info["height"]}" '
+            f'loading="{loading}" decoding="async" '
+            f'style="background-size:cover;background-image:url({info["placeholder"]})" '
+            "onload=\"this.style.backgroundImage='none'\">"
+        )
+        lines.append("</picture>")
+        return "\n".join(lines)
+
+    def save(self) -> None:
+        # Variants no longer referenced by any image are removed along with their manifest entries.
+        keep = {key for key, _ in self.resolved.values()}
+        self.entries = {key: info for key, info in self.entries.items() if key in keep}
+        names = {name for info in self.entries.values() for files in info["variants"].values() for name, _ in files}
+        for path in self.out_dir.glob("*"):
+            if path.is_file() and path.name not in names:
+                path.unlink()
+        self.manifest.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": IMAGE_CACHE_VERSION, "entries": self.entries, "sources": self.sources}
+        self.manifest.write_text(json.dumps(data), encoding="utf-8")
+
+    def summary(self) -> str:
+        return f"Responsive images: {self.generated} generated, {self.reused} reused"
+
+
+def jpeg_dimensions(data: bytes) -> Tuple[int, int]:
+    """Width and height from the frame header of a baseline or progressive JPEG."""
+    index = 2
+    while index + 9 < len(data):
+        marker = data[index + 1]
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            return int.from_bytes(data[index + 7 : index + 9], "big"), int.from_bytes(data[index + 5 : index + 7], "big")
+        index += 2 + int.from_bytes(data[index + 2 : index + 4], "big")
+    raise ValueError("no JPEG frame header")
+
+
+@lru_cache(maxsize=None)
+def slide_renderer() -> Optional[str]:
+    try:
+        import pypdfium2  # noqa: F401
+
+        return "pypdfium2"
+    except ImportError:
+        return "pdftoppm" if shutil.which("pdftoppm") else None
+
+
+def slide_thumbnail_job(source: str, digest: str, out_dir: str) -> Dict[str, object]:
+    # Runs in a worker process, so it only takes and returns plain data.
+    target = Path(out_dir) / f"{Path(source).stem}-{digest[:10]}.jpg"
+    if slide_renderer() == "pypdfium2":
+        import pypdfium2
+
+        page = pypdfium2.PdfDocument(source)[0]
+        image = page.render(scale=SLIDE_THUMBNAIL_WIDTH / page.get_width()).to_pil().convert("RGB")
+        image.save(target, "JPEG", quality=SLIDE_THUMBNAIL_QUALITY, optimize=True, progressive=True)
+    else:
+        subprocess.run(
+            [
+                "pdftoppm", "-f", "1", "-l", "1", "-singlefile", "-jpeg",
+                "-jpegopt", f"quality={SLIDE_THUMBNAIL_QUALITY},progressive=y",
+                "-scale-to-x", str(SLIDE_THUMBNAIL_WIDTH), "-scale-to-y", "-1",
+                source, str(target.with_suffix("")),
+            ],
+            check=True,
+            capture_output=True,
+        )
+    width, height = jpeg_dimensions(target.read_bytes())
+    return {"name": target.name, "width": width, "height": height}
+
+
+def cached_digest(sources: Dict[str, Dict[str, object]], src: str) -> Optional[str]:
+    """Content hash of ``ROOT / src``, recomputed only when its size or mtime changed."""
+    path = ROOT / src
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    known = sources.get(src)
+    if known and known["mtime_ns"] == stat.st_mtime_ns and known["size"] == stat.st_size:
+        return known["digest"]
+    digest = content_hash(path.read_bytes())
+    sources[src] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "digest": digest}
+    return digest
+
+
+class SlideThumbnails:
+    """JPEG previews of the first slide of talk PDFs, cached by the PDF's content hash."""
+
+    def __init__(self, out_dir: Optional[Path] = None, manifest: Optional[Path] = None) -> None:
+        self.out_dir = out_dir or SLIDE_THUMBNAIL_DIR
+        self.manifest = manifest or CACHE_DIR / "slides.json"
+        self.entries: Dict[str, Dict[str, object]] = {}
+        self.sources: Dict[str, Dict[str, object]] = {}
+        self.resolved: Dict[str, Tuple[str, Dict[str, object]]] = {}
+        self.generated = 0
+        self.reused = 0
+        try:
+            data = json.loads(self.manifest.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") == SLIDE_CACHE_VERSION:
+            self.entries = data.get("entries", {})
+            self.sources = data.get("sources", {})
+
+    def prepare(self, sources: Iterable[str]) -> None:
+        renderer = slide_renderer()
+        jobs = {}
+        for src in sources:
+            digest = cached_digest(self.sources, src)
+            if digest is None:
+                continue
+            info = self.entries.get(digest) or self.existing(src, digest)
+            if info and (self.out_dir / info["name"]).exists():
+                self.reused += 1
+                self.entries[digest] = info
+                self.resolved[src] = (digest, info)
+            elif renderer is not None:
+                jobs[digest] = (str(ROOT / src), digest, str(self.out_dir))
+                self.resolved[src] = (digest, {})
+        if jobs:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+        if len(jobs) > 1:
+            with ProcessPoolExecutor() as pool:
+                futures = {digest: pool.submit(slide_thumbnail_job, *job) for digest, job in jobs.items()}
+                for digest, future in futures.items():
+                    self.entries[digest] = future.result()
+        else:
+            for digest, job in jobs.items():
+                self.entries[digest] = slide_thumbnail_job(*job)
+        self.generated += len(jobs)
+        for src, (digest, _) in list(self.resolved.items()):
+            self.resolved[src] = (digest, self.entries[digest])
+
+    def existing(self, src: str, digest: str) -> Optional[Dict[str, object]]:
+        """A preview already on disk for *digest*, e.g. a committed one on a fresh clone without the cache."""
+        path = self.out_dir / f"{Path(src).stem}-{digest[:10]}.jpg"
+        try:
+            width, height = jpeg_dimensions(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        return {"name": path.name, "width": width, "height": height}
+
+    def thumbnail(self, src: Optional[str]) -> Optional[Dict[str, object]]:
+        resolved = self.resolved.get(src or "")
+        if resolved is None:
+            return None
+        prefix = self.out_dir.relative_to(ROOT).as_posix()
+        return {**resolved[1], "src": f"{prefix}/{resolved[1]['name']}"}
+
+    def save(self) -> None:
+        keep = {digest for digest, _ in self.resolved.values()}
+        self.entries = {digest: info for digest, info in self.entries.items() if digest in keep}
+        names = {info["name"] for info in self.entries.values()}
+        # Without a renderer a stale-looking preview cannot be replaced, so none are removed.
+        if self.out_dir.exists() and slide_renderer() is not None:
+            for path in self.out_dir.glob("*"):
+                if path.is_file() and path.name not in names:
+                    path.unlink()
+        self.manifest.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": SLIDE_CACHE_VERSION, "entries": self.entries, "sources": self.sources}
+        self.manifest.write_text(json.dumps(data), encoding="utf-8")
+
+    def summary(self) -> str:
+        if slide_renderer() is None:
+            return "Slide previews: no PDF renderer (install pypdfium2 or poppler's pdftoppm)"
+        return f"Slide previews: {self.generated} generated, {self.reused} reused"
+
+
+def format_file_size(size: int) -> str:
+    if size < 1 << 20:
+        return f"{max(1, round(size / 1024))} KB"
+    return f"{size / (1 << 20):.1f} MB"
+
+
+def local_file_size(src: str) -> Optional[int]:
+    if re.match(r"^(?:[a-z][\w+.-]*:|//)", src, re.IGNORECASE):
+        return None
+    try:
+        return (ROOT / src).stat().st_size
+    except OSError:
+        return None
+
+
+def format_talk(talk: Publication, preview: Optional[Dict[str, object]], sizes: Dict[str, int]) -> str:
+    title = talk.title if talk.title is not None else "Untitled"
+    alt = HTML_TAG_RE.sub("", title)
+    slides = talk.artefacts.get("slides") or talk.url or "#"
+    if talk.img:
+        image = f'<img src="{talk.img}" alt="{alt}" loading="lazy" decoding="async">'
+    elif preview:
+        image = (
+            f'<img src="{preview["src"]}" alt="First slide of {alt}" width="{preview["width"]}" '
+            f'height="{preview["height"]}" loading="lazy" decoding="async">'
+        )
+    else:
+        image = ""
+    links = []
+    for field, label in ARTEFACT_LABELS.items():
+        url = talk.artefacts.get(field)
+        if url:
+            size = sizes.get(field)
+            suffix = Path(urlsplit(url).path).suffix.lstrip(".").upper()
+            detail = f' <span class="file-size">{suffix + " · " if suffix else ""}{format_file_size(size)}</span>' if size else ""
+            links.append(f'<a class="pill-button" href="{url}" target="_blank" rel="noopener">{label}{detail}</a>')
+    return get_template("talk_card").render(
+        thumbnail=f'<a class="talk-thumb" href="{slides}" target="_blank" rel="noopener">{image}</a>' if image else "",
+        venue=highlight_text(f'<span class="venue">{talk.booktitle or ""}</span>'),
+        year=f" | {talk.year}" if talk.year else "",
+        title=title,
+        links="\n".join(links),
+    )
+
+
+def iter_talk_cards(
+    talks: List[Publication], cache: Optional[FragmentCache] = None, slides: Optional[SlideThumbnails] = None
+) -> Iterator[str]:
+    for talk in talks:
+        preview = slides.thumbnail(talk.artefacts.get("slides")) if slides else None
+        sizes = {field: size for field, url in talk.artefacts.items() if (size := local_file_size(url))}
+        if cache is None:
+            yield format_talk(talk, preview, sizes)
+        else:
+            payload = (talk.to_state(), preview, sizes)
+            yield cache.render("talk", payload, lambda: format_talk(talk, preview, sizes), source=None)
+
+
+def load_responsive_images(
+    publications: List[Publication], store: Optional[ResponsiveImages] = None
+) -> Optional[ResponsiveImages]:
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("Pillow is not installed; keeping the original images.")
+        return None
+    images = ResponsiveImages(store=store)
+    requests = {pub.img: "publication" for pub in publications if pub.img}
+    requests[PERSON["photo"]] = "photo"
+    images.prepare(requests)
+    return images
+
+
+def font_awesome_icon(icon_class: str) -> Tuple[str, str]:
+    style, name = "solid", ""
+    for css_class in icon_class.split():
+        if css_class in FONT_AWESOME_STYLES:
+            style = FONT_AWESOME_STYLES[css_class]
+        elif css_class.startswith("fa-"):
+            name = css_class[3:]
+    return style, name
+
+
+def build_icon_sprite(
+    links: List[Dict[str, str]], svg_dir: Path = FONT_AWESOME_SVG_DIR
+) -> Tuple[str, Dict[str, str]]:
+    """Collect the vendored Font Awesome SVGs used by *links* into one hidden ``<symbol>`` sprite."""
+    symbols = []
+    icons: Dict[str, str] = {}
+    for link in links:
+        icon = link.get("icon")
+        if not icon or icon in icons:
+            continue
+        style, name = font_awesome_icon(icon)
+        try:
+            svg = (svg_dir / style / f"{name}.svg").read_text(encoding="utf-8")
+        except OSError:
+            continue
+        root = SVG_ROOT_RE.search(svg)
+        viewbox = VIEWBOX_RE.search(root.group(1)) if root else None
+        if not viewbox:
+            continue
+        body = re.sub(r"<!--.*?-->", "", root.group(2), flags=re.DOTALL).strip()
+        symbol_id = f"icon-{style}-{name}"
+        symbols.append(f'<symbol id="{symbol_id}" viewBox="{viewbox.group(1)}">{body}</symbol>')
+        icons[icon] = symbol_id
+    if not symbols:
+        return "", icons
+    sprite = "\n".join(
+        ['<svg xmlns="http://www.w3.org/2000/svg" aria-hidden="true" style="display:none">']
+        + [f"  {symbol}" for symbol in symbols]
+        + ["</svg>"]
+    )
+    return sprite, icons
+
+
+def font_charset(ctx: "PageContext") -> str:
+    # The visible text of the rendered page and its lazily loaded panels, plus printable ASCII
+    # for text set by scripts (search status, toggle labels).
+    html = "".join(render_section(name, ctx) for name in SECTION_VALUES if name not in ("head", "scripts"))
+    if ctx.lazy_panels:
+        html += "".join(body for pub in ctx.publications for body in panel_bodies(pub).values())
+    chars = set(string.printable)
+    chars.update(unescape(HTML_TAG_RE.sub(" ", STYLE_RE.sub("", SCRIPT_RE.sub("", html)))))
+    return "".join(sorted(char for char in chars if char.isprintable()))
+
+
+def subset_font(
+    text: str, source: Path = FONT_SOURCE, out_dir: Optional[Path] = None
+) -> Optional[Tuple[str, str]]:
+    """Subset the vendored font to *text* as WOFF2; returns its href and CSS weight range."""
+    out_dir = out_dir or FONT_DIR
+    if not source.exists():
+        return None
+    try:
+        import brotli  # noqa: F401
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        print("fontTools and brotli are required to self-host the font; using Google Fonts.")
+        return None
+    data = source.read_bytes()
+    stem = slugify(FONT_FAMILY)
+    target = out_dir / f"{stem}-{content_hash(data, text)[:10]}.woff2"
+    font = TTFont(str(source), lazy=True)
+    weight = str(font["OS/2"].usWeightClass) if "OS/2" in font else "400"
+    if "fvar" in font:
+        for axis in font["fvar"].axes:
+            if axis.axisTag == "wght":
+                weight = f"{axis.minValue:g} {axis.maxValue:g}"
+    font.close()
+    if not target.exists():
+        options = subset.Options()
+        options.flavor = "woff2"
+        options.layout_features = ["*"]
+        font = subset.load_font(str(source), options)
+        font.recalcTimestamp = False
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(text=text)
+        subsetter.subset(font)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
+        os.close(fd)
+        subset.save_font(font, tmp_name, options)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, target)
+        for stale in out_dir.glob(f"{stem}-*.woff2"):
+            if stale != target:
+                stale.unlink()
+    return target.relative_to(ROOT).as_posix(), weight
+
+
+def split_css_blocks(css: str) -> List[Tuple[str, str]]:
+    """Top-level ``(prelude, block)`` pairs of a stylesheet, comments removed."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    blocks = []
+    depth = 0
+    prelude_start = 0
+    block_start = 0
+    prelude = ""
+    for index, char in enumerate(css):
+        if char == "{":
+            if depth == 0:
+                prelude = " ".join(css[prelude_start:index].split())
+                block_start = index + 1
+            depth += 1
+        elif char == "}" and depth:
+            depth -= 1
+            if depth == 0:
+                blocks.append((prelude, css[block_start:index]))
+                prelude_start = index + 1
+    return blocks
+
+
+def css_selector_matches(selector: str, classes: set, tags: set) -> bool:
+    base = CSS_PSEUDO_RE.sub("", selector)
+    if any(css_class not in classes for css_class in re.findall(r"\.([\w-]+)", base)):
+        return False
+    return all(tag.lower() in tags for tag in CSS_TAG_RE.findall(base))
+
+
+def extract_critical_css(css: str, html: str) -> str:
+    """Rules of *css* whose selectors can match something in *html* (the above-the-fold markup)."""
+    classes = {name for attr in re.findall(r'class="([^"]*)"', html) for name in attr.split()}
+    tags = {tag.lower() for tag in re.findall(r"<([a-zA-Z][\w-]*)", html)}
+
+    def select(blocks: List[Tuple[str, str]]) -> List[str]:
+        rules = []
+        for prelude, body in blocks:
+            if prelude.startswith(("@media", "@supports")):
+                inner = select(split_css_blocks(body))
+                if inner:
+                    rules.append(f"{prelude}{{{''.join(inner)}}}")
+            elif prelude.startswith("@"):
+                continue
+            elif any(css_selector_matches(sel, classes, tags) for sel in prelude.split(",")):
+                rules.append(f"{prelude}{{{' '.join(body.split())}}}")
+        return rules
+
+    return "\n".join(select(split_css_blocks(css)))
+
+
+def offline_stylesheets(ctx: "PageContext") -> str:
+    offline = ctx.offline
+    font_face = ""
+    preload_font = ""
+    third_party = []
+    if offline["font"]:
+        href, weight = offline["font"]
+        preload_font = f'<link rel="preload" href="{href}" as="font" type="font/woff2" crossorigin>'
+        font_face = (
+            f'@font-face{{font-family:"{FONT_FAMILY}";font-style:normal;font-weight:{weight};'
+            f'font-display:swap;src:url({href}) format("woff2")}}\n'
+        )
+    else:
+        third_party.append(GOOGLE_FONTS_CSS)
+    if any(link.get("icon") and link["icon"] not in offline["icons"] for link in SOCIAL_LINKS):
+        third_party.append(FONT_AWESOME_CSS)
+    above_fold = '<html><body><div class="page-shell">' + render_section("nav", ctx) + render_section("hero", ctx)
+    critical = extract_critical_css((ROOT / STYLESHEET).read_text(encoding="utf-8"), above_fold)
+    offline["critical_bytes"] = len((font_face + critical).encode("utf-8"))
+    return get_template("offline_stylesheets").render(
+        preload_font=preload_font,
+        # Anything still fetched from a CDN is loaded without blocking the first paint.
+        third_party=[
+            f'<link rel="stylesheet" href="{href}" media="print" onload="this.media=\'all\'">'
+            for href in third_party
+        ],
+        critical_css=font_face + critical,
+        stylesheet=STYLESHEET,
+    )
+
+
+def search_terms(*texts: str) -> str:
+    """Normalised, de-duplicated index terms of *texts*, space separated (mirrored by the query script)."""
+    text = unicodedata.normalize("NFKD", " ".join(texts).lower())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    terms = {term for term in SEARCH_SPLIT_RE.split(text) if len(term) > 1 or term.isdigit()}
+    return " ".join(sorted(terms - SEARCH_STOPWORDS))
+
+
+def publication_search_terms(pub: Publication) -> str:
+    return search_terms(
+        pub.title or "",
+        " ".join(author.name for author in pub.authors),
+        pub.display or pub.booktitle or "",
+        pub.year or "",
+        pub.abstract or "",
+    )
+
+
+def news_search_terms(item: Dict[str, object]) -> str:
+    text = unescape(HTML_TAG_RE.sub(" ", item["text"]))
+    return search_terms(text, item["date"][:4])
+
+
+def build_search_index(
+    publications: List[Publication],
+    news_items: List[Dict[str, object]],
+    cache: Optional[FragmentCache] = None,
+) -> Tuple[str, str]:
+    """Inverted index over the publication cards followed by the news items, in page order."""
+    def terms(kind: str, payload: object, render: Callable[[], str]) -> str:
+        return render() if cache is None else cache.render(kind, payload, render)
+
+    documents = [
+        terms("search_pub", pub.to_state(), lambda pub=pub: publication_search_terms(pub))
+        for pub in publications
+    ]
+    documents += [
+        terms("search_news", news_item_payload(item), lambda item=item: news_search_terms(item))
+        for item in news_items
+    ]
+    postings: Dict[str, List[int]] = {}
+    for doc_id, doc_terms in enumerate(documents):
+        for term in doc_terms.split():
+            postings.setdefault(term, []).append(doc_id)
+    vocabulary = sorted(postings)
+    index = json.dumps(
+        {"terms": vocabulary, "docs": [postings[term] for term in vocabulary], "stopwords": sorted(SEARCH_STOPWORDS)},
+        separators=(",", ":"),
+    ).replace("</", "<\\/")
+    size = len(index.encode("utf-8"))
+    compressed = len(gzip.compress(index.encode("utf-8")))
+    summary = (
+        f"Search index: {len(documents)} documents, {len(vocabulary)} terms, "
+        f"{size / 1024:.1f} KB ({compressed / 1024:.1f} KB gzipped)"
+    )
+    return index, summary
+
+
+class PageContext:
+    """Inputs shared by the page sections, loaded on first use."""
+
+    def __init__(
+        self,
+        cache: Optional[FragmentCache] = None,
+        responsive_images: bool = False,
+        lazy_panels: bool = False,
+        offline_assets: bool = False,
+        search: bool = False,
+        news_limit: Optional[int] = NEWS_HOMEPAGE_ITEMS,
+        bib: Optional[IncrementalBib] = None,
+        image_store: Optional[ResponsiveImages] = None,
+        service_worker: bool = False,
+        external_structured_data: bool = False,
+    ) -> None:
+        self.cache = cache
+        self.service_worker = service_worker
+        self.external_structured_data = external_structured_data
+        self.structured_graph: Optional[Dict[str, object]] = None
+        self.bib = bib
+        self.image_store = image_store
+        self.search = search
+        self.search_summary: Optional[str] = None
+        self.offline_assets = offline_assets
+        self._offline: Optional[Dict[str, object]] = None
+        self.responsive_images = responsive_images
+        self.lazy_panels = lazy_panels
+        self._images: Optional[ResponsiveImages] = None
+        self._publications: Optional[List[Publication]] = None
+        self.news_limit = news_limit
+        self._news_history: Optional[NewsHistory] = None
+        self._news_items: Optional[List[Dict[str, object]]] = None
+        self._talks: Optional[List[Publication]] = None
+        self._slides: Optional[SlideThumbnails] = None
+
+    @property
+    def publications(self) -> List[Publication]:
+        if self._publications is None:
+            if self.bib is not None:
+                self._publications = self.bib.publications()
+            else:
+                snapshot = CACHE_DIR / "publications.pickle" if self.cache is not None else None
+                self._publications = load_publications(snapshot=snapshot)
+        return self._publications
+
+    def reset(self, *inputs: str) -> None:
+        """Forget loaded ``publications``, ``images``, ``news``, ``talks`` and/or ``offline`` assets."""
+        if "publications" in inputs or "images" in inputs:
+            self._images = None
+        if "publications" in inputs:
+            self._publications = None
+        if "offline" in inputs:
+            self._offline = None
+        if "news" in inputs:
+            self._news_history = None
+            self._news_items = None
+        if "talks" in inputs:
+            self._talks = None
+            self._slides = None
+
+    @property
+    def images(self) -> Optional[ResponsiveImages]:
+        if self.responsive_images and self._images is None:
+            self._images = load_responsive_images(self.publications, self.image_store)
+            self.responsive_images = self._images is not None
+        return self._images
+
+    @property
+    def offline(self) -> Optional[Dict[str, object]]:
+        if self.offline_assets and self._offline is None:
+            sprite, icons = build_icon_sprite(SOCIAL_LINKS)
+            # Set before subsetting: the charset comes from sections that render the icons.
+            self._offline = {"sprite": sprite, "icons": icons, "font": None}
+            self._offline["font"] = subset_font(font_charset(self))
+        return self._offline
+
+    @property
+    def talks(self) -> List[Publication]:
+        if self._talks is None:
+            path = ROOT / TALKS_FILE
+            snapshot = CACHE_DIR / "talks.pickle" if self.cache is not None else None
+            self._talks = load_publications(path, snapshot) if path.exists() else []
+        return self._talks
+
+    @property
+    def slides(self) -> Optional[SlideThumbnails]:
+        if self._slides is None and self.talks:
+            self._slides = SlideThumbnails()
+            self._slides.prepare(
+                talk.artefacts["slides"] for talk in self.talks if not talk.img and "slides" in talk.artefacts
+            )
+        return self._slides
+
+    @property
+    def news_history(self) -> NewsHistory:
+        if self._news_history is None:
+            self._news_history = NewsHistory()
+        return self._news_history
+
+    @property
+    def news_items(self) -> List[Dict[str, object]]:
+        if self._news_items is None:
+            self._news_items = self.news_history.latest(self.news_limit)
+        return self._news_items
+
+
+def git_output(*args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(ROOT), *args], capture_output=True, text=True, check=True
+    ).stdout
+
+
+def git_dirty_paths(*pathspecs: str) -> List[Path]:
+    """Absolute paths of *pathspecs* with uncommitted changes, including untracked files."""
+    top = Path(git_output("rev-parse", "--show-toplevel").strip())
+    # -z keeps paths unquoted; entries are "XY path", and renames and copies add their source.
+    fields = iter(git_output("status", "--porcelain", "-z", "--", *pathspecs).split("\0"))
+    paths = []
+    for entry in fields:
+        if not entry:
+            continue
+        paths.append(top / entry[3:])
+        if entry[0] in "RC":
+            next(fields, None)
+    return paths
+
+
+def last_updated(inputs: Iterable[str] = BUILD_INPUTS) -> datetime:
+    """Time of the newest input: its commit time, or its mtime while it has uncommitted edits."""
+    if epoch := os.environ.get("SOURCE_DATE_EPOCH"):
+        return datetime.fromtimestamp(int(epoch), timezone.utc)
+    inputs = list(inputs)
+    timestamps = []
+    try:
+        dirty = git_dirty_paths(*inputs)
+        if committed := git_output("log", "-1", "--format=%ct", "--", *inputs).strip():
+            timestamps.append(float(committed))
+    except (OSError, subprocess.CalledProcessError):
+        dirty = inputs
+    for path in dirty:
+        try:
+            timestamps.append((ROOT / path).stat().st_mtime)
+        except OSError:
+            pass
+    if not timestamps:
+        return datetime.fromtimestamp(0, timezone.utc)
+    return datetime.fromtimestamp(max(timestamps), timezone.utc)
+
+
+def goatcounter_script() -> str:
+    return get_template("goatcounter").render(url=GOATCOUNTER_URL) if GOATCOUNTER_URL else ""
+
+
+def head_values(ctx: PageContext) -> Dict[str, object]:
+    structured_data_link = ""
+    if ctx.external_structured_data:
+        ctx.structured_graph = build_structured_data_graph(ctx.publications, ctx.cache)
+        structured_data = ctx.structured_graph["inline"]
+        structured_data_link = f'<link rel="alternate" type="application/ld+json" href="{ctx.structured_graph["href"]}">'
+    else:
+        structured_data = build_structured_data(ctx.publications, ctx.cache)
+    analytics = ""
+    if GOOGLE_ANALYTICS_ID:
+        analytics = get_template("analytics").render(analytics_id=GOOGLE_ANALYTICS_ID)
+    return {
+        "full_name": f'{PERSON["first_name"]} {PERSON["last_name"]}',
+        "tagline": PERSON["tagline"],
+        "stylesheets": offline_stylesheets(ctx)
+        if ctx.offline
+        else get_template("stylesheets").render(
+            google_fonts_css=GOOGLE_FONTS_CSS, font_awesome_css=FONT_AWESOME_CSS, stylesheet=STYLESHEET
+        ),
+        "feed": FEED_PATH.relative_to(ROOT).as_posix(),
+        "analytics": analytics,
+        "structured_data": structured_data,
+        "structured_data_link": structured_data_link,
+    }
+
+
+def hero_values(ctx: PageContext) -> Dict[str, object]:
+    full_name = f'{PERSON["first_name"]} {PERSON["last_name"]}'
+    photo = ctx.images.picture(PERSON["photo"], full_name, "photo") if ctx.images else None
+    offline = ctx.offline or {}
+    return {
+        "icon_sprite": offline.get("sprite", ""),
+        "location": PERSON["location"],
+        "first_name": PERSON["first_name"],
+        "last_name": PERSON["last_name"],
+        "full_name": f'{PERSON["first_name"]} {PERSON["last_name"]}',
+        "tagline": PERSON["tagline"],
+        "social": build_social_html(offline.get("icons")),
+        "bio": "\n".join([f"<p>{paragraph}</p>" for paragraph in PERSON["bio"]]),
+        "cv": PERSON["cv"],
+        "email": PERSON["email"],
+        "photo": photo or f'<img src="{PERSON["photo"]}" alt="{full_name}" loading="lazy">',
+    }
+
+
+def news_values(ctx: PageContext) -> Dict[str, object]:
+    history = ctx.news_history
+    archive = ""
+    if history.years:
+        feed = FEED_PATH.relative_to(ROOT).as_posix()
+        # Point at the year holding the newest item that did not make it onto the homepage;
+        # when every item is shown there is nothing older to link to, only the feed.
+        older = history.latest(len(ctx.news_items) + 1)[len(ctx.news_items):]
+        if older:
+            archive = get_template("news_archive_link").render(archive=news_archive_href(older[0]["date"][:4]), feed=feed)
+        else:
+            archive = get_template("news_feed_link").render(feed=feed)
+    return {"items": iter_news_html(ctx.news_items, ctx.cache), "archive": archive}
+
+
+def scripts_values(ctx: PageContext) -> Dict[str, object]:
+    values = {
+        "toggles": get_template("lazy_toggle_script" if ctx.lazy_panels else "toggle_script").render(),
+        "search": "",
+        "goatcounter": goatcounter_script(),
+        "service_worker": (
+            get_template("service_worker_register").render(src=SERVICE_WORKER_FILE) if ctx.service_worker else ""
+        ),
+    }
+    if ctx.search:
+        index, ctx.search_summary = build_search_index(ctx.publications, ctx.news_items, ctx.cache)
+        values["search"] = get_template("search_script").render(index=index)
+    return values
+
+
+def talks_values(ctx: PageContext) -> Dict[str, object]:
+    if not ctx.talks:
+        return {"panel": ""}
+    cards = iter_talk_cards(ctx.talks, ctx.cache, ctx.slides)
+    return {"panel": get_template("talks_panel").render(cards=cards)}
+
+
+SECTION_VALUES: Dict[str, Callable[[PageContext], Dict[str, object]]] = {
+    "head": head_values,
+    "nav": lambda ctx: {"nav": build_nav_html()},
+    "hero": hero_values,
+    "focus": lambda ctx: {"cards": build_focus_html()},
+    "news": news_values,
+    "publications": lambda ctx: {
+        "search": get_template("search_box").render() if ctx.search else "",
+        "cards": iter_publication_cards(ctx.publications, ctx.cache, ctx.images, ctx.lazy_panels),
+    },
+    "talks": talks_values,
+    "acknowledgements": lambda ctx: {"body": f"<p>{ACKNOWLEDGEMENT}</p>"},
+    "footer": lambda ctx: {"updated": last_updated().strftime("%b %d, %Y")},
+    "scripts": scripts_values,
+}
+
+
+def iter_section(name: str, ctx: PageContext, prefix: str = "") -> Iterator[str]:
+    yield from get_template(name).iter_render(SECTION_VALUES[name](ctx), prefix)
+
+
+def render_section(name: str, ctx: PageContext) -> str:
+    # Rendered at its indentation within the page, ready to be spliced in by assemble_page().
+    prefix = get_template("page").block_indents[name]
+    return "".join(iter_section(name, ctx, prefix))
+
+
+def render_sections(ctx: PageContext, names: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    return {name: render_section(name, ctx) for name in (names or SECTION_VALUES)}
+
+
+def assemble_page(sections: Dict[str, str]) -> Iterator[str]:
+    values = {name: (lambda prefix, html=html: (html,)) for name, html in sections.items()}
+    return get_template("page").iter_render(values)
+
+
+def iter_index_html(
+    cache: Optional[FragmentCache] = None, ctx: Optional[PageContext] = None
+) -> Iterator[str]:
+    ctx = ctx or PageContext(cache)
+    values = {
+        name: (lambda prefix, name=name: iter_section(name, ctx, prefix)) for name in SECTION_VALUES
+    }
+    yield from get_template("page").iter_render(values)
+
+
+def get_index_html(cache: Optional[FragmentCache] = None) -> str:
+    return "".join(iter_index_html(cache))
+
+
+def write_atomic(path: Path, chunks: Iterable[str]) -> None:
+    # Written next to the target and renamed over it, so readers never see a partial page.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as fh:
+            for chunk in chunks:
+                fh.write(chunk)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def file_digest(path: Path, data: Optional[bytes] = None) -> str:
+    """SHA-256 of the file at *path*, or of *data* when it is still to be written there."""
+    digest = hashlib.sha256()
+    if data is not None:
+        digest.update(data)
+        return digest.hexdigest()
+    with path.open("rb") as fh:
+        for block in iter(lambda: fh.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def manifest_key(path: Path) -> str:
+    return Path(os.path.relpath(path.resolve(), ROOT)).as_posix()
+
+
+def iter_deploy_files(page: Path, compressed: bool = True) -> Iterator[Path]:
+    """The page, the feed, the service worker and everything under the deployed directories, skipping dotfiles."""
+    suffixes = ("", ".gz", ".br") if compressed else ("",)
+    for path in (page, FEED_PATH, ROOT / SERVICE_WORKER_FILE, ROOT / PRECACHE_MANIFEST_FILE):
+        for suffix in suffixes:
+            if (candidate := Path(f"{path}{suffix}")).exists():
+                yield candidate
+    for directory in DEPLOY_DIRS:
+        if not directory.exists():
+            continue
+        for path in sorted(directory.rglob("*")):
+            if path.is_file() and not any(part.startswith(".") for part in path.relative_to(directory).parts):
+                if compressed or path.suffix not in (".gz", ".br"):
+                    yield path
+
+
+def collect_manifest(page: Path, pending: Optional[Dict[Path, Optional[bytes]]] = None) -> Dict[str, str]:
+    """Content hash of every deployable file, with *pending* writes applied on top of the disk."""
+    files = {manifest_key(path): file_digest(path) for path in iter_deploy_files(page)}
+    for path, data in (pending or {}).items():
+        if data is None:
+            files.pop(manifest_key(path), None)
+        else:
+            files[manifest_key(path)] = file_digest(path, data)
+    return dict(sorted(files.items()))
+
+
+def load_manifest(path: Optional[Path] = None) -> Dict[str, str]:
+    path = path or MANIFEST_PATH
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data.get("files", {})
+
+
+def manifest_changes(old: Dict[str, str], new: Dict[str, str]) -> List[str]:
+    return sorted(key for key in old.keys() | new.keys() if old.get(key) != new.get(key))
+
+
+def write_manifest(files: Dict[str, str], path: Optional[Path] = None) -> None:
+    data = {"version": MANIFEST_VERSION, "files": files}
+    write_if_changed(path or MANIFEST_PATH, json.dumps(data, indent=2) + "\n")
+
+
+def minify_css(css: str) -> str:
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = " ".join(css.split())
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def minify_js(script: str) -> str:
+    # Only indentation and blank lines go; keeping the line breaks keeps semicolon insertion intact.
+    return "\n".join(line.strip() for line in script.splitlines() if line.strip())
+
+
+def minify_raw_block(block: str) -> str:
+    open_tag, _, rest = block.partition(">")
+    body, _, close_tag = rest.rpartition("</")
+    if open_tag.lower().startswith("<style"):
+        body = minify_css(body)
+    elif 'type="application/ld+json"' in open_tag:
+        body = json.dumps(json.loads(body), ensure_ascii=False, separators=(",", ":"))
+    else:
+        body = minify_js(body)
+    return f"{open_tag}>{body}</{close_tag}"
+
+
+def minify_html(html: str) -> str:
+    """Collapse whitespace outside ``<pre>``/``<textarea>`` and minify inline CSS, JS and JSON-LD."""
+    out = []
+    for index, part in enumerate(RAW_HTML_BLOCK_RE.split(html)):
+        if index % 2:
+            out.append(part if part[1:4].lower() in ("pre", "tex") else minify_raw_block(part))
+            continue
+        # Neighbouring raw blocks are <pre>, <script>, <style> or <textarea>, so edge whitespace can go.
+        part = re.sub(r"\s+", " ", HTML_COMMENT_RE.sub("", part)).strip()
+        out.append(
+            HTML_GAP_RE.sub(
+                lambda m: m.group(1) if {m.group(2).lower(), m.group(3).lower()} & BLOCK_ELEMENTS else m.group(0),
+                part,
+            )
+        )
+    return "".join(out).strip() + "\n"
+
+
+def fingerprint_name(rel: Path, data: bytes) -> Path:
+    return FINGERPRINT_DIR / rel.parent / f"{rel.stem}.{content_hash(data)[:10]}{rel.suffix}"
+
+
+class AssetFingerprints:
+    """Content-hashed copies of the static assets a page references, under ``assets/dist/``."""
+
+    def __init__(self, pending: Optional[Dict[Path, Optional[bytes]]] = None) -> None:
+        self.pending = pending
+        self.urls: Dict[str, Optional[str]] = {}
+        self.written = 0
+
+    def resolve(self, url: str) -> Optional[str]:
+        if url in self.urls:
+            return self.urls[url]
+        self.urls[url] = None
+        if re.match(r"^(?:[a-z][\w+.-]*:|//|#)", url, re.IGNORECASE) or "?" in url:
+            return None
+        path = (ROOT / url).resolve()
+        asset_dir = (ROOT / "assets").resolve()
+        if path.suffix.lower() not in FINGERPRINT_SUFFIXES or asset_dir not in path.parents:
+            return None
+        if any(generated.resolve() in path.parents for generated in CONTENT_ADDRESSED_DIRS):
+            return None
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        if path.suffix.lower() == ".css":
+            data = minify_css(data.decode("utf-8")).encode("utf-8")
+        target = fingerprint_name(path.relative_to(asset_dir), data)
+        if not target.exists():
+            if self.pending is not None:
+                self.pending[target] = data
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(data)
+                os.chmod(tmp_name, 0o644)
+                os.replace(tmp_name, target)
+            self.written += 1
+        self.urls[url] = target.relative_to(ROOT).as_posix()
+        return self.urls[url]
+
+    def rewrite(self, html: str) -> str:
+        def replace_url(url: str) -> str:
+            return self.resolve(url) or url
+
+        def replace_attr(match: re.Match) -> str:
+            name, value = match.group(1), match.group(2)
+            if name.lower() == "srcset":
+                candidates = [candidate.strip().split(" ", 1) for candidate in value.split(",")]
+                value = ", ".join(" ".join([replace_url(parts[0]), *parts[1:]]) for parts in candidates)
+            else:
+                value = replace_url(value)
+            return f'{name}="{value}"'
+
+        return URL_ATTR_RE.sub(replace_attr, html)
+
+    def prune(self) -> None:
+        keep = {ROOT / url for url in self.urls.values() if url}
+        for path in FINGERPRINT_DIR.rglob("*"):
+            original = path.with_suffix("") if path.suffix in (".gz", ".br") else path
+            if path.is_file() and original not in keep:
+                if self.pending is not None:
+                    self.pending[path] = None
+                else:
+                    path.unlink()
+
+    def summary(self) -> str:
+        used = sum(1 for url in self.urls.values() if url)
+        return f"Fingerprinted assets: {used} referenced, {self.written} new"
+
+
+def compress_job(path: str, formats: Tuple[str, ...]) -> None:
+    data = Path(path).read_bytes()
+    for suffix in formats:
+        if suffix == ".gz":
+            compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        else:
+            import brotli
+
+            compressed = brotli.compress(data, quality=11)
+        target = Path(path + suffix)
+        tmp = target.with_name(f".{target.name}.tmp")
+        tmp.write_bytes(compressed)
+        os.replace(tmp, target)
+
+
+def compressed_formats() -> Tuple[str, ...]:
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        return (".gz",)
+    return (".gz", ".br")
+
+
+def precompress(paths: Iterable[Path], manifest: Optional[Path] = None) -> str:
+    """Write maximum-compression ``.gz``/``.br`` siblings for every file whose content changed."""
+    manifest = manifest or CACHE_DIR / "compressed.json"
+    try:
+        previous = json.loads(manifest.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        previous = {}
+    formats = compressed_formats()
+    hashes = {}
+    jobs = []
+    for path in paths:
+        key = manifest_key(path)
+        hashes[key] = file_digest(path)
+        siblings = [Path(f"{path}{suffix}") for suffix in formats]
+        if previous.get(key) != hashes[key] or not all(sibling.exists() for sibling in siblings):
+            jobs.append(str(path))
+    if len(jobs) > 1:
+        with ProcessPoolExecutor() as pool:
+            list(pool.map(compress_job, jobs, [formats] * len(jobs)))
+    elif jobs:
+        compress_job(jobs[0], formats)
+    manifest.parent.mkdir(parents=True, exist_ok=True)
+    manifest.write_text(json.dumps(hashes, indent=2, sort_keys=True), encoding="utf-8")
+    return f"Precompressed ({'/'.join(formats)}): {len(jobs)} compressed, {len(hashes) - len(jobs)} unchanged"
+
+
+def compressible_outputs(page: Path) -> List[Path]:
+    return [
+        path
+        for path in iter_deploy_files(page, compressed=False)
+        if path == page or path.suffix.lower() in COMPRESSIBLE_SUFFIXES
+    ]
+
+
+def iter_page_links(html: str) -> Iterator[str]:
+    """Every href, src and srcset URL in *html*, skipping preconnect hints (origins, not resources)."""
+    for tag in HTML_TAG_RE.finditer(html):
+        markup = tag.group(0)
+        if markup.startswith("<!--") or LINK_HINT_RE.search(markup):
+            continue
+        for attr, value in URL_ATTR_RE.findall(markup):
+            candidates = [item.split()[0] for item in value.split(",") if item.strip()] if attr == "srcset" else [value]
+            for url in candidates:
+                yield unescape(url).strip()
+
+
+def collect_links(page: Path, pending: Optional[Dict[Path, Optional[bytes]]] = None) -> Dict[str, List[str]]:
+    """Map every checkable link in the generated HTML to the pages that use it.
+
+    Local links come back as paths relative to ROOT (resolved against the page and its ``<base>``);
+    external ones as absolute http(s) URLs. *pending* writes are read instead of the disk.
+    """
+    pending = pending or {}
+    links: Dict[str, List[str]] = {}
+    for path in iter_deploy_files(page, compressed=False):
+        if path.suffix != ".html" or pending.get(path, "") is None:
+            continue
+        html = pending[path].decode("utf-8") if path in pending else path.read_text(encoding="utf-8")
+        name = manifest_key(path)
+        base = urljoin(f"/{name}", match.group(1)) if (match := BASE_HREF_RE.search(html)) else f"/{name}"
+        for url in iter_page_links(html):
+            if not url or url.startswith("#") or LINK_SKIP_RE.match(url):
+                continue
+            if url.startswith("//"):
+                url = f"https:{url}"
+            if not re.match(r"^https?:", url, re.IGNORECASE):
+                url = unquote(urlsplit(urljoin(base, url)).path).lstrip("/")
+            else:
+                url = url.split("#", 1)[0]
+            pages = links.setdefault(url, [])
+            if name not in pages:
+                pages.append(name)
+    return links
+
+
+def precache_entries(page: Path, pending: Optional[Dict[Path, Optional[bytes]]] = None) -> Dict[str, str]:
+    """Short content hash of the page and of what its default rendering loads, up to PRECACHE_MAX_BYTES each.
+
+    That is its stylesheets, scripts, fonts, icons and one image per ``<picture>`` or ``<img>``. Other
+    image variants, pages and documents are cached by the worker when they are first fetched.
+    """
+    digests = collect_manifest(page, pending)
+    pending = pending or {}
+    worker_files = {SERVICE_WORKER_FILE, PRECACHE_MANIFEST_FILE}
+
+    def read(path: Path) -> str:
+        data = pending.get(path)
+        return data.decode("utf-8") if data is not None else path.read_text(encoding="utf-8")
+
+    def local_key(url: str, base: str) -> Optional[str]:
+        if not url or url.startswith(("#", "//")) or LINK_SKIP_RE.match(url):
+            return None
+        if re.match(r"^https?:", url, re.IGNORECASE):
+            return None
+        return unquote(urlsplit(urljoin(base, url)).path).lstrip("/")
+
+    html = read(page)
+    name = manifest_key(page)
+    base = urljoin(f"/{name}", match.group(1)) if (match := BASE_HREF_RE.search(html)) else f"/{name}"
+    keys = {name}
+    for url, category, _ in iter_page_resources(html, default_candidate):
+        if category == "pdfs" or (key := local_key(url, base)) is None:
+            continue
+        keys.add(key)
+        if category == "css" and key in digests:
+            for ref, _, _ in iter_css_resources(read(ROOT / key)):
+                if (ref_key := local_key(ref, f"/{key}")) is not None:
+                    keys.add(ref_key)
+    entries = {}
+    for key in sorted(keys):
+        if key not in digests or key in worker_files:
+            continue
+        path = ROOT / key
+        data = pending.get(path)
+        size = len(data) if data is not None else path.stat().st_size
+        if size <= PRECACHE_MAX_BYTES:
+            entries[key] = digests[key][:PRECACHE_HASH_LENGTH]
+    return entries
+
+
+def load_precache_entries(path: Path) -> Dict[str, str]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))["entries"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def write_service_worker(page: Path, pending: Optional[Dict[Path, Optional[bytes]]] = None) -> str:
+    """Write the precache manifest and a service worker versioned by it.
+
+    Clients re-download only the entries whose hash changed since the version they have; the rest
+    are copied between caches on install.
+    """
+    manifest = ROOT / PRECACHE_MANIFEST_FILE
+    previous = load_precache_entries(manifest)
+    entries = precache_entries(page, pending)
+    version = content_hash(entries)[:12]
+    write_if_changed(manifest, json.dumps({"version": version, "entries": entries}, indent=2) + "\n", pending)
+    worker = get_template("service_worker").render(
+        version=version,
+        manifest=PRECACHE_MANIFEST_FILE,
+        worker=SERVICE_WORKER_FILE,
+        immutable=json.dumps([f"{manifest_key(path)}/" for path in CONTENT_ADDRESSED_DIRS]),
+    )
+    write_if_changed(ROOT / SERVICE_WORKER_FILE, worker + "\n", pending)
+    changed = manifest_changes(previous, entries)
+    size = 0
+    for key in entries:
+        data = (pending or {}).get(ROOT / key)
+        size += len(data) if data is not None else (ROOT / key).stat().st_size
+    return (
+        f"Service worker: version {version}, {len(entries)} precached entries ({size / 1024:.1f} KB), "
+        f"{len(changed)} changed since the last build"
+    )
+
+
+class HostPool:
+    """Keep-alive HTTP/1.1 connections to one origin, at most *limit* of them in use at once."""
+
+    def __init__(self, scheme: str, host: str, port: int, limit: int, timeout: float) -> None:
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.semaphore = asyncio.Semaphore(limit)
+        self.idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self.opened = 0
+
+    async def connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        self.opened += 1
+        tls = ssl.create_default_context() if self.scheme == "https" else None
+        return await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=tls, server_hostname=self.host if tls else None),
+            self.timeout,
+        )
+
+    async def exchange(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, target: str
+    ) -> Tuple[int, Dict[str, str], bool]:
+        host = self.host if self.port in (80, 443) else f"{self.host}:{self.port}"
+        writer.write(
+            f"{method} {target} HTTP/1.1\r\nHost: {host}\r\nUser-Agent: {LINK_USER_AGENT}\r\n"
+            "Accept: */*\r\nConnection: keep-alive\r\n\r\n".encode("latin-1")
+        )
+        await writer.drain()
+        status = "100"
+        # Interim responses (100 Continue, 103 Early Hints) have no body and precede the final one.
+        while status.startswith("1"):
+            status_line = await reader.readline()
+            if not status_line:
+                raise ConnectionResetError("connection closed before the response")
+            version, status = status_line.decode("latin-1").split(None, 2)[:2]
+            headers: Dict[str, str] = {}
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+        keep = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        length = headers.get("content-length")
+        if method == "HEAD" or status in ("204", "304"):
+            pass
+        elif length is not None and length.isdigit() and int(length) <= LINK_MAX_BODY:
+            await reader.readexactly(int(length))
+        else:
+            # Large or chunked bodies are not worth downloading; this connection is not reused.
+            keep = False
+        return int(status), headers, keep
+
+    async def request(self, method: str, target: str) -> Tuple[int, Dict[str, str]]:
+        async with self.semaphore:
+            while True:
+                reused = bool(self.idle)
+                reader, writer = self.idle.pop() if reused else await self.connect()
+                try:
+                    status, headers, keep = await asyncio.wait_for(
+                        self.exchange(reader, writer, method, target), self.timeout
+                    )
+                except asyncio.TimeoutError:
+                    writer.close()
+                    raise
+                except (OSError, asyncio.IncompleteReadError, ValueError):
+                    writer.close()
+                    if reused:
+                        continue  # the server dropped an idle connection; retry on a fresh one
+                    raise
+                if keep:
+                    self.idle.append((reader, writer))
+                else:
+                    writer.close()
+                return status, headers
+
+    def close(self) -> None:
+        for _, writer in self.idle:
+            writer.close()
+        self.idle = []
+
+
+class LinkChecker:
+    """Checks external URLs concurrently, with one connection pool per host and an on-disk TTL cache."""
+
+    def __init__(
+        self,
+        cache_path: Optional[Path] = None,
+        ttl: float = LINK_CACHE_TTL,
+        concurrency: int = LINK_CONCURRENCY,
+        per_host: int = LINK_HOST_CONNECTIONS,
+        timeout: float = LINK_TIMEOUT,
+    ) -> None:
+        self.cache_path = cache_path or CACHE_DIR / "links.json"
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.pools: Dict[Tuple[str, str, int], HostPool] = {}
+        self.cached = 0
+        try:
+            self.results: Dict[str, Dict[str, object]] = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.results = {}
+
+    def pool(self, url: str) -> Tuple[HostPool, str]:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname or "", port)
+        if key not in self.pools:
+            self.pools[key] = HostPool(scheme, key[1], port, self.per_host, self.timeout)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        return self.pools[key], target
+
+    async def fetch(self, url: str) -> Dict[str, object]:
+        for _ in range(LINK_MAX_REDIRECTS + 1):
+            pool, target = self.pool(url)
+            try:
+                status, headers = await pool.request("HEAD", target)
+                if status in (403, 405, 501):
+                    # Some servers refuse HEAD but answer GET.
+                    status, headers = await pool.request("GET", target)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as error:
+                return {"status": None, "error": f"{type(error).__name__}: {error}".rstrip(": ")}
+            if status in (301, 302, 303, 307, 308) and headers.get("location"):
+                url = urljoin(url, headers["location"])
+                continue
+            length = headers.get("content-length", "")
+            return {"status": status, "url": url, "bytes": int(length) if length.isdigit() else None}
+        return {"status": None, "error": "too many redirects"}
+
+    async def check_all(self, urls: Iterable[str]) -> Dict[str, Dict[str, object]]:
+        now = time.time()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results = {}
+        pending = []
+        for url in urls:
+            cached = self.results.get(url)
+            ttl = self.ttl if cached and link_state(cached) != "broken" else LINK_FAILURE_TTL
+            if cached and now - cached["checked"] < ttl:
+                results[url] = cached
+                self.cached += 1
+            else:
+                pending.append(url)
+
+        async def check(url: str) -> None:
+            async with semaphore:
+                results[url] = {**await self.fetch(url), "checked": time.time()}
+
+        try:
+            await asyncio.gather(*(check(url) for url in pending))
+        finally:
+            for pool in self.pools.values():
+                pool.close()
+        self.results.update(results)
+        return results
+
+    def check(self, urls: Iterable[str]) -> Dict[str, Dict[str, object]]:
+        results = asyncio.run(self.check_all(urls))
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(json.dumps(self.results, indent=2, sort_keys=True), encoding="utf-8")
+        return results
+
+
+def link_state(result: Dict[str, object]) -> str:
+    status = result.get("status")
+    if status is None or status in LINK_UNVERIFIABLE_STATUSES:
+        return "unverified" if status else "broken"
+    return "ok" if status < 400 else "broken"
+
+
+def check_links(page: Path, checker: Optional[LinkChecker] = None) -> Tuple[str, List[str]]:
+    """Check every link in the generated pages; returns a report and the broken links."""
+    links = collect_links(page)
+    external = [url for url in links if re.match(r"^https?:", url, re.IGNORECASE)]
+    checker = checker or LinkChecker()
+    results = checker.check(external)
+    broken = []
+    lines = []
+    for url, pages in links.items():
+        if url in results:
+            result = results[url]
+            state = link_state(result)
+            detail = result.get("status") or result.get("error")
+        else:
+            target = ROOT / url
+            state = "ok" if target.is_file() or (target / "index.html").is_file() else "broken"
+            detail = "missing file"
+        if state != "ok":
+            lines.append(f"  {state}: {url} ({detail}) on {', '.join(pages)}")
+        if state == "broken":
+            broken.append(url)
+    connections = sum(pool.opened for pool in checker.pools.values())
+    lines.insert(
+        0,
+        f"Links: {len(links)} checked ({len(links) - len(external)} local, {len(external)} external, "
+        f"{checker.cached} from cache, {connections} connections), {len(broken)} broken",
+    )
+    return "\n".join(lines), broken
+
+
+def tag_attributes(text: str) -> Dict[str, str]:
+    return {name.lower(): unescape(value) for name, value in TAG_ATTR_RE.findall(text)}
+
+
+def iter_css_resources(css: str) -> Iterator[Tuple[str, str, bool]]:
+    for url in CSS_URL_RE.findall(css):
+        category = PAGE_WEIGHT_SUFFIXES.get(Path(urlsplit(url).path).suffix.lower(), "other")
+        yield url, category, category == "fonts"
+
+
+def largest_candidate(srcset: str) -> str:
+    candidates = [item.split() for item in srcset.split(",") if item.strip()]
+    return max(candidates, key=lambda parts: float(parts[1][:-1]) if len(parts) > 1 else 1.0)[0]
+
+
+def default_candidate(srcset: str, sizes: str = "") -> str:
+    """The candidate a 1x display picks for the fallback slot width of *sizes*, else the largest."""
+    slot = re.search(r"(\d+)px\s*$", sizes)
+    widths = sorted(
+        (int(parts[1][:-1]), parts[0])
+        for parts in (item.split() for item in srcset.split(",") if item.strip())
+        if len(parts) > 1 and parts[1].endswith("w")
+    )
+    if not slot or not widths:
+        return largest_candidate(srcset)
+    return next((url for width, url in widths if width >= int(slot.group(1))), widths[-1][1])
+
+
+def iter_page_resources(
+    html: str, candidate: Callable[[str, str], str] = lambda srcset, sizes: largest_candidate(srcset)
+) -> Iterator[Tuple[str, str, bool]]:
+    """``(url, category, critical)`` for every resource *html* loads, plus the PDFs it links to.
+
+    Critical resources are requested before the first render: blocking stylesheets, synchronous
+    scripts, preloads and fonts. Images count one *candidate* (by default the largest) of the first
+    ``<source>`` of their ``<picture>``, else of their own ``srcset``, else their ``src``.
+    """
+    html = NOSCRIPT_RE.sub("", HTML_COMMENT_RE.sub("", html))
+    for match in SCRIPT_RE.finditer(html):
+        attrs = tag_attributes(match.group(1))
+        if attrs.get("src"):
+            blocking = not {"async", "defer"} & attrs.keys() and attrs.get("type") != "module"
+            yield attrs["src"], "js", blocking
+    for match in STYLE_RE.finditer(html):
+        yield from iter_css_resources(match.group(1))
+    in_picture = False
+    for tag in HTML_TAG_RE.finditer(SCRIPT_RE.sub("", html)):
+        name = (tag.group(2) or "").lower()
+        if name == "picture":
+            in_picture = False
+        if tag.group(1) or name not in ("link", "img", "source", "a"):
+            continue
+        attrs = tag_attributes(tag.group(0)[len(name) + 1 : -1])
+        if name == "link" and attrs.get("href"):
+            rel = attrs.get("rel", "").lower().split()
+            if "stylesheet" in rel:
+                yield attrs["href"], "css", attrs.get("media", "all") in ("all", "screen")
+            elif "preload" in rel:
+                yield attrs["href"], PRELOAD_CATEGORIES.get(attrs.get("as", ""), "other"), True
+            elif "icon" in rel:
+                yield attrs["href"], "images", False
+        elif name == "source" and attrs.get("srcset") and not in_picture:
+            in_picture = True
+            yield candidate(attrs["srcset"], attrs.get("sizes", "")), "images", False
+        elif name == "img" and not in_picture and (attrs.get("srcset") or attrs.get("src")):
+            srcset = attrs.get("srcset")
+            yield candidate(srcset, attrs.get("sizes", "")) if srcset else attrs["src"], "images", False
+        elif name == "a" and urlsplit(attrs.get("href", "")).path.lower().endswith(".pdf"):
+            yield attrs["href"], "pdfs", False
+
+
+def iter_duplicate_scripts(html: str) -> Iterator[Tuple[str, int]]:
+    """Scripts included more than once, by ``src`` (scheme-relative) or, for inline ones, by content."""
+    counts: Dict[str, int] = {}
+    for match in SCRIPT_RE.finditer(HTML_COMMENT_RE.sub("", html)):
+        src = tag_attributes(match.group(1)).get("src")
+        body = match.group(2).strip()
+        if src:
+            key = re.sub(r"^(?:https?:)?//", "//", src, flags=re.IGNORECASE)
+        elif body:
+            key = f"inline script {content_hash(body)[:8]} ({len(body.encode('utf-8'))} bytes)"
+        else:
+            continue
+        counts[key] = counts.get(key, 0) + 1
+    for key, count in counts.items():
+        if count > 1:
+            yield key, count
+
+
+def transfer_size(path: Path) -> int:
+    """Bytes on the wire: the smallest precompressed sibling, else gzip for text types, else the file."""
+    sizes = [path.stat().st_size]
+    sizes += [sibling.stat().st_size for suffix in (".gz", ".br") if (sibling := Path(f"{path}{suffix}")).exists()]
+    if len(sizes) == 1 and path.suffix.lower() in COMPRESSIBLE_SUFFIXES:
+        sizes.append(len(gzip.compress(path.read_bytes(), 6)))
+    return min(sizes)
+
+
+def analyze_page_weight(page: Path, checker: Optional[LinkChecker] = None) -> Dict[str, object]:
+    """Transfer weight of *page* and everything it loads, by category, with its critical-path requests.
+
+    Local files are measured on disk; third-party sizes are the Content-Length of a (cached)
+    HEAD request and stay unknown when that fails.
+    """
+    html = page.read_text(encoding="utf-8")
+    name = manifest_key(page)
+    base = urljoin(f"/{name}", match.group(1)) if (match := BASE_HREF_RE.search(html)) else f"/{name}"
+    resources: Dict[str, Dict[str, object]] = {}
+
+    def add(url: str, category: str, critical: bool, base: str) -> Optional[str]:
+        if not url or url.startswith("#") or LINK_SKIP_RE.match(url):
+            return None
+        if url.startswith("//"):
+            url = f"https:{url}"
+        if not re.match(r"^https?:", url, re.IGNORECASE):
+            url = unquote(urlsplit(urljoin(base, url)).path).lstrip("/")
+        entry = resources.setdefault(url, {"url": url, "category": category, "critical": False, "bytes": None})
+        entry["critical"] = entry["critical"] or critical
+        return url
+
+    for url, category, critical in iter_page_resources(html):
+        key = add(url, category, critical, base)
+        if category == "css" and key and (ROOT / key).is_file():
+            css = (ROOT / key).read_text(encoding="utf-8", errors="replace")
+            for ref, ref_category, ref_critical in iter_css_resources(css):
+                add(ref, ref_category, ref_critical, f"/{key}")
+    external = [url for url in resources if re.match(r"^https?:", url, re.IGNORECASE)]
+    results = (checker or LinkChecker()).check(external) if external else {}
+    for url, entry in resources.items():
+        if url in results:
+            entry["bytes"] = results[url].get("bytes") if link_state(results[url]) == "ok" else None
+        elif (ROOT / url).is_file():
+            entry["bytes"] = transfer_size(ROOT / url)
+    categories = {category: {"requests": 0, "bytes": 0} for category in PAGE_WEIGHT_CATEGORIES}
+    categories["html"] = {"requests": 1, "bytes": transfer_size(page)}
+    for entry in resources.values():
+        categories[entry["category"]]["requests"] += 1
+        categories[entry["category"]]["bytes"] += entry["bytes"] or 0
+    loaded = [category for category in PAGE_WEIGHT_CATEGORIES if category != "pdfs"]
+    return {
+        "page": name,
+        "categories": categories,
+        "total_bytes": sum(categories[category]["bytes"] for category in loaded),
+        "requests": sum(categories[category]["requests"] for category in loaded),
+        "critical": [name, *sorted(url for url, entry in resources.items() if entry["critical"])],
+        "duplicate_scripts": dict(iter_duplicate_scripts(html)),
+        "unknown": sorted(url for url, entry in resources.items() if entry["bytes"] is None),
+        "resources": sorted(resources.values(), key=lambda entry: -(entry["bytes"] or 0)),
+    }
+
+
+def over_budget(report: Dict[str, object], budgets: Dict[str, float]) -> List[str]:
+    exceeded = []
+    for key, limit in budgets.items():
+        if key.endswith("_kb"):
+            category = key[: -len("_kb")]
+            value = report["total_bytes"] if category == "total" else report["categories"][category]["bytes"]
+            if value > limit * 1024:
+                exceeded.append(f"{category} {value / 1024:.1f} KB > {limit} KB")
+        elif key == "critical_requests" and len(report["critical"]) > limit:
+            exceeded.append(f"{len(report['critical'])} critical-path requests > {limit}")
+        elif key == "requests" and report["requests"] > limit:
+            exceeded.append(f"{report['requests']} requests > {limit}")
+        elif key == "duplicate_scripts" and len(report["duplicate_scripts"]) > limit:
+            exceeded.append(f"{len(report['duplicate_scripts'])} duplicate scripts > {limit}")
+    return exceeded
+
+
+def format_weight_delta(value: int, previous: Optional[int]) -> str:
+    if previous is None or previous == value:
+        return ""
+    delta = value - previous
+    return f" ({delta:+d} B)" if abs(delta) < 1024 else f" ({delta / 1024:+.1f} KB)"
+
+
+def check_page_weight(
+    page: Path,
+    report_path: Optional[Path] = None,
+    checker: Optional[LinkChecker] = None,
+    budgets: Optional[Dict[str, float]] = None,
+) -> Tuple[str, List[str]]:
+    """Analyze *page*, compare with the previous report and save this one; returns a report and the budgets exceeded.
+
+    *budgets* default to PAGE_WEIGHT_BUDGETS updated with the ``budgets`` of profile.json.
+    """
+    report_path = report_path or CACHE_DIR / "page-weight.json"
+    budgets = budgets if budgets is not None else {**PAGE_WEIGHT_BUDGETS, **PROFILE.get("budgets", {})}
+    try:
+        previous = json.loads(report_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        previous = None
+    report = analyze_page_weight(page, checker)
+    exceeded = over_budget(report, budgets)
+    before = previous["categories"] if previous else {}
+    lines = [
+        f"Page weight of {report['page']}: {report['total_bytes'] / 1024:.1f} KB in {report['requests']} requests, "
+        f"{len(report['critical'])} on the critical path"
+        + format_weight_delta(report["total_bytes"], previous and previous["total_bytes"])
+    ]
+    for category, row in report["categories"].items():
+        if row["requests"]:
+            label = "pdfs (linked)" if category == "pdfs" else category
+            delta = format_weight_delta(row["bytes"], before.get(category, {}).get("bytes"))
+            lines.append(f"  {label:<14}{row['requests']:>4} requests {row['bytes'] / 1024:>9.1f} KB{delta}")
+    loaded = [entry for entry in report["resources"] if entry["bytes"] and entry["category"] != "pdfs"]
+    for entry in loaded[:3]:
+        lines.append(f"  largest: {entry['url']} ({entry['bytes'] / 1024:.1f} KB)")
+    for key, count in report["duplicate_scripts"].items():
+        lines.append(f"  duplicate script ({count}x): {key}")
+    if report["unknown"]:
+        lines.append(f"  unknown size ({len(report['unknown'])}): {', '.join(report['unknown'])}")
+    for line in exceeded:
+        lines.append(f"  over budget: {line}")
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps({**report, "exceeded": exceeded}, indent=2), encoding="utf-8")
+    return "\n".join(lines), exceeded
+
+
+def profile_entry_name(value: object) -> Optional[str]:
+    if isinstance(value, Publication):
+        return value.key
+    if isinstance(value, dict) and "date" in value:
+        return f'{value["date"]} {content_hash(value.get("text", ""))[:8]}'
+    return None
+
+
+class BuildProfiler:
+    """Wall time, allocation peak and call counts per build stage, and render time per entry.
+
+    Used as a context manager: on entry it starts tracemalloc and wraps the module functions in
+    PROFILED_FUNCTIONS; on exit it restores them.
+    """
+
+    def __init__(self, functions: Iterable[str] = PROFILED_FUNCTIONS) -> None:
+        self.functions = tuple(functions)
+        self.originals: Dict[str, Callable] = {}
+        self.stages: List[Dict[str, object]] = []
+        self.calls: Dict[str, List[float]] = {}
+        self.entries: Dict[str, Dict[str, float]] = {}
+        self.output_bytes = 0
+        self.total = 0.0
+        self.peak = 0
+        self.started = 0.0
+
+    def __enter__(self) -> "BuildProfiler":
+        module = sys.modules[__name__]
+        for name in self.functions:
+            self.originals[name] = getattr(module, name)
+            setattr(module, name, self.wrap(name, self.originals[name]))
+        tracemalloc.start()
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.total = time.perf_counter() - self.started
+        tracemalloc.stop()
+        module = sys.modules[__name__]
+        for name, function in self.originals.items():
+            setattr(module, name, function)
+
+    def wrap(self, name: str, function: Callable) -> Callable:
+        stats = self.calls.setdefault(name, [0, 0.0])
+        entries = self.entries.setdefault(name, {})
+
+        @wraps(function)
+        def profiled(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                stats[0] += 1
+                stats[1] += elapsed
+                if args and (entry := profile_entry_name(args[0])):
+                    entries[entry] = entries.get(entry, 0.0) + elapsed
+
+        return profiled
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        counts = {function: stats[0] for function, stats in self.calls.items()}
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            peak = max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+            self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            calls = {
+                function: int(stats[0] - counts[function])
+                for function, stats in self.calls.items()
+                if stats[0] != counts[function]
+            }
+            self.stages.append({"stage": name, "seconds": elapsed, "peak_bytes": peak, "calls": calls})
+
+    def to_dict(self, slowest: int = PROFILE_SLOWEST_ENTRIES) -> Dict[str, object]:
+        return {
+            "version": 1,
+            "total_seconds": self.total,
+            "peak_bytes": self.peak,
+            "output_bytes": self.output_bytes,
+            "stages": self.stages,
+            "calls": {
+                name: {"count": int(count), "seconds": seconds}
+                for name, (count, seconds) in self.calls.items()
+                if count
+            },
+            "slowest_entries": {
+                name: [
+                    {"entry": entry, "seconds": seconds}
+                    for entry, seconds in heapq.nlargest(slowest, entries.items(), key=lambda item: item[1])
+                ]
+                for name, entries in self.entries.items()
+                if entries
+            },
+        }
+
+    def report(self) -> str:
+        data = self.to_dict(slowest=5)
+        lines = [
+            f"Build profile: {data['total_seconds'] * 1000:.1f} ms, peak {data['peak_bytes'] / 2**20:.1f} MB traced, "
+            f"output {data['output_bytes'] / 1024:.1f} KB (timings include tracemalloc overhead)",
+            f"  {'stage':<24} {'time':>10} {'peak':>10}  calls",
+        ]
+        for stage in data["stages"]:
+            calls = ", ".join(f"{name} x{count}" for name, count in stage["calls"].items())
+            lines.append(
+                f"  {stage['stage']:<24} {stage['seconds'] * 1000:>7.1f} ms {stage['peak_bytes'] / 2**20:>7.1f} MB  {calls}"
+            )
+        lines.append(f"  {'function':<24} {'calls':>10} {'total':>10} {'mean':>10}")
+        for name, stats in sorted(data["calls"].items(), key=lambda item: -item[1]["seconds"]):
+            mean = stats["seconds"] / stats["count"] * 1000
+            lines.append(f"  {name:<24} {stats['count']:>10} {stats['seconds'] * 1000:>7.1f} ms {mean:>7.3f} ms")
+        for name, entries in data["slowest_entries"].items():
+            slowest = ", ".join(f"{entry['entry']} ({entry['seconds'] * 1000:.1f} ms)" for entry in entries)
+            lines.append(f"  slowest {name}: {slowest}")
+        return "\n".join(lines)
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+
+def write_index_html(
+    filename: str = "index.html",
+    use_cache: bool = True,
+    responsive_images: bool = False,
+    lazy_panels: bool = False,
+    offline_assets: bool = False,
+    search: bool = False,
+    news_limit: Optional[int] = NEWS_HOMEPAGE_ITEMS,
+    optimize: bool = False,
+    check: bool = False,
+    profiler: Optional[BuildProfiler] = None,
+    cache: Optional[FragmentCache] = None,
+    bib: Optional[IncrementalBib] = None,
+    image_store: Optional[ResponsiveImages] = None,
+    service_worker: bool = False,
+    external_structured_data: bool = False,
+) -> List[str]:
+    """Build the page and its side outputs; returns the manifest entries that changed.
+
+    With *check* nothing is written or removed except new content-addressed image and font files.
+    A *cache* passed in is used but not saved; that is left to its owner.
+    """
+    owns_cache = cache is None and use_cache
+    if owns_cache:
+        cache = FragmentCache()
+    ctx = PageContext(
+        cache,
+        responsive_images=responsive_images,
+        lazy_panels=lazy_panels,
+        offline_assets=offline_assets,
+        search=search,
+        news_limit=news_limit,
+        bib=bib,
+        image_store=image_store,
+        service_worker=service_worker,
+        external_structured_data=external_structured_data,
+    )
+    page = Path(filename)
+    pending: Optional[Dict[Path, Optional[bytes]]] = {} if check else None
+    stage = profiler.stage if profiler is not None else lambda name: nullcontext()
+    chunks: Iterable[str] = iter_index_html(cache, ctx)
+    if profiler is not None:
+        # Sections are rendered up front, one stage each, instead of streaming into the write.
+        with stage("load publications"):
+            ctx.publications
+        with stage("load news"):
+            ctx.news_items
+        sections = {}
+        for name in SECTION_VALUES:
+            with stage(f"section {name}"):
+                sections[name] = render_section(name, ctx)
+        chunks = assemble_page(sections)
+    if optimize:
+        fingerprints = AssetFingerprints(pending)
+        with stage("fingerprint + minify"):
+            chunks = [minify_html(fingerprints.rewrite("".join(chunks)))]
+    with stage("write page"):
+        if check:
+            write_if_changed(page, "".join(chunks), pending)
+        else:
+            write_atomic(page, chunks)
+            print(f"Wrote {filename}")
+    if lazy_panels:
+        with stage("panel shards"):
+            print(write_panel_shards(ctx.publications, page=page.resolve(), pending=pending))
+    with stage("news archive"):
+        print(write_news_archive(ctx.news_history, cache, pending))
+    if ctx.structured_graph is not None:
+        with stage("structured data"):
+            print(write_structured_data(ctx.structured_graph, pending=pending))
+    if optimize:
+        fingerprints.prune()
+        print(fingerprints.summary())
+    if cache is not None:
+        if owns_cache:
+            with stage("save caches"):
+                cache.save()
+        print(cache.summary())
+    if ctx.search_summary:
+        print(ctx.search_summary)
+    if ctx.images is not None:
+        if not check:
+            ctx.images.save()
+        print(ctx.images.summary())
+    if ctx.slides is not None:
+        if not check:
+            ctx.slides.save()
+        print(ctx.slides.summary())
+    if ctx.offline is not None:
+        icons = sum(1 for link in SOCIAL_LINKS if link.get("icon"))
+        font = ctx.offline["font"][0] if ctx.offline["font"] else "Google Fonts (no vendored font)"
+        print(
+            f"Offline assets: {len(ctx.offline['icons'])}/{icons} icons inlined, font {font}, "
+            f"critical CSS {ctx.offline['critical_bytes'] / 1024:.1f} KB"
+        )
+    if service_worker:
+        with stage("service worker"):
+            print(write_service_worker(page, pending))
+    if optimize and not check:
+        with stage("precompress"):
+            print(precompress(compressible_outputs(page)))
+    with stage("manifest"):
+        files = collect_manifest(page, pending)
+        changed = manifest_changes(load_manifest(), files)
+        if not check:
+            write_manifest(files)
+    print(f"Manifest: {len(files)} files, {len(changed)} changed")
+    if profiler is not None and page.exists():
+        profiler.output_bytes = page.stat().st_size
+    return changed
+
+
+class LiveReload:
+    """Fans reload messages out to the browsers connected to the dev server's event stream."""
+
+    def __init__(self) -> None:
+        self.generation = str(time.time_ns())
+        self.clients: List[queue.Queue] = []
+        self.lock = threading.Lock()
+
+    def subscribe(self) -> queue.Queue:
+        client: queue.Queue = queue.Queue()
+        with self.lock:
+            self.clients.append(client)
+        return client
+
+    def unsubscribe(self, client: queue.Queue) -> None:
+        with self.lock:
+            self.clients.remove(client)
+
+    def publish(self, message: str) -> None:
+        with self.lock:
+            for client in self.clients:
+                client.put(message)
+
+
+def make_dev_handler(live: LiveReload, service_worker: bool = False) -> type:
+    snippet = get_template("live_reload").render(path=LIVE_RELOAD_PATH).encode("utf-8")
+
+    class DevRequestHandler(SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, directory=str(ROOT), **kwargs)
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+        def end_headers(self) -> None:
+            self.send_header("Cache-Control", "no-store")
+            super().end_headers()
+
+        def do_GET(self) -> None:
+            url = self.path.split("?", 1)[0]
+            if url == LIVE_RELOAD_PATH:
+                self.stream_events()
+                return
+            if url == f"/{SERVICE_WORKER_FILE}" and not service_worker:
+                # A 404 makes browsers drop a worker registered by a deployed build of this origin.
+                self.send_error(404)
+                return
+            path = Path(self.translate_path(url))
+            if path.is_dir() and url.endswith("/"):
+                path = path / "index.html"
+            if path.suffix != ".html" or not path.is_file():
+                super().do_GET()
+                return
+            html = path.read_bytes()
+            body_end = html.rfind(b"</body>")
+            html = html[:body_end] + snippet + html[body_end:] if body_end >= 0 else html + snippet
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(html)))
+            self.end_headers()
+            self.wfile.write(html)
+
+        def stream_events(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            client = live.subscribe()
+            try:
+                message = f"hello {live.generation}"
+                while True:
+                    self.wfile.write(f"data: {message}\n\n".encode("utf-8") if message else b": ping\n\n")
+                    self.wfile.flush()
+                    try:
+                        message = client.get(timeout=15)
+                    except queue.Empty:
+                        message = None
+            except OSError:
+                pass
+            finally:
+                live.unsubscribe(client)
+
+    return DevRequestHandler
+
+
+def watched_files() -> Dict[Path, Tuple[int, int]]:
+    paths = [ROOT / name for name in WATCH_FILES]
+    for path in [*(ROOT / "assets").rglob("*"), *VENDOR_DIR.rglob("*")]:
+        # Build outputs live under assets/ too; watching them would retrigger every rebuild.
+        if path.suffix in (".gz", ".br", ".tmp") or any(
+            directory in path.parents for directory in CONTENT_ADDRESSED_DIRS
+        ):
+            continue
+        paths.append(path)
+    stats = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        if not path.is_dir():
+            stats[path] = (stat.st_mtime_ns, stat.st_size)
+    return stats
+
+
+class DevSession:
+    """Sections of the page kept in memory by ``--watch``, re-rendered when their inputs change."""
+
+    def __init__(self, page: Path, optimize: bool = False, **options) -> None:
+        self.page = page
+        self.optimize = optimize
+        self.cache = FragmentCache()
+        self.ctx = PageContext(self.cache, bib=IncrementalBib(), **options)
+        self.sections = render_sections(self.ctx)
+        self.write(set(SECTION_VALUES))
+
+    def write(self, names: set) -> None:
+        html = "".join(assemble_page(self.sections))
+        if self.optimize:
+            fingerprints = AssetFingerprints()
+            html = minify_html(fingerprints.rewrite(html))
+        write_atomic(self.page, [html])
+        if "news" in names:
+            write_news_archive(self.ctx.news_history, self.cache)
+        if "publications" in names and self.ctx.lazy_panels:
+            write_panel_shards(self.ctx.publications, page=self.page.resolve())
+        if "head" in names and self.ctx.structured_graph is not None:
+            write_structured_data(self.ctx.structured_graph)
+        if {"hero", "publications"} & names and self.ctx.images is not None:
+            self.ctx.images.save()
+        if "talks" in names and self.ctx.slides is not None:
+            self.ctx.slides.save()
+        if self.optimize:
+            fingerprints.prune()
+        if self.ctx.service_worker:
+            write_service_worker(self.page)
+
+    def update(self, changed: Iterable[Path]) -> Optional[str]:
+        """Re-render the sections that depend on *changed*; returns the live-reload message."""
+        names = set()
+        inputs = set()
+        message = None
+        # Any asset edit renames its fingerprinted copy and changes the precache manifest.
+        rewrite = self.optimize or self.ctx.service_worker
+        images = {PERSON["photo"], *(pub.img for pub in self.ctx.publications if pub.img)}
+        for path in changed:
+            rel = path.relative_to(ROOT).as_posix()
+            if rel in ("build.py", PROFILE_FILE):
+                return "restart"
+            if rel in BUILD_INPUTS:
+                names.add("footer")
+            if rel == STYLESHEET and not (self.ctx.offline_assets or rewrite):
+                message = message or "css"
+                continue
+            message = "reload"
+            names.update(WATCH_SECTIONS.get(rel, ("head",) if rel == STYLESHEET else ()))
+            if rel in WATCH_INPUTS:
+                inputs.add(WATCH_INPUTS[rel])
+            elif rel in images and self.ctx.responsive_images:
+                inputs.add("images")
+                names.update(("hero", "publications"))
+            elif rel.startswith("assets/talks/"):
+                inputs.add("talks")
+                names.add("talks")
+            elif VENDOR_DIR in path.parents and self.ctx.offline_assets:
+                inputs.add("offline")
+                names.update(("head", "hero"))
+        if self.ctx.offline_assets and names - {"head", "scripts", "footer"}:
+            # The self-hosted font is subset to the text of the page.
+            inputs.add("offline")
+            names.add("head")
+        if not names and not (rewrite and message):
+            return message
+        self.ctx.reset(*inputs)
+        for name in names:
+            self.sections[name] = render_section(name, self.ctx)
+        self.write(names)
+        return message
+
+
+def run_dev(
+    filename: str,
+    watch: bool = True,
+    serve: bool = True,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    **options,
+) -> None:
+    # Warm the pybtex import in the background so the first bib edit does not pay for it.
+    threading.Thread(target=lambda: __import__("pybtex.database.input.bibtex"), daemon=True).start()
+    page = Path(filename)
+    start = time.perf_counter()
+    session = DevSession(page, **options)
+    print(f"Wrote {filename} in {(time.perf_counter() - start) * 1000:.0f} ms")
+    live = LiveReload()
+    server = None
+    if serve:
+        server = ThreadingHTTPServer((host, port), make_dev_handler(live, session.ctx.service_worker))
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"Serving {ROOT} at http://{host}:{server.server_address[1]}/")
+    stats = watched_files()
+    try:
+        if not watch:
+            threading.Event().wait()
+        print("Watching for changes (Ctrl+C to stop)")
+        while True:
+            time.sleep(WATCH_INTERVAL)
+            current = watched_files()
+            changed = [path for path in current.keys() | stats.keys() if current.get(path) != stats.get(path)]
+            stats = current
+            if not changed:
+                continue
+            start = time.perf_counter()
+            try:
+                message = session.update(changed)
+            except Exception as error:  # keep watching; the next save usually fixes it
+                print(f"Rebuild failed: {type(error).__name__}: {error}")
+                continue
+            if message == "restart":
+                print("build.py or profile.json changed; restarting")
+                session.cache.save()
+                if server is not None:
+                    server.server_close()
+                os.execv(sys.executable, [sys.executable, *sys.argv])
+            elapsed = (time.perf_counter() - start) * 1000
+            names = ", ".join(sorted(path.relative_to(ROOT).as_posix() for path in changed))
+            print(f"{names}: rebuilt in {elapsed:.1f} ms")
+            if message:
+                live.publish(message)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        session.cache.save()
+        if server is not None:
+            server.shutdown()
+
+
+def configure_site(root: Path) -> None:
+    """Point this process at the site in *root*: its profile.json, inputs, outputs and build cache."""
+    global ROOT, CACHE_DIR, PANEL_DIR, FINGERPRINT_DIR, RESPONSIVE_IMAGE_DIR, FONT_DIR, SLIDE_THUMBNAIL_DIR
+    global STRUCTURED_DATA_DIR
+    global CONTENT_ADDRESSED_DIRS
+    global MANIFEST_PATH, NEWS_SOURCES, NEWS_ARCHIVE_DIR, FEED_PATH, DEPLOY_DIRS
+    global PROFILE, SITE_URL, GOOGLE_ANALYTICS_ID, GOATCOUNTER_URL, SITE_BRAND, PERSON
+    global SOCIAL_LINKS, FOCUS_AREAS, NAV_LINKS, ACKNOWLEDGEMENT
+    ROOT = root.resolve()
+    CACHE_DIR = ROOT / ".build_cache"
+    PANEL_DIR = ROOT / "assets" / "panels"
+    FINGERPRINT_DIR = ROOT / "assets" / "dist"
+    RESPONSIVE_IMAGE_DIR = ROOT / "assets" / "img" / "responsive"
+    FONT_DIR = ROOT / "assets" / "fonts"
+    SLIDE_THUMBNAIL_DIR = ROOT / "assets" / "img" / "slides"
+    STRUCTURED_DATA_DIR = ROOT / "assets" / "jsonld"
+    CONTENT_ADDRESSED_DIRS = (
+        FINGERPRINT_DIR, RESPONSIVE_IMAGE_DIR, FONT_DIR, PANEL_DIR, SLIDE_THUMBNAIL_DIR, STRUCTURED_DATA_DIR
+    )
+    MANIFEST_PATH = ROOT / "build-manifest.json"
+    NEWS_SOURCES = (ROOT / "news.jsonl", ROOT / "news.json")
+    NEWS_ARCHIVE_DIR = ROOT / "news"
+    FEED_PATH = ROOT / "feed.xml"
+    DEPLOY_DIRS = (ROOT / "assets", NEWS_ARCHIVE_DIR)
+    PROFILE = json.loads((ROOT / PROFILE_FILE).read_text(encoding="utf-8"))
+    SITE_URL = PROFILE["site_url"]
+    GOOGLE_ANALYTICS_ID = PROFILE.get("google_analytics_id")
+    GOATCOUNTER_URL = PROFILE.get("goatcounter")
+    SITE_BRAND = PROFILE["brand"]
+    PERSON = PROFILE["person"]
+    SOCIAL_LINKS = PROFILE["social_links"]
+    FOCUS_AREAS = PROFILE["focus_areas"]
+    NAV_LINKS = PROFILE["nav_links"]
+    ACKNOWLEDGEMENT = "\n".join(PROFILE["acknowledgement"])
+
+
+def batch_sites(directory: Path) -> List[Path]:
+    return sorted(path.parent for path in directory.glob(f"*/{PROFILE_FILE}"))
+
+
+def load_batch_entries(path: Path) -> Dict[str, List[Tuple[object, ...]]]:
+    """Bib entry text -> publication states, shared by every site of a batch."""
+    try:
+        with path.open("rb") as fh:
+            data = pickle.load(fh)
+    except (OSError, pickle.PickleError, EOFError):
+        return {}
+    if data.get("key") != content_hash(PUBLICATION_SNAPSHOT_VERSION, source_fingerprint()):
+        return {}
+    return data["entries"]
+
+
+def save_batch_entries(path: Path, entries: Dict[str, List[Tuple[object, ...]]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"key": content_hash(PUBLICATION_SNAPSHOT_VERSION, source_fingerprint()), "entries": entries}
+    with path.open("wb") as fh:
+        pickle.dump(data, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def batch_entries_job(chunks: List[str], lazy_panels: bool, render: bool) -> Tuple[Dict, Dict[str, str]]:
+    """Parse bib entries new to the batch and render their cards; runs in a worker process."""
+    from pybtex.database.input import bibtex
+
+    entries = {}
+    cache = FragmentCache(fragments={})
+    for chunk in chunks:
+        publications = publications_from_bib_data(bibtex.Parser().parse_string(chunk))
+        entries[chunk] = [pub.to_state() for pub in publications]
+        if render:
+            for _ in iter_publication_cards(publications, cache, lazy_panels=lazy_panels):
+                pass
+            build_structured_data(publications, cache)
+    return entries, cache.used
+
+
+BATCH_STATE: Dict[str, object] = {}
+
+
+def init_batch_worker(store: str) -> None:
+    # Loaded once per worker process, then shared by every site that worker builds.
+    store_dir = Path(store)
+    entries = load_batch_entries(store_dir / "bib_entries.pickle")
+    BATCH_STATE["entries"] = {
+        chunk: [Publication.from_state(state) for state in states] for chunk, states in entries.items()
+    }
+    BATCH_STATE["fragments"] = FragmentCache(store_dir / "fragments.json").fragments
+    images = store_dir / "images.json"
+    BATCH_STATE["images"] = ResponsiveImages(store_dir / "images", images) if images.exists() else None
+
+
+def build_site_job(root: str, options: Dict[str, object]) -> Dict[str, object]:
+    """Build one site of a batch against the shared caches; runs in a worker process."""
+    configure_site(Path(root))
+    fragments = BATCH_STATE["fragments"]
+    cache = FragmentCache(fragments=fragments)
+    bib = IncrementalBib(entries=BATCH_STATE["entries"])
+    log = io.StringIO()
+    with redirect_stdout(log):
+        changed = write_index_html(
+            str(ROOT / "index.html"), cache=cache, bib=bib, image_store=BATCH_STATE["images"], **options
+        )
+    return {
+        "root": root,
+        "log": log.getvalue(),
+        "changed": changed,
+        "used": list(cache.used),
+        "rendered": {key: html for key, html in cache.used.items() if key not in fragments},
+        "parsed": bib.parsed,
+    }
+
+
+def build_batch(directory: Path, jobs: Optional[int] = None, **options) -> List[str]:
+    """Build every ``<directory>/<site>/profile.json`` site in a process pool.
+
+    Bib entries, publication cards and image variants are shared between sites through
+    ``<directory>/.build_cache/``, so papers listed by several people are parsed and rendered once.
+    Returns the changed manifest entries of all sites, prefixed with the site name.
+    """
+    start = time.perf_counter()
+    store = directory.resolve() / ".build_cache"
+    sites = batch_sites(directory)
+    entries = load_batch_entries(store / "bib_entries.pickle")
+    cache = FragmentCache(store / "fragments.json")
+    site_chunks = {}
+    for root in sites:
+        bib = root / "publication_list.bib"
+        text = bib.read_text(encoding="utf-8") if bib.exists() else ""
+        # Files with @string macros are parsed whole by their own site.
+        site_chunks[root] = [] if BIB_MACRO_RE.search(text) else split_bib_entries(text)
+    unique = list(dict.fromkeys(chunk for chunks in site_chunks.values() for chunk in chunks))
+    missing = [chunk for chunk in unique if chunk not in entries]
+    workers = jobs or os.cpu_count() or 1
+    render = not options.get("responsive_images")
+    if missing:
+        size = -(-len(missing) // workers)
+        with ProcessPoolExecutor(workers) as pool:
+            futures = [
+                pool.submit(batch_entries_job, missing[index : index + size], options.get("lazy_panels", False), render)
+                for index in range(0, len(missing), size)
+            ]
+            for future in futures:
+                parsed, rendered = future.result()
+                entries.update(parsed)
+                cache.fragments.update(rendered)
+    entries = {chunk: entries[chunk] for chunk in unique}
+    save_batch_entries(store / "bib_entries.pickle", entries)
+    cache.used = dict(cache.fragments)
+    cache.save()
+    if options.get("responsive_images") and importlib.util.find_spec("PIL") is not None:
+        # Variants for every site are encoded once, into the store, and linked into each site.
+        images = ResponsiveImages(store / "images", store / "images.json")
+        requests = {}
+        for root in sites:
+            profile = json.loads((root / PROFILE_FILE).read_text(encoding="utf-8"))
+            requests[str(root / profile["person"]["photo"])] = "photo"
+            for chunk in site_chunks[root]:
+                for state in entries[chunk]:
+                    pub = Publication.from_state(state)
+                    if pub.img:
+                        requests.setdefault(str(root / pub.img), "publication")
+        images.prepare(requests)
+        images.save()
+        print(images.summary())
+    changed = []
+    used = set()
+    rendered = {}
+    with ProcessPoolExecutor(workers, initializer=init_batch_worker, initargs=(str(store),)) as pool:
+        futures = [pool.submit(build_site_job, str(root), options) for root in sites]
+        for future in futures:
+            result = future.result()
+            name = Path(result["root"]).name
+            print(f"[{name}]")
+            print(result["log"], end="")
+            changed.extend(f"{name}/{entry}" for entry in result["changed"])
+            used.update(result["used"])
+            rendered.update(result["rendered"])
+    fragments = {**cache.fragments, **rendered}
+    cache.used = {key: fragments[key] for key in used if key in fragments}
+    cache.save()
+    elapsed = time.perf_counter() - start
+    print(
+        f"Batch: {len(sites)} sites, {len(unique)} unique bib entries ({len(missing)} parsed), "
+        f"{len(cache.used)} shared fragments, {elapsed:.2f} s"
+    )
+    return changed
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build the static index.html.")
+    parser.add_argument("--output", default="index.html", help="Path of the generated page.")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse the bib file, re-render every fragment and leave the build cache untouched.",
+    )
+    parser.add_argument(
+        "--responsive-images",
+        action="store_true",
+        help="Generate resized AVIF/WebP variants and blur placeholders (requires Pillow).",
+    )
+    parser.add_argument(
+        "--lazy-panels",
+        action="store_true",
+        help="Move abstracts and BibTeX into per-publication files that load on first click.",
+    )
+    parser.add_argument(
+        "--offline-assets",
+        action="store_true",
+        help="Inline an SVG icon sprite, a subset self-hosted font and the critical CSS from vendor/.",
+    )
+    parser.add_argument(
+        "--search",
+        action="store_true",
+        help="Embed a prebuilt search index and a filter box for publications and news.",
+    )
+    parser.add_argument(
+        "--news-limit",
+        type=int,
+        default=NEWS_HOMEPAGE_ITEMS,
+        help="News items shown on the homepage; 0 shows all. Every item is also in news/<year>.html.",
+    )
+    parser.add_argument(
+        "--optimize",
+        action="store_true",
+        help="Fingerprint static assets, minify the page and write .gz/.br siblings of text outputs.",
+    )
+    parser.add_argument(
+        "--service-worker",
+        action="store_true",
+        help="Emit sw.js and precache-manifest.json: cache-first assets, stale-while-revalidate HTML.",
+    )
+    parser.add_argument(
+        "--external-structured-data",
+        action="store_true",
+        help="Inline only a compact Person JSON-LD record and link the publications as separate documents.",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=str(CACHE_DIR / "profile.json"),
+        metavar="JSON",
+        help="Report time, allocation peak and call counts per stage and entry; also saved as JSON.",
+    )
+    parser.add_argument(
+        "--check-links",
+        action="store_true",
+        help="After building, check every local and external link in the generated pages.",
+    )
+    parser.add_argument(
+        "--budget",
+        nargs="?",
+        const=str(CACHE_DIR / "page-weight.json"),
+        metavar="JSON",
+        help="After building, report the page weight and fail if a budget in profile.json is exceeded; "
+        "the report is saved as JSON and compared with the previous one.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and rebuild the sections whose inputs change.",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Serve the site locally with live reload (combine with --watch).",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Address for --serve.")
+    parser.add_argument("--port", type=int, default=8000, help="Port for --serve.")
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        metavar="DIR",
+        help="Build every DIR/<site>/profile.json site in parallel, sharing one cache in DIR/.build_cache.",
+    )
+    parser.add_argument("--jobs", type=int, help="Worker processes for --batch (default: one per CPU).")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Write nothing; exit with status 1 if a build would change any file in the manifest.",
+    )
+    return parser.parse_args(argv)
+
+
+def build_options(args: argparse.Namespace) -> Dict[str, object]:
+    """The page options shared by a single build, ``--batch`` and ``--watch``/``--serve``."""
+    return {
+        "responsive_images": args.responsive_images,
+        "lazy_panels": args.lazy_panels,
+        "offline_assets": args.offline_assets,
+        "search": args.search,
+        "news_limit": args.news_limit or None,
+        "optimize": args.optimize,
+        "service_worker": args.service_worker,
+        "external_structured_data": args.external_structured_data,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    options = build_options(args)
+    if args.watch or args.serve:
+        run_dev(args.output, watch=args.watch, serve=args.serve, host=args.host, port=args.port, **options)
+        return
+    if args.batch:
+        changed = build_batch(args.batch, jobs=args.jobs, check=args.check, **options)
+        if args.check and changed:
+            print("Out of date:")
+            for name in changed:
+                print(f"  {name}")
+            raise SystemExit(1)
+        return
+    with BuildProfiler() if args.profile else nullcontext() as profiler:
+        changed = write_index_html(
+            args.output, use_cache=not args.no_cache, check=args.check, profiler=profiler, **options
+        )
+    if profiler is not None:
+        print(profiler.report())
+        profiler.save(Path(args.profile))
+    if args.check_links:
+        report, broken = check_links(Path(args.output))
+        print(report)
+        if broken:
+            raise SystemExit(1)
+    if args.budget:
+        report, exceeded = check_page_weight(Path(args.output), Path(args.budget))
+        print(report)
+        if exceeded:
+            raise SystemExit(1)
+    if args.check and changed:
+        print("Out of date:")
+        for name in changed:
+            print(f"  {name}")
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
-    write_index_html("index.html")
+    main()
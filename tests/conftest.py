@@ -0,0 +1,21 @@
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import build  # noqa: E402
+
+REPO = Path(build.__file__).resolve().parent
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    """A copy of the site, configured as the one this process builds."""
+    root = tmp_path / "site"
+    shutil.copytree(REPO, root, ignore=shutil.ignore_patterns(".*", "tests", "__pycache__"))
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    build.configure_site(root)
+    yield root
+    build.configure_site(REPO)
@@ -0,0 +1,25 @@
+import json
+import re
+import shutil
+
+import build
+
+
+def test_shared_cards_highlight_each_site_owner(site, tmp_path):
+    batch = tmp_path / "batch"
+    owners = {"panfilov": "Alexander Panfilov", "andriushchenko": "Maksym Andriushchenko"}
+    for name, owner in owners.items():
+        root = batch / name
+        shutil.copytree(site, root)
+        profile = json.loads((root / build.PROFILE_FILE).read_text(encoding="utf-8"))
+        profile["person"]["highlight_name"] = owner
+        (root / build.PROFILE_FILE).write_text(json.dumps(profile), encoding="utf-8")
+    build.build_batch(batch, jobs=2)
+    for name, owner in owners.items():
+        html = (batch / name / "index.html").read_text(encoding="utf-8")
+        highlighted = re.findall(r'<span class="author-self">([^<]*)</span>', html)
+        assert highlighted and {name.rstrip("*") for name in highlighted} == {owner}
+    # Each paper was parsed and rendered once for both sites.
+    assert len(build.load_batch_entries(batch / ".build_cache" / "bib_entries.pickle")) == len(
+        build.split_bib_entries((site / "publication_list.bib").read_text(encoding="utf-8"))
+    )
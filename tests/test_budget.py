@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+import build
+
+
+class OfflineChecker:
+    """Leaves third-party sizes unknown instead of sending HEAD requests."""
+
+    def check(self, urls):
+        return {}
+
+
+@pytest.fixture
+def page(site, monkeypatch):
+    monkeypatch.setattr(build, "LinkChecker", OfflineChecker)
+    return site / "index.html"
+
+
+def set_budgets(site, budgets):
+    profile = json.loads((site / build.PROFILE_FILE).read_text(encoding="utf-8"))
+    profile["budgets"] = budgets
+    (site / build.PROFILE_FILE).write_text(json.dumps(profile), encoding="utf-8")
+    build.configure_site(site)
+
+
+def test_within_budget_passes_and_keeps_a_report(site, page, tmp_path):
+    report = tmp_path / "page-weight.json"
+    build.main(["--output", str(page), "--no-cache", "--budget", str(report)])
+    data = json.loads(report.read_text(encoding="utf-8"))
+    assert data["exceeded"] == []
+    assert data["categories"]["html"]["bytes"] > 0
+
+
+def test_over_budget_exits_with_an_error(site, page, tmp_path, capsys):
+    set_budgets(site, {"html_kb": 1, "duplicate_scripts": 0})
+    report = tmp_path / "page-weight.json"
+    with pytest.raises(SystemExit) as raised:
+        build.main(["--output", str(page), "--no-cache", "--budget", str(report)])
+    assert raised.value.code == 1
+    assert "over budget: html" in capsys.readouterr().out
+    assert [line.split()[0] for line in json.loads(report.read_text(encoding="utf-8"))["exceeded"]] == ["html"]
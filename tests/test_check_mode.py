@@ -0,0 +1,50 @@
+import build
+
+
+def test_check_manifest_matches_the_written_files(site, monkeypatch):
+    manifests = []
+    collect_manifest = build.collect_manifest
+    monkeypatch.setattr(build, "collect_manifest", lambda *args: manifests.append(collect_manifest(*args)) or manifests[-1])
+    page = str(site / "index.html")
+    changed = build.write_index_html(page, use_cache=False, optimize=True, check=True)
+    assert not (site / "assets" / "dist").exists()
+    build.write_index_html(page, use_cache=False, optimize=True)
+    pending, written = manifests
+    # Binary assets are hashed as the bytes that get written, like the files on disk.
+    assert any(key.endswith(".png") for key in written if key.startswith("assets/dist/"))
+    assert {key: digest for key, digest in pending.items() if key in changed} == {
+        key: digest for key, digest in written.items() if key in changed
+    }
+    assert build.write_index_html(page, use_cache=False, optimize=True, check=True) == []
+
+
+def test_compressed_panel_shards_survive_a_rebuild(site):
+    page = str(site / "index.html")
+    build.write_index_html(page, use_cache=False, optimize=True, lazy_panels=True)
+    assert list((site / "assets" / "panels").glob("*.json.gz"))
+    assert build.write_index_html(page, use_cache=False, optimize=True, lazy_panels=True, check=True) == []
+
+
+def test_committed_slide_previews_are_reused(site, monkeypatch):
+    slides = site / "assets" / "img" / "slides"
+    previews = sorted(path.name for path in slides.glob("*.jpg"))
+    assert previews
+    page = site / "index.html"
+    # A fresh clone has no slide cache, but the committed previews are already named by content.
+    with monkeypatch.context() as patch:
+        patch.setattr(build, "slide_renderer", lambda: None)
+        build.write_index_html(str(page), use_cache=False)
+    html = page.read_text(encoding="utf-8")
+    assert sorted(path.name for path in slides.glob("*.jpg")) == previews
+    assert all(name in html for name in previews)
+    thumbnails = build.PageContext(None).slides
+    assert (thumbnails.generated, thumbnails.reused) == (0, len(previews))
+    assert build.write_index_html(str(page), use_cache=False, check=True) == []
+
+
+def test_compressed_structured_data_survives_a_rebuild(site):
+    page = str(site / "index.html")
+    options = {"optimize": True, "external_structured_data": True, "lazy_panels": True}
+    build.write_index_html(page, use_cache=False, **options)
+    assert list(build.STRUCTURED_DATA_DIR.glob("*.gz"))
+    assert build.write_index_html(page, use_cache=False, check=True, **options) == []
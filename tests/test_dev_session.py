@@ -0,0 +1,33 @@
+import importlib.util
+import re
+
+import pytest
+
+import build
+
+
+def srcset_files(html, stem):
+    urls = (url for srcset in re.findall(r'srcset="([^"]+)"', html) for url in re.findall(r"(\S+) \d+w", srcset))
+    return sorted({url for url in urls if f"/{stem}-" in url})
+
+
+@pytest.mark.skipif(importlib.util.find_spec("PIL") is None, reason="needs Pillow")
+def test_edited_thumbnail_updates_the_srcset(site):
+    from PIL import Image
+
+    page = site / "index.html"
+    session = build.DevSession(page, responsive_images=True)
+    pub = next(pub for pub in session.ctx.publications if pub.img)
+    image = site / pub.img
+    stem = image.stem
+    before = srcset_files(page.read_text(encoding="utf-8"), stem)
+    assert before
+
+    with Image.open(image) as original:
+        rotated = original.rotate(90, expand=True)
+    rotated.save(image)
+    assert session.update([image]) == "reload"
+
+    after = srcset_files(page.read_text(encoding="utf-8"), stem)
+    assert after and not set(after) & set(before)
+    assert all((site / url).exists() for url in after)
@@ -0,0 +1,53 @@
+import build
+
+
+def test_highlights_conferences_and_orals():
+    text = 'Oral at ICML 2024, iclr and <span class="highlight highlight-conference">NeurIPS</span>; not ICMLx.'
+    assert build.highlight_text(text) == (
+        '<strong>Oral</strong> at <span class="highlight highlight-conference">ICML 2024</span>, '
+        '<span class="highlight highlight-conference">iclr</span> and '
+        '<span class="highlight highlight-conference">NeurIPS</span>; not ICMLx.'
+    )
+
+
+def test_case_sensitive_rules_and_longest_term():
+    highlighter = build.Highlighter([
+        {"terms": ["Best Paper"], "tag": "em", "ignore_case": False},
+        {"terms": ["best paper award"], "tag": "strong"},
+    ])
+    assert highlighter.highlight("Best Paper, best paper, Best Paper Award") == (
+        "<em>Best Paper</em>, best paper, <strong>Best Paper Award</strong>"
+    )
+
+
+class CountingPattern:
+    """Stands in for a compiled pattern and counts the passes made over the text."""
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.scans = 0
+
+    def search(self, text):
+        self.scans += 1
+        return self.pattern.search(text)
+
+    def sub(self, replace, text):
+        self.scans += 1
+        return self.pattern.sub(replace, text)
+
+
+def test_rules_share_one_pattern_and_one_scan():
+    terms = [f"venue{index:04d}" for index in range(2500)]
+    text = " ".join(f"word {terms[index * 37 % 2500]} at venue{index}x" for index in range(2000))
+    one_rule = build.Highlighter([{"terms": terms, "tag": "span"}])
+    many_rules = build.Highlighter(
+        [{"terms": terms[index : index + 5], "tag": "span", "class": f"r{index}"} for index in range(0, 2500, 5)]
+    )
+    # One trie for all 500 rules: a single capturing group, like a single rule with every term.
+    assert many_rules.pattern.groups == one_rule.pattern.groups == 1
+    counts = []
+    for highlighter in (one_rule, many_rules):
+        highlighter.pattern = CountingPattern(highlighter.pattern)
+        assert highlighter.highlight(text).count("<span") == 2000
+        counts.append(highlighter.pattern.scans)
+    assert counts == [2, 2]
@@ -0,0 +1,56 @@
+import os
+import subprocess
+from datetime import datetime, timezone
+
+import build
+
+COMMITTED = 1_600_000_000
+EDITED = 1_700_000_000
+
+
+def git(repo, *args):
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_DATE": f"@{COMMITTED}",
+        "GIT_COMMITTER_DATE": f"@{COMMITTED}",
+        "GIT_AUTHOR_NAME": "test",
+        "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "test",
+        "GIT_COMMITTER_EMAIL": "test@example.com",
+    }
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True, env=env)
+
+
+def site_in_subdirectory(tmp_path, monkeypatch, names):
+    # The site lives below the repository root, so porcelain paths differ from ROOT-relative ones.
+    site = tmp_path / "site"
+    site.mkdir()
+    for name in names:
+        (site / name).write_text("{}\n", encoding="utf-8")
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-q", "-m", "inputs")
+    monkeypatch.setattr(build, "ROOT", site)
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    return site
+
+
+def test_committed_inputs_use_the_commit_time(tmp_path, monkeypatch):
+    site_in_subdirectory(tmp_path, monkeypatch, ["news.json"])
+    assert build.last_updated(["news.json"]) == datetime.fromtimestamp(COMMITTED, timezone.utc)
+
+
+def test_edited_input_with_a_quoted_name(tmp_path, monkeypatch):
+    site = site_in_subdirectory(tmp_path, monkeypatch, ["news.json", "nëws list.json"])
+    (site / "nëws list.json").write_text("[]\n", encoding="utf-8")
+    os.utime(site / "nëws list.json", (EDITED, EDITED))
+    updated = build.last_updated(["news.json", "nëws list.json"])
+    assert updated == datetime.fromtimestamp(EDITED, timezone.utc)
+
+
+def test_renamed_input(tmp_path, monkeypatch):
+    site = site_in_subdirectory(tmp_path, monkeypatch, ["old.json"])
+    git(tmp_path, "mv", "site/old.json", "site/news.json")
+    os.utime(site / "news.json", (EDITED, EDITED))
+    assert build.git_dirty_paths("news.json", "old.json") == [(site / "news.json").resolve()]
+    assert build.last_updated(["news.json", "old.json"]) == datetime.fromtimestamp(EDITED, timezone.utc)
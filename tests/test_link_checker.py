@@ -0,0 +1,114 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import build
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def respond(self, status, headers=(), body=b"", chunked=False):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Transfer-Encoding" if chunked else "Content-Length", "chunked" if chunked else str(len(body)))
+        self.end_headers()
+        if self.command == "HEAD":
+            return
+        if chunked:
+            self.wfile.write(b"%x\r\n%s\r\n0\r\n\r\n" % (len(body), body))
+        else:
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.server.requests.append((self.command, self.path))
+        if self.path == "/ok":
+            self.respond(200, body=b"ok")
+        elif self.path == "/moved":
+            self.respond(301, [("Location", "/ok")])
+        elif self.path in ("/no-head", "/no-head-chunked") and self.command == "HEAD":
+            self.respond(405)
+        elif self.path == "/no-head":
+            self.respond(200, body=b"fine")
+        elif self.path == "/no-head-chunked":
+            self.respond(200, body=b"streamed", chunked=True)
+        elif self.path == "/early-hints":
+            self.wfile.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+            self.wfile.write(b"HTTP/1.1 103 Early Hints\r\nLink: </style.css>; rel=preload; as=style\r\n\r\n")
+            self.respond(200, body=b"hinted")
+        else:
+            self.respond(404, body=b"not found")
+
+    do_GET = do_HEAD
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.daemon_threads = True
+    httpd.connections = 0
+    httpd.requests = []
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def url(server, path):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_redirects_statuses_and_get_fallback(server, tmp_path):
+    urls = [url(server, path) for path in ("/ok", "/moved", "/missing", "/no-head", "/no-head-chunked")]
+    results = build.LinkChecker(tmp_path / "links.json", per_host=1).check(urls)
+    assert [results[link]["status"] for link in urls] == [200, 200, 404, 200, 200]
+    assert results[urls[1]]["url"] == urls[0]
+    assert [build.link_state(results[link]) for link in urls] == ["ok", "ok", "broken", "ok", "ok"]
+    assert ("GET", "/no-head") in server.requests and ("GET", "/no-head-chunked") in server.requests
+
+
+def test_interim_responses_are_skipped(server, tmp_path):
+    urls = [url(server, "/early-hints"), url(server, "/ok")]
+    checker = build.LinkChecker(tmp_path / "links.json", concurrency=1, per_host=1)
+    results = checker.check(urls)
+    assert [results[link]["status"] for link in urls] == [200, 200]
+    # The final response was read in full, so the connection stays usable.
+    assert server.connections == 1
+
+
+def test_connections_are_pooled_per_host(server, tmp_path):
+    urls = [url(server, path) for path in ("/ok", "/moved", "/missing", "/no-head")]
+    checker = build.LinkChecker(tmp_path / "links.json", per_host=1)
+    checker.check(urls)
+    # Six requests (the redirect, HEAD then GET) over one keep-alive connection.
+    assert len(server.requests) == 6
+    assert server.connections == 1
+    assert sum(pool.opened for pool in checker.pools.values()) == 1
+
+
+def test_chunked_body_is_not_read_and_the_connection_dropped(server, tmp_path):
+    urls = [url(server, "/no-head-chunked"), url(server, "/ok")]
+    checker = build.LinkChecker(tmp_path / "links.json", concurrency=1, per_host=1)
+    results = checker.check(urls)
+    assert [results[link]["status"] for link in urls] == [200, 200]
+    assert server.connections == 2
+
+
+def test_second_run_is_served_from_the_cache(server, tmp_path):
+    urls = [url(server, path) for path in ("/ok", "/moved", "/no-head")]
+    build.LinkChecker(tmp_path / "links.json").check(urls)
+    requests = len(server.requests)
+    checker = build.LinkChecker(tmp_path / "links.json")
+    results = checker.check(urls)
+    assert checker.cached == len(urls)
+    assert len(server.requests) == requests
+    assert [results[link]["status"] for link in urls] == [200, 200, 200]
@@ -0,0 +1,63 @@
+import json
+import re
+import xml.etree.ElementTree as ET
+
+import build
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+DATES = ["2023-03-01", "2024-06-15", "2022-11-20", "2024-01-05", "2023-09-30", "2022-02-14"]
+
+
+def site_with_news(site, **options):
+    news = [{"date": date, "text": f"Item <em>{date}</em> &amp; more."} for date in DATES]
+    (site / "news.json").write_text(json.dumps(news), encoding="utf-8")
+    build.write_index_html(str(site / "index.html"), use_cache=False, **options)
+    return (site / "index.html").read_text(encoding="utf-8")
+
+
+def marked_dates(html):
+    return re.findall(r"Item <em>(\d{4}-\d\d-\d\d)</em>", html)
+
+
+def test_archive_pages_split_by_year_newest_first(site):
+    site_with_news(site, news_limit=2)
+    pages = sorted(path.name for path in (site / "news").glob("*.html"))
+    assert pages == ["2022.html", "2023.html", "2024.html"]
+    for year in ("2022", "2023", "2024"):
+        dates = marked_dates((site / "news" / f"{year}.html").read_text(encoding="utf-8"))
+        assert dates == sorted((date for date in DATES if date.startswith(year)), reverse=True)
+
+
+def test_older_news_links_the_year_of_the_first_cut_item(site):
+    html = site_with_news(site, news_limit=3)
+    assert marked_dates(html) == ["2024-06-15", "2024-01-05", "2023-09-30"]
+    assert '<a href="news/2023.html">Older news</a>' in html
+    html = site_with_news(site, news_limit=2)
+    assert '<a href="news/2023.html">Older news</a>' in html
+    html = site_with_news(site, news_limit=1)
+    assert '<a href="news/2024.html">Older news</a>' in html
+
+
+def test_no_older_news_link_when_every_item_is_shown(site):
+    html = site_with_news(site, news_limit=None)
+    assert len(marked_dates(html)) == len(DATES)
+    assert "Older news" not in html
+    assert '<a href="feed.xml">Atom feed</a>' in html
+
+
+def test_feed_is_atom_newest_first(site):
+    site_with_news(site, news_limit=2)
+    feed = ET.parse(site / "feed.xml").getroot()
+    assert feed.tag == f"{ATOM}feed"
+    for name in ("title", "id", "updated", "author"):
+        assert feed.find(f"{ATOM}{name}") is not None
+    assert feed.find(f"{ATOM}updated").text == "2024-06-15T00:00:00Z"
+    entries = feed.findall(f"{ATOM}entry")
+    updated = [entry.find(f"{ATOM}updated").text for entry in entries]
+    assert updated == [f"{date}T00:00:00Z" for date in sorted(DATES, reverse=True)]
+    ids = [entry.find(f"{ATOM}id").text for entry in entries]
+    assert len(set(ids)) == len(ids) and all(entry_id.startswith("tag:") for entry_id in ids)
+    for entry, date in zip(entries, sorted(DATES, reverse=True)):
+        assert entry.find(f"{ATOM}title").text == f"Item {date} & more."
+        assert entry.find(f"{ATOM}link").get("href").endswith(f"news/{date[:4]}.html")
+        assert f"<em>{date}</em>" in entry.find(f"{ATOM}content").text
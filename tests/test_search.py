@@ -0,0 +1,61 @@
+import json
+import re
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+import build
+
+QUERY = """
+const vm = require('vm');
+const [script, index, query, papers, news] = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const element = () => ({hidden: false, textContent: '', listeners: {}, addEventListener(type, f) { this.listeners[type] = f; }});
+const cards = Array.from({length: papers}, element);
+const items = Array.from({length: news}, element);
+const nodes = {'site-search': element(), 'site-search-status': element(), 'search-index': {textContent: index}};
+const document = {
+    getElementById: (id) => nodes[id],
+    querySelectorAll: (selector) => (selector === '.publication-card' ? cards : items),
+};
+vm.runInNewContext(script, {document});
+nodes['site-search'].value = query;
+nodes['site-search'].listeners.input();
+console.log(JSON.stringify([...cards, ...items].map((doc) => !doc.hidden)));
+"""
+
+
+def publication(title, year):
+    return build.Publication(
+        title.lower(), "inproceedings", title, "ICML", None, year, None, None, None, {}, [build.Author("Ada", "Lovelace")], ""
+    )
+
+
+def test_build_compiles_without_warnings():
+    source = build.__file__
+    subprocess.run(
+        [sys.executable, "-W", "error", "-c", "import sys; compile(open(sys.argv[1]).read(), sys.argv[1], 'exec')", source],
+        check=True,
+    )
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+@pytest.mark.parametrize(
+    "query, visible",
+    [
+        ("the", [True, True, True]),
+        ("a", [True, True, True]),
+        ("the diffusion", [True, False, False]),
+        ("Diffúsion 2024", [True, False, False]),
+        ("news", [False, False, True]),
+    ],
+)
+def test_query_filters_like_the_index(query, visible):
+    pubs = [publication("The Diffusion Model", "2024"), publication("A Theory of Everything", "2023")]
+    news = [{"date": "2022-01-01", "text": "Some news on the theory."}]
+    index, _ = build.build_search_index(pubs, news)
+    script = re.search(r"<script>(.*)</script>", build.get_template("search_script").render(index=index), re.DOTALL)
+    stdin = json.dumps([script.group(1), index.replace("<\\/", "</"), query, len(pubs), len(news)])
+    result = subprocess.run(["node", "-e", QUERY], input=stdin, capture_output=True, text=True, check=True)
+    assert json.loads(result.stdout) == visible
@@ -0,0 +1,134 @@
+import importlib.util
+import json
+import re
+import shutil
+import subprocess
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import build
+
+# Runs sw.js in a vm with an in-memory CacheStorage (persisted to a JSON file between runs) against
+# a local server: install, activate, then one fetch of each path given, reporting what hit the network.
+HARNESS = """
+const fs = require('fs');
+const vm = require('vm');
+const [base, swPath, stateFile, ...paths] = process.argv.slice(1);
+const saved = fs.existsSync(stateFile) ? JSON.parse(fs.readFileSync(stateFile, 'utf8')) : {};
+const store = new Map(Object.entries(saved).map(([name, entries]) => [name, new Map(Object.entries(entries))]));
+class MemoryCache {
+    constructor(entries) { this.entries = entries; }
+    key(request) { return new URL(typeof request === 'string' ? request : request.url, base).href.slice(base.length); }
+    async match(request) {
+        const entry = this.entries.get(this.key(request));
+        return entry && new Response(Buffer.from(entry.body, 'base64'), {headers: entry.headers});
+    }
+    async put(request, response) {
+        const body = Buffer.from(await response.arrayBuffer()).toString('base64');
+        this.entries.set(this.key(request), {body, headers: Object.fromEntries(response.headers)});
+    }
+}
+const caches = {
+    keys: async () => [...store.keys()],
+    open: async (name) => new MemoryCache(store.get(name) || store.set(name, new Map()).get(name)),
+    delete: async (name) => store.delete(name),
+};
+let network = [];
+const fetchFromNetwork = (request, init) => {
+    const url = new URL(typeof request === 'string' ? request : request.url, base).href;
+    network.push(url.slice(base.length).split('?')[0]);
+    return fetch(url, init);
+};
+const listeners = {};
+const self = {
+    location: new URL('sw.js', base),
+    addEventListener: (type, listener) => { listeners[type] = listener; },
+    clients: {claim: async () => {}},
+};
+vm.runInNewContext(fs.readFileSync(swPath, 'utf8'), {self, caches, fetch: fetchFromNetwork, Response, URL, console});
+async function dispatch(type, fields = {}) {
+    const waits = [];
+    let response;
+    listeners[type]({...fields, waitUntil: (promise) => waits.push(promise), respondWith: (promise) => { response = promise; }});
+    const result = await response;
+    await Promise.all(waits);
+    return result;
+}
+(async () => {
+    await dispatch('install');
+    await dispatch('activate');
+    const report = {install: network.sort(), caches: [...store.keys()], fetches: {}};
+    for (const path of paths) {
+        network = [];
+        const response = await dispatch('fetch', {request: {url: base + path, method: 'GET', mode: 'no-cors'}});
+        report.fetches[path] = {status: response.status, network: network.length};
+    }
+    const state = {};
+    for (const [name, entries] of store) state[name] = Object.fromEntries(entries);
+    report.cached = [...store.values()].flatMap((entries) => [...entries.keys()]);
+    fs.writeFileSync(stateFile, JSON.stringify(state));
+    console.log(JSON.stringify(report));
+})().catch((error) => { console.error(error); process.exit(1); });
+"""
+
+
+def build_page(site, **options):
+    build.write_index_html(str(site / "index.html"), use_cache=False, service_worker=True, **options)
+    return json.loads((site / build.PRECACHE_MANIFEST_FILE).read_text(encoding="utf-8"))["entries"]
+
+
+@pytest.mark.skipif(importlib.util.find_spec("PIL") is None, reason="needs Pillow")
+def test_precache_holds_what_the_page_renders_with(site):
+    entries = build_page(site, responsive_images=True)
+    html = (site / "index.html").read_text(encoding="utf-8")
+    pictures = len(re.findall(r"<picture>", html))
+    assert pictures
+    assert len([key for key in entries if key.startswith("assets/img/responsive/")]) == pictures
+    assert "index.html" in entries and "assets/styles.css" in entries
+    assert not [key for key in entries if key.endswith((".pdf", ".xml")) or key.startswith("news/")]
+    # The originals behind each <picture> are fallbacks, fetched only without srcset support.
+    assert not [key for key in entries if key.startswith("assets/img/publications/")]
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(site):
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=str(site)))
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def run_worker(site, base, state, *paths):
+    command = ["node", "-e", HARNESS, base, str(site / build.SERVICE_WORKER_FILE), str(state), *paths]
+    return json.loads(subprocess.run(command, capture_output=True, text=True, check=True).stdout)
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+def test_install_then_update_fetches_only_changed_entries(site, server, tmp_path):
+    state = tmp_path / "caches.json"
+    entries = build_page(site)
+    first = run_worker(site, server, state, "assets/styles.css", "assets/pdf/cv.pdf")
+    assert first["install"] == sorted([build.PRECACHE_MANIFEST_FILE, *entries])
+    assert first["fetches"]["assets/styles.css"] == {"status": 200, "network": 0}
+    # Not precached: fetched, then kept in the runtime cache and revalidated on later requests.
+    assert "assets/pdf/cv.pdf" not in entries
+    assert first["fetches"]["assets/pdf/cv.pdf"] == {"status": 200, "network": 1}
+    assert "assets/pdf/cv.pdf" in first["cached"]
+
+    stylesheet = site / build.STYLESHEET
+    stylesheet.write_text(stylesheet.read_text(encoding="utf-8") + "\n.updated { color: red; }\n", encoding="utf-8")
+    build_page(site)
+    second = run_worker(site, server, state, "assets/styles.css")
+    assert second["install"] == ["assets/styles.css", build.PRECACHE_MANIFEST_FILE]
+    assert len(second["caches"]) == 1 and second["caches"] != first["caches"]
+    assert second["fetches"]["assets/styles.css"] == {"status": 200, "network": 0}
@@ -0,0 +1,26 @@
+import json
+
+import build
+
+
+def test_index_links_match_the_document_ids():
+    graph = build.build_structured_data_graph(build.load_publications())
+    person = json.loads(graph["inline"])
+    index_name = graph["href"].rsplit("/", 1)[1]
+    index = json.loads(graph["documents"][index_name])
+    documents = [json.loads(text) for name, text in graph["documents"].items() if name != index_name]
+    assert index["@id"] == person["@id"]
+    assert [link["@id"] for link in index["publication"]] == [document["@id"] for document in documents]
+    for name, document in zip((name for name in graph["documents"] if name != index_name), documents):
+        assert document["@id"] == f"{build.SITE_URL}{build.manifest_key(build.STRUCTURED_DATA_DIR / name)}"
+
+
+def test_site_owner_authorship_references_the_person():
+    graph = build.build_structured_data_graph(build.load_publications())
+    person_id = json.loads(graph["inline"])["@id"]
+    for name, text in graph["documents"].items():
+        if name.startswith("publications."):
+            continue
+        authors = json.loads(text)["author"]
+        assert {"@id": person_id} in authors
+        assert not any(build.PERSON["highlight_name"] in author.get("name", "") for author in authors)